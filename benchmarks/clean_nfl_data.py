@@ -0,0 +1,84 @@
+"""
+Benchmark of clean_nfl_data against the per-column replace it replaced
+
+Builds a play-by-play shaped frame of synthetic data, many object columns
+with scattered 'NA' strings plus name and col_team columns, and times both
+implementations on copies of it. Run from the repository root:
+
+    python benchmarks/clean_nfl_data.py --rows 200000 --columns 60
+"""
+import argparse
+import time
+
+import numpy
+import pandas
+
+import nfl_data_py as nfl
+from nfl_data_py import cleaning
+
+
+def frame(rows, columns, seed=0):
+    """Synthetic frame with object, categorical and numeric columns"""
+
+    rng = numpy.random.default_rng(seed)
+    words = numpy.array(['KC', 'BUF', 'pass', 'run', 'left', 'right', 'NA'], dtype=object)
+    names = numpy.array(list(cleaning.NAMES) + ['Patrick Mahomes', 'NA'] * 20, dtype=object)
+    teams = list(cleaning.COLLEGE_TEAMS) + ['Alabama', 'Georgia', 'NA']
+
+    data = {f'text_{i}': words[rng.integers(0, len(words), rows)] for i in range(columns)}
+    for i in range(columns):
+        data[f'num_{i}'] = rng.random(rows)
+    data['name'] = names[rng.integers(0, len(names), rows)]
+    data['col_team'] = pandas.Categorical(rng.choice(teams, rows))
+
+    return pandas.DataFrame(data)
+
+
+def legacy(df):
+    """clean_nfl_data before the replacement tables were compiled"""
+
+    for col in df.columns:
+        if df[col].dtype == 'object':
+            df.replace({col: {'NA': numpy.nan}}, inplace=True)
+
+    if 'name' in df.columns:
+        df.replace({'name': cleaning.NAMES}, inplace=True)
+
+    if 'col_team' in df.columns:
+        df.replace({'col_team': cleaning.COLLEGE_TEAMS}, inplace=True)
+
+    return df
+
+
+def timed(func, df, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        data = df.copy()
+        start = time.perf_counter()
+        result = func(data)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--columns', type=int, default=60, help='object columns')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    df = frame(args.rows, args.columns)
+    print(f'{len(df):,} rows, {df.shape[1]} columns')
+
+    old, expected = timed(legacy, df, args.repeat)
+    new, result = timed(nfl.clean_nfl_data, df, args.repeat)
+    pandas.testing.assert_frame_equal(result, expected)
+
+    print(f'per-column replace  {old:8.3f}s')
+    print(f'compiled tables     {new:8.3f}s')
+    print(f'speedup             {old / new:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+"""
+Offline benchmarks of the nfl_data_py import functions
+
+Synthetic nflverse-shaped files (see nfl_data_py/tests/synthetic.py) are served from a local HTTP
+server that stands in for every upstream host through a source mirror, so no
+network access is needed. Every import function is timed in three modes:
+
+    serial     thread_requests=False, download cache off
+    threaded   thread_requests=True, download cache off
+    cached     thread_requests=True, files already in the download cache
+
+Each measurement runs in a fresh interpreter, so peak RSS covers that call
+alone. Run from the repository root:
+
+    python benchmarks/run.py --years 2021 2022 2023
+    python benchmarks/run.py --output base.json
+    python benchmarks/run.py --compare base.json --tolerance 0.25
+
+--compare exits with status 1 when a function got slower, or its peak RSS grew
+more during the call, than the baseline by more than the tolerance.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+import contextlib
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+MODES = ('serial', 'threaded', 'cached')
+MB = 1024 ** 2
+
+# import function -> (call taking years and thread_requests, accepts thread_requests)
+CASES = {
+    'import_pbp_data': ('nfl.import_pbp_data(years, thread_requests=threaded)', True),
+    'import_weekly_data': ('nfl.import_weekly_data(years, thread_requests=threaded)', True),
+    'import_seasonal_data': ('nfl.import_seasonal_data(years, thread_requests=threaded)', True),
+    'import_seasonal_rosters': ('nfl.import_seasonal_rosters(years, thread_requests=threaded)', True),
+    'import_weekly_rosters': ('nfl.import_weekly_rosters(years, thread_requests=threaded)', True),
+    'import_depth_charts': ('nfl.import_depth_charts(years, thread_requests=threaded)', True),
+    'import_injuries': ('nfl.import_injuries(years, thread_requests=threaded)', True),
+    'import_snap_counts': ('nfl.import_snap_counts(years, thread_requests=threaded)', True),
+    'import_ftn_data': (
+        'nfl.import_ftn_data([y for y in years if y >= 2022] or [2022], thread_requests=threaded)', True
+    ),
+    'import_schedules': ('nfl.import_schedules(years)', False),
+    'import_players': ('nfl.import_players()', False),
+    'import_ids': ('nfl.import_ids()', False),
+    'import_ngs_data': ('nfl.import_ngs_data("passing", years)', False),
+    'import_qbr': ('nfl.import_qbr([y for y in years if y >= 2006] or [2006])', False),
+    'import_seasonal_pfr': (
+        'nfl.import_seasonal_pfr("pass", [y for y in years if y >= 2018] or [2018])', False
+    ),
+    'import_weekly_pfr': (
+        'nfl.import_weekly_pfr("pass", [y for y in years if y >= 2018] or [2018], '
+        'thread_requests=threaded)', True
+    ),
+    'import_officials': ('nfl.import_officials(years)', False),
+    'import_draft_picks': ('nfl.import_draft_picks(years)', False),
+    'import_draft_values': ('nfl.import_draft_values()', False),
+    'import_combine_data': ('nfl.import_combine_data(years)', False),
+    'import_contracts': ('nfl.import_contracts()', False),
+    'import_team_desc': ('nfl.import_team_desc()', False),
+    'import_sc_lines': ('nfl.import_sc_lines(years)', False),
+    'import_win_totals': ('nfl.import_win_totals(years)', False),
+}
+
+
+def measure(function, mode, years, mirror, cache_dir):
+    """Times one call in this process, run by the parent in a child interpreter
+
+    Returns:
+        Dict of seconds, peak_mb, base_mb and rows
+    """
+
+    import nfl_data_py as nfl
+
+    nfl.configure_sources(mirror=mirror)
+    nfl.configure_cache(enabled=mode == 'cached', path=cache_dir)
+    call = CASES[function][0]
+    scope = {'nfl': nfl, 'years': years, 'threaded': mode != 'serial'}
+
+    base = __peak_mb()
+    start = time.perf_counter()
+    # keep stdout for the result
+    with contextlib.redirect_stdout(sys.stderr):
+        result = eval(call, scope)
+    seconds = time.perf_counter() - start
+
+    return {'seconds': seconds, 'peak_mb': __peak_mb(), 'base_mb': base, 'rows': len(result)}
+
+
+def run_case(function, mode, years, server, cache_dir):
+    """Runs one function in one mode in a child interpreter
+
+    Returns:
+        Dict of the measurement plus the MB served to the timed call
+    """
+
+    if mode == 'cached':
+        # fill the cache in a separate process so the timed one starts cold
+        __child(function, 'cached', years, server.url, cache_dir)
+
+    server.reset()
+    result = __child(function, mode, years, server.url, cache_dir)
+    result['served_mb'] = server.bytes_sent / MB
+    return result
+
+
+def run(functions, modes, years, root, scale=1.0, latency=0.0, echo=print):
+    """Benchmarks every function in every mode
+
+    Returns:
+        List of result dicts with function, mode, seconds, peak_mb, base_mb,
+        rows, served_mb and mb_per_s
+    """
+
+    from nfl_data_py.tests.synthetic import write_fixtures
+    from server import FixtureServer
+
+    echo(f'writing fixtures to {root}')
+    write_fixtures(root, years, scale)
+
+    results = []
+    with FixtureServer(root, latency) as server:
+        for function in functions:
+            source_mb = None
+            for mode in modes:
+                if mode == 'threaded' and not CASES[function][1]:
+                    continue
+                cache_dir = tempfile.mkdtemp(prefix='nfl-bench-')
+                try:
+                    result = run_case(function, mode, years, server, cache_dir)
+                finally:
+                    shutil.rmtree(cache_dir, ignore_errors=True)
+
+                # MB of source files the call reads, whether served or cached
+                if source_mb is None or result['served_mb'] > source_mb:
+                    source_mb = result['served_mb']
+                result.update(function=function, mode=mode)
+                result['source_mb'] = source_mb
+                result['mb_per_s'] = source_mb / result['seconds'] if result['seconds'] else None
+                results.append(result)
+                echo(__format(result))
+
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Regressions of results against a baseline run
+
+    Memory is compared as the growth of peak RSS during the call, peak_mb -
+    base_mb, so the interpreter and imports do not hide a regression.
+
+    Returns:
+        List of messages, one per function and mode that got slower or
+        grew more than the baseline by more than tolerance
+    """
+
+    base = {(r['function'], r['mode']): r for r in baseline}
+    problems = []
+    for r in results:
+        old = base.get((r['function'], r['mode']))
+        if old is None:
+            continue
+        measures = (
+            ('time', old['seconds'], r['seconds']),
+            ('peak RSS growth', __growth_mb(old), __growth_mb(r)),
+        )
+        for label, before, after in measures:
+            if before and after is not None and after > before * (1 + tolerance):
+                problems.append(f'{r["function"]} {r["mode"]}: {label} {before:.2f} -> {after:.2f}')
+    return problems
+
+
+def __child(function, mode, years, mirror, cache_dir):
+    cmd = [
+        sys.executable, os.path.abspath(__file__), '--child', function, mode,
+        mirror, cache_dir, '--years', *map(str, years),
+    ]
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f'{function} {mode} failed:\n{proc.stderr}')
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def __growth_mb(result):
+    if result.get('peak_mb') is None or result.get('base_mb') is None:
+        return None
+    return result['peak_mb'] - result['base_mb']
+
+
+def __peak_mb():
+    if resource is None:
+        return None
+    # ru_maxrss is in kilobytes on Linux, bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (MB if sys.platform == 'darwin' else 1024)
+
+
+def __format(r):
+    rate = f'{r["mb_per_s"]:8.1f} MB/s' if r['mb_per_s'] is not None else ' ' * 13
+    peak = f'{r["peak_mb"]:7.0f} MB peak' if r['peak_mb'] is not None else ''
+    return (
+        f'{r["function"]:<24} {r["mode"]:<9} {r["seconds"]:8.2f}s {rate} '
+        f'{r["rows"]:>9,} rows {peak}'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--years', nargs='+', type=int, default=[2021, 2022, 2023])
+    parser.add_argument('--functions', nargs='+', choices=sorted(CASES), default=list(CASES))
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=list(MODES))
+    parser.add_argument('--scale', type=float, default=1.0, help='rows relative to nflverse')
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds per request')
+    parser.add_argument('--fixtures', help='directory for the synthetic files, reused between runs')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--compare', help='JSON results of an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    parser.add_argument('--child', nargs=4, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        function, mode, mirror, cache_dir = args.child
+        print(json.dumps(measure(function, mode, args.years, mirror, cache_dir)))
+        return 0
+
+    root = args.fixtures or os.path.join(tempfile.gettempdir(), 'nfl-data-py-bench')
+    results = run(args.functions, args.modes, args.years, root, args.scale, args.latency)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=1)
+
+    if args.compare:
+        with open(args.compare) as f:
+            problems = compare(results, json.load(f), args.tolerance)
+        for problem in problems:
+            print(f'regression: {problem}', file=sys.stderr)
+        return 1 if problems else 0
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    sys.exit(main())
@@ -0,0 +1,68 @@
+"""
+Local HTTP server standing in for the nflverse hosts in the benchmarks
+"""
+import time
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+
+class FixtureServer:
+    """Serves a directory over HTTP on a free local port
+
+    Attributes:
+        url (str): base URL of the served directory
+        bytes_sent (int): body bytes served since the last reset()
+        requests (int): requests handled since the last reset()
+    """
+
+    def __init__(self, root, latency=0.0):
+        """
+        Args:
+            root (str): directory to serve
+            latency (float): seconds each request waits before responding,
+                to mimic the round trip to a remote host
+        """
+
+        self.bytes_sent = 0
+        self.requests = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(SimpleHTTPRequestHandler):
+            def do_GET(self):
+                if latency:
+                    time.sleep(latency)
+                with server._lock:
+                    server.requests += 1
+                super().do_GET()
+
+            def copyfile(self, source, outputfile):
+                while True:
+                    chunk = source.read(1024 * 1024)
+                    if not chunk:
+                        break
+                    outputfile.write(chunk)
+                    with server._lock:
+                        server.bytes_sent += len(chunk)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), partial(Handler, directory=root))
+        self._httpd.daemon_threads = True
+        self.url = f'http://127.0.0.1:{self._httpd.server_port}/'
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def reset(self):
+        with self._lock:
+            self.bytes_sent = 0
+            self.requests = 0
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -1,15 +1,49 @@
 import os
+import time
 import logging
-import datetime
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from warnings import warn
 from typing import Iterable
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import numpy
 import pandas
-import appdirs
 from urllib.error import HTTPError
 
+from nfl_data_py.cache import (
+    fetch, pin, leased,
+    configure_cache as configure_cache,
+    clear_cache as clear_cache,
+    cache_info as cache_info,
+    prune_cache as prune_cache,
+    verify_cache as verify_cache,
+)
+from nfl_data_py.parallel import map_ordered, FetchError, Prefetcher
+from nfl_data_py.sources import (
+    url as source_url,
+    configure_sources as configure_sources,
+    sources_info as sources_info,
+)
+from nfl_data_py.mirror import sync_mirror as sync_mirror
+from nfl_data_py.transport import (
+    configure_transport as configure_transport,
+    transport_info as transport_info,
+)
+from nfl_data_py.events import (
+    add_event_hook as add_event_hook,
+    remove_event_hook as remove_event_hook,
+    collect_events as collect_events,
+)
+from nfl_data_py import pbp_cache, backends, seasonal, schedule, player_ids, cleaning, events
+from nfl_data_py.memo import (
+    memoize,
+    enable_memory_cache as enable_memory_cache,
+    disable_memory_cache as disable_memory_cache,
+    clear_memory_cache as clear_memory_cache,
+    memory_cache_info as memory_cache_info,
+)
+
 name = 'nfl_data_py'
 __version__ = '0.3.3'
 __doc__ = """
@@ -23,6 +57,7 @@ tables to assist with the merging of datasets from various sources.
 Functions
 ---------
 import_pbp_data() - import play-by-play data
+iter_pbp_data() - iterate over play-by-play data one season or chunk at a time
 import_weekly_data() - import weekly player stats
 import_seasonal_data() - import seasonal player stats
 import_snap_counts() - import weekly snap count stats
@@ -38,6 +73,7 @@ import_players() - import descriptive data for all players
 import_depth_charts() - import team depth charts
 import_injuries() - import team injury reports
 import_ids() - import mapping of player ids for more major sites
+import_id_index() - import a lookup index translating player ids between sites
 import_contracts() - import contract data
 import_win_totals() - import win total lines for teams
 import_sc_lines() - import weekly betting lines for teams
@@ -49,9 +85,191 @@ see_pbp_cols() - return list of play-by-play columns
 see_weekly_cols() - return list of weekly stat columns
 import_team_desc() - import descriptive data for team viz
 cache_pbp() - save pbp files locally to allow for faster loading
+configure_cache() - set location, size budget and TTLs of the download cache
+cache_info() - describe files held in the download cache
+clear_cache() - remove files from the download cache
+prune_cache() - shrink the download cache by age or size
+verify_cache() - check cached files for corruption
+configure_sources() - read files from a local directory or internal mirror
+sync_mirror() - download files into a local mirror
+configure_transport() - record responses to a fixture store or replay them offline
+add_event_hook() - receive timing and size events for every file a loader reads
+collect_events() - collect the events emitted within a with block
+enable_memory_cache() - reuse loaded frames within this process
+memory_cache_info() - hit/miss counters and size of the memory cache
 clean_nfl_data() - clean df by aligning common name diffs
 """
 
+
+def __parquet_columns(source):
+    """Lists the columns stored in a parquet file without decoding any data"""
+
+    try:
+        import pyarrow.parquet as pq
+        names = pq.read_schema(source).names
+    except ImportError:
+        import fastparquet
+        names = fastparquet.ParquetFile(source).columns
+
+    if hasattr(source, 'seek'):
+        source.seek(0)
+
+    return names
+
+
+def __project(source, columns):
+    """Narrows columns to those stored in source, None to read everything"""
+
+    if not columns:
+        return None
+
+    available = set(__parquet_columns(source))
+    return [c for c in dict.fromkeys(columns) if c in available]
+
+
+def __decode_parquet(source, columns=None, filters=None, backend='pandas', **kwargs):
+    """Decodes a parquet file, skipping row groups that cannot match filters
+
+    Columns the filters refer to are read as well. The engine only prunes row
+    groups, so callers apply the exact filters with __apply_filters.
+    """
+
+    if columns and filters:
+        columns = columns + __filter_columns(filters)
+
+    columns = __project(source, columns)
+
+    # lazy plans open the file when collected, after it may have been evicted
+    if backend == 'polars':
+        source = pin(source)
+
+    # filters naming columns this file does not store (e.g. participation
+    # fields in a pbp file) can only be applied after the frame is built.
+    # Lazy plans get them as a predicate, which polars pushes into the scan
+    if filters and backend != 'polars' and \
+            set(__filter_columns(filters)) <= set(__parquet_columns(source)):
+        kwargs['filters'] = filters
+
+    return backends.read_parquet(source, backend, columns, **kwargs)
+
+
+def __read_parquet(url, dataset, columns=None, filters=None, backend='pandas', **kwargs):
+    """Reads a parquet file through the download cache
+
+    Only the requested columns are decoded. Names the file does not store are
+    skipped, callers select their final columns from the result.
+    """
+    with leased():
+        source = fetch(url, dataset)
+        with events.timed('decode', url=url, dataset=dataset) as event:
+            df = __decode_parquet(source, columns, filters, backend, **kwargs)
+            df = __apply_filters(df, filters, columns)
+            event['rows'] = backends.num_rows(df)
+    return df
+
+
+FILTER_OPS = {
+    '==': lambda s, v: s == v,
+    '=': lambda s, v: s == v,
+    '!=': lambda s, v: s != v,
+    '<': lambda s, v: s < v,
+    '<=': lambda s, v: s <= v,
+    '>': lambda s, v: s > v,
+    '>=': lambda s, v: s >= v,
+    'in': lambda s, v: s.isin(v),
+    'not in': lambda s, v: ~s.isin(v),
+}
+
+
+def __validate_filters(filters):
+    """Normalizes filters to a list of AND-ed predicate lists that are OR-ed
+
+    Accepts the pyarrow/fastparquet form: a list of (column, op, value)
+    tuples, or a list of such lists.
+    """
+
+    if filters is None:
+        return None
+
+    if not isinstance(filters, list) or len(filters) == 0:
+        raise ValueError('filters must be a non-empty list.')
+
+    groups = filters if isinstance(filters[0], list) else [filters]
+
+    for group in groups:
+        if not isinstance(group, list) or len(group) == 0:
+            raise ValueError('filters must be a list of tuples or a list of lists of tuples.')
+        for pred in group:
+            if not isinstance(pred, tuple) or len(pred) != 3:
+                raise ValueError('each filter must be a (column, op, value) tuple.')
+            if pred[1] not in FILTER_OPS:
+                raise ValueError(f'filter op must be one of {", ".join(FILTER_OPS)}.')
+            if pred[1] in ('in', 'not in') and isinstance(pred[2], str):
+                raise ValueError(f'{pred[1]} filters need a list of values.')
+
+    return groups
+
+
+def __filter_columns(filters):
+    return list(dict.fromkeys(col for group in filters for col, _, _ in group))
+
+
+def __apply_filters(df, filters, columns=None):
+    """Keeps the rows of df matching filters, dropping filter-only columns"""
+
+    if not filters:
+        return df
+
+    if backends.is_lazy(df):
+        df = df.filter(backends.predicate(filters))
+    else:
+        df = backends.take(df, __filter_mask(df, filters))
+
+    if columns:
+        extra = [c for c in __filter_columns(filters) if c not in columns]
+        df = backends.drop(df, extra)
+
+    return df
+
+
+def __filter_mask(df, filters):
+    mask = numpy.zeros(len(df), dtype=bool)
+    for group in filters:
+        keep = numpy.ones(len(df), dtype=bool)
+        for col, op, value in group:
+            keep &= FILTER_OPS[op](backends.column(df, col), value).to_numpy(dtype=bool)
+        mask |= keep
+
+    return mask
+
+
+def __prune_years(years, filters):
+    """Drops years whose files cannot hold rows matching the season filters"""
+
+    if not filters:
+        return list(years)
+
+    def possible(year):
+        return any(
+            all(FILTER_OPS[op](pandas.Series([year]), value).iloc[0]
+                for col, op, value in group if col == 'season')
+            for group in filters
+        )
+
+    return [year for year in years if possible(year)]
+
+
+def __read_csv(url, dataset, **kwargs):
+    """Reads a csv file through the download cache"""
+    with leased():
+        source = fetch(url, dataset)
+        with events.timed('decode', url=url, dataset=dataset) as event:
+            df = pandas.read_csv(source, **kwargs)
+            event['rows'] = len(df)
+    return df
+
+
+@memoize
 def import_pbp_data(
         years, 
         columns=None, 
@@ -59,7 +277,10 @@ def import_pbp_data(
         downcast=True, 
         cache=False, 
         alt_path=None,
-        thread_requests=False
+        thread_requests=True,
+        filters=None,
+        backend='pandas',
+        compact=False
     ):
     """Imports play-by-play data
     
@@ -70,8 +291,85 @@ def import_pbp_data(
         downcast (bool): convert float64 to float32, default True
         cache (bool): whether to use local cache as source of pbp data
         alt_path (str): path for cache if not nfl_data_py default
+        thread_requests (bool): use thread pool to read files, default True
+            (False before 0.3.4)
+        filters (List): only return rows matching these (column, op, value)
+            predicates, a list of lists is OR-ed, e.g. [('week', '==', 1)]
+        backend (str): 'pandas' for a DataFrame, 'arrow' for a pyarrow.Table,
+            'polars' for a polars.LazyFrame over the parquet files
+        compact (bool): store repetitive string columns as categoricals and
+            integers in their smallest width, default False
     Returns:
-        DataFrame
+        DataFrame, pyarrow.Table or polars.LazyFrame depending on backend
+    """
+    
+    backends.validate(backend)
+    if compact and backend == 'polars':
+        raise ValueError("compact is not supported with backend='polars'.")
+
+    years, columns, cached, filters = __pbp_options(
+        years, columns, include_participation, cache, alt_path, filters, downcast
+    )
+
+    # participation files download alongside the pbp files, so each season
+    # is merged and downcast as soon as both of its files have arrived
+    partic_years = years if include_participation and not cached else []
+
+    loaded_bytes = []
+
+    def load(year, partic):
+        raw = __load_pbp_season(
+            year, columns, partic if partic_years else None, downcast, cached,
+            filters, backend
+        )
+        # encode each season as it arrives so the uncompacted seasons
+        # never have to be held together
+        if compact:
+            loaded_bytes.append(backends.memory_bytes(raw))
+            raw = backends.encode_repetitive(raw)
+        return raw
+
+    # files stay leased until every season is merged, prefetched ones included
+    with leased(), Prefetcher(__fetch_participation, partic_years, thread_requests) as partic:
+        try:
+            pbp_data = map_ordered(lambda year: load(year, partic), years, thread_requests)
+        except FetchError as e:
+            for year, exc in e.failures.items():
+                events.emit('error', dataset='pbp', year=year, error=str(exc))
+            pbp_data = [raw for _, raw in e.results]
+    
+    if not pbp_data:
+        return backends.empty(backend)
+
+    if compact:
+        pbp_data = backends.align_categories(pbp_data)
+    
+    with events.timed('merge', dataset='pbp') as event:
+        plays = backends.concat(pbp_data, backend, ignore_index=True)
+        event['rows'] = backends.num_rows(plays)
+    
+    # a column can still be float64 if its dtype differed between seasons
+    if downcast:
+        with events.timed('downcast', dataset='pbp') as event:
+            plays = backends.downcast_floats(plays)
+            event['rows'] = backends.num_rows(plays)
+
+    if compact:
+        plays = backends.unify_dictionaries(backends.downcast_ints(plays))
+        before, after = sum(loaded_bytes), backends.memory_bytes(plays)
+        events.emit('compact', dataset='pbp', before=before, after=after)
+            
+    return plays
+
+
+def __pbp_options(
+        years, columns, include_participation, cache, alt_path, filters=None, downcast=None
+    ):
+    """Validates pbp inputs
+
+    Returns:
+        (years left after season filters, columns to read,
+        year -> local pbp cache file or None, normalized filters)
     """
     
     # check variable types
@@ -85,109 +383,209 @@ def import_pbp_data(
         columns = []
 
     columns = [x for x in columns if x not in ['season']]
+
+    # season filters prune whole files (and cache partitions) before any read
+    filters = __validate_filters(filters)
+    years = __prune_years(years, filters)
     
     if all([include_participation, len(columns) != 0]):
-        columns = columns + [x for x in ['play_id','old_game_id'] if x not in columns]
+        columns = columns + [x for x in ['play_id','game_id','old_game_id'] if x not in columns]
        
-    # potential sources for pbp data
-    url1 = r'https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_'
-    url2 = r'.parquet'
-    appname = 'nfl_data_py'
-    appauthor = 'cooper_dff'
-    pbp_data = []
+    cached = None
     
     if cache:
-        if not alt_path:
-            dpath = os.path.join(appdirs.user_cache_dir(appname, appauthor), 'pbp')
-        else:
-            dpath = alt_path
-
-    if thread_requests and not cache:
-        with ThreadPoolExecutor() as executor:
-            # Create a list of the same size as years, initialized with None
-            pbp_data = [None]*len(years)
-            # Create a mapping of futures to their corresponding index in the pbp_data
-            futures_map = {
-                executor.submit(
-                    pandas.read_parquet,
-                    path=url1 + str(year) + url2,
-                    columns=columns if columns else None, 
-                    engine='auto'
-                ): idx 
-                for idx, year in enumerate(years)
-            }
-            for future in as_completed(futures_map):
-                pbp_data[futures_map[future]] = future.result()
-    else:
-        # read in pbp data
-        for year in years:
-            if cache:
-                seasonStr = f'season={year}'
-                if not os.path.isdir(os.path.join(dpath, seasonStr)):
-                    raise ValueError(f'{year} cache file does not exist.')
-                for fname in filter(lambda x: seasonStr in x, os.listdir(dpath)):
-                    folder = os.path.join(dpath, fname)
-                    for file in os.listdir(folder):
-                        if file.endswith(".parquet"):
-                            fpath = os.path.join(folder, file)
-                
-            # define path based on cache and alt_path variables
-                path = fpath
-            else:
-                path = url1 + str(year) + url2
-
-            # load data
-            try:
-                data = pandas.read_parquet(path, columns=columns if columns else None, engine='auto')
-
-                raw = pandas.DataFrame(data)
-                raw['season'] = year
-                
-
-                if include_participation and not cache:
-                    path = r'https://github.com/nflverse/nflverse-data/releases/download/pbp_participation/pbp_participation_{}.parquet'.format(year)
-
-                    try:
-                        partic = pandas.read_parquet(path)
-                        raw = raw.merge(
-                            partic,
-                            how='left',
-                            left_on=['play_id','game_id'],
-                            right_on=['play_id','nflverse_game_id']
-                        )
-                    except HTTPError:
-                        pass
-                
-                pbp_data.append(raw)
-                print(str(year) + ' done.')
-
-            except Exception as e:
-                print(e)
-                print('Data not available for ' + str(year))
-    
-    if not pbp_data:
-        return pandas.DataFrame()
+        # resolved from the cache manifest, so missing or stale seasons, and
+        # downcast seasons read as float64, fail here before any parquet file
+        # is opened. Columns a season lacks are skipped like in downloads
+        cached = pbp_cache.locate(alt_path or pbp_cache.default_dir(), years, downcast)
+
+    return years, columns, cached, filters
+
+
+def iter_pbp_data(
+        years,
+        columns=None,
+        include_participation=True,
+        downcast=True,
+        cache=False,
+        alt_path=None,
+        chunksize=None,
+        prefetch=1,
+        filters=None,
+        backend='pandas'
+    ):
+    """Yields play-by-play data one season, or chunksize rows, at a time
     
-    plays = pandas.concat(pbp_data, ignore_index=True)
+    Each season is merged with participation data and downcast exactly like
+    import_pbp_data, but only the season being consumed and the next
+    prefetch seasons are held in memory.
     
-    # converts float64 to float32, saves ~30% memory
-    if downcast:
-        print('Downcasting floats.')
-        cols = plays.select_dtypes(include=[numpy.float64]).columns
-        plays[cols] = plays[cols].astype(numpy.float32)
-            
-    return plays
+    Args:
+        years (List[int]): years to get PBP data for
+        columns (List[str]): only return these columns
+        include_participation (bool): whether to include participation stats or not
+        downcast (bool): convert float64 to float32, default True
+        cache (bool): whether to use local cache as source of pbp data
+        alt_path (str): path for cache if not nfl_data_py default
+        chunksize (int): yield frames of this many rows instead of whole seasons
+        prefetch (int): number of seasons loaded in the background, default 1
+        filters (List): only yield rows matching these (column, op, value) predicates
+        backend (str): 'pandas' for DataFrames, 'arrow' for pyarrow.Tables
+    Yields:
+        DataFrame, or pyarrow.Table with backend='arrow'
+    """
+
+    if chunksize is not None and chunksize < 1:
+        raise ValueError('chunksize must be a positive integer.')
+
+    if prefetch < 0:
+        raise ValueError('prefetch must be non-negative.')
+
+    backends.validate(backend, backends.EAGER)
+    years, columns, cached, filters = __pbp_options(
+        years, columns, include_participation, cache, alt_path, filters, downcast
+    )
+    include_participation = include_participation and not cached
+
+    def load(year):
+        partic_years = [year] if include_participation else []
+        with leased(), Prefetcher(__fetch_participation, partic_years) as partic:
+            return __load_pbp_season(
+                year, columns, partic if partic_years else None, downcast, cached,
+                filters, backend
+            )
+
+    def seasons():
+        if not prefetch:
+            for year in years:
+                yield year, lambda year=year: load(year)
+            return
+
+        # keep at most prefetch seasons loading ahead of the one being consumed
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+        pending = deque()
+        try:
+            for year in years:
+                pending.append((year, executor.submit(contextvars.copy_context().run, load, year)))
+                if len(pending) > prefetch:
+                    done_year, future = pending.popleft()
+                    yield done_year, future.result
+            while pending:
+                done_year, future = pending.popleft()
+                yield done_year, future.result
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    leftover = None
+    for year, result in seasons():
+        try:
+            season = result()
+        except Exception as e:
+            events.emit('error', dataset='pbp', year=year, error=str(e))
+            continue
+
+        if chunksize is None:
+            yield season
+            continue
+
+        if leftover is not None:
+            season = backends.concat([leftover, season], backend, ignore_index=True)
+
+        end = len(season) - len(season) % chunksize
+        for start in range(0, end, chunksize):
+            yield backends.slice_rows(season, start, start + chunksize)
+
+        leftover = backends.slice_rows(season, end, len(season)) if end < len(season) else None
+        del season
+
+    if leftover is not None:
+        yield leftover
+
+
+def __fetch_participation(year):
+    """Downloads one season of participation data, None if it is not published"""
+
+    try:
+        return fetch(source_url('pbp_participation', year=year), 'pbp_participation')
+    except HTTPError:
+        return None
+
+
+def __load_pbp_season(
+        year, columns, participation=None, downcast=True, cached=None, filters=None,
+        backend='pandas'
+    ):
+    """Loads one season of pbp data, from the local pbp cache if cached is given
 
+    Args:
+        participation (Prefetcher): participation files to merge, by year
+        cached (Dict[int, str]): local pbp cache file of each year
+        filters (List[List[tuple]]): normalized row filters
+    """
+
+    if cached:
+        url = path = cached[year]
+    else:
+        url = source_url('pbp', year=year)
+        path = fetch(url, 'pbp')
+
+    # columns may name participation fields, which are read from the second file
+    with events.timed('decode', url=url, dataset='pbp', year=year) as event:
+        raw = __decode_parquet(path, columns, filters, backend, downcast=downcast)
+        raw = backends.set_constant(raw, 'season', year)
+        event['rows'] = backends.num_rows(raw)
+
+    partic = participation.result(year) if participation else None
+
+    if partic is not None:
+        partic_cols = None
+        if columns:
+            partic_cols = columns + ['play_id', 'nflverse_game_id']
+            partic_cols += __filter_columns(filters) if filters else []
+        partic_url = source_url('pbp_participation', year=year)
+        with events.timed('decode', url=partic_url, dataset='pbp_participation', year=year) as event:
+            partic = backends.read_parquet(
+                pin(partic) if backend == 'polars' else partic, backend,
+                __project(partic, partic_cols), downcast=downcast
+            )
+            event['rows'] = backends.num_rows(partic)
+        with events.timed('merge', dataset='pbp', year=year) as event:
+            raw = backends.left_merge(
+                raw, partic, left_on=['play_id','game_id'], right_on=['play_id','nflverse_game_id']
+            )
+            event['rows'] = backends.num_rows(raw)
+
+    raw = __apply_filters(raw, filters, columns + ['season'] if columns else None)
+
+    # both files were downcast while decoding, only columns the merge turned
+    # into float64 (e.g. integers of unmatched plays) are left to convert
+    if downcast and partic is not None:
+        with events.timed('downcast', dataset='pbp', year=year) as event:
+            raw = backends.downcast_floats(raw)
+            event['rows'] = backends.num_rows(raw)
 
-def cache_pbp(years, downcast=True, alt_path=None):
+    events.emit('done', dataset='pbp', year=year, rows=backends.num_rows(raw))
+
+    return raw
+
+
+def cache_pbp(years, downcast=True, alt_path=None, thread_requests=True):
     """Cache pbp data in local location to allow for faster loading
 
+    Seasons are downloaded concurrently and each one is swapped into the
+    cache atomically. Seasons whose upstream files did not change since they
+    were cached are skipped.
+
     Args:
         years (List[int]): years to cache PBP data for
         downcast (bool): convert float64 to float32, default True
         alt_path (str): path for cache if not nfl_data_py default
+        thread_requests (bool): use thread pool to read files, default True
     Returns:
-        DataFrame
+        DataFrame with the year, status ('cached', 'up to date' or 'failed'),
+        bytes written, seconds and error of every season
     """
 
     if not isinstance(years, (list, range)):
@@ -196,68 +594,98 @@ def cache_pbp(years, downcast=True, alt_path=None):
     if min(years) < 1999:
         raise ValueError('Data not available before 1999.')
 
-    url1 = r'https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_'
-    url2 = r'.parquet'
-    appname = 'nfl_data_py'
-    appauthor = 'nflverse'
-
     # define path for caching
     if alt_path is not None:
         path = str(alt_path)
     else:
-        path = os.path.join(appdirs.user_cache_dir(appname, appauthor), 'pbp')
+        path = pbp_cache.default_dir()
 
     # check if drectory exists already
     if not os.path.isdir(path):
         os.makedirs(path)
 
-    # delete seasons to be replaced
-    for folder in [os.path.join(path, x) for x in os.listdir(path) for y in years if ('season='+str(y)) in x]:
-        for file in os.listdir(folder):
-            if file.endswith(".parquet"):
-                os.remove(os.path.join(folder, file))
+    def timed(year):
+        start = time.time()
+        status, size = __cache_pbp_season(path, year, downcast)
+        return year, status, size, time.time() - start, None
+
+    try:
+        rows = map_ordered(timed, years, thread_requests)
+    except FetchError as e:
+        done = dict(e.results)
+        failed = {year: (year, 'failed', 0, None, str(exc)) for year, exc in e.failures.items()}
+        rows = [done[year] if year in done else failed[year] for year in years]
+        for year, exc in e.failures.items():
+            warn(
+                f"Caching failed for {year}, skipping.\n"
+                "In nfl_data_py 1.0, this will raise an exception.\n"
+                f"Failure: {exc}",
+                DeprecationWarning,
+                stacklevel=2
+            )
 
-    # read in pbp data
-    for year in years:
+    return pandas.DataFrame(rows, columns=['year', 'status', 'bytes', 'seconds', 'error'])
 
-        try:
 
-            data = pandas.read_parquet(url1 + str(year) + url2, engine='auto')
+def __cache_pbp_season(path, year, downcast):
+    """Caches one season of pbp data unless it is already current
 
-            raw = pandas.DataFrame(data)
-            raw['season'] = year
+    Returns:
+        Tuple of the status, 'cached' or 'up to date', and bytes written
+    """
 
-            if year >= 2016:
-                path2 = r'https://github.com/nflverse/nflverse-data/releases/download/pbp_participation/pbp_participation_{}.parquet'.format(year)
-                part = pandas.read_parquet(path2)
-                raw = raw.merge(part, how='left', on=['play_id','old_game_id'])
+    pbp_url = source_url('pbp', year=year)
+    partic_url = source_url('pbp_participation', year=year)
 
-            if downcast:
-                cols = raw.select_dtypes(include=[numpy.float64]).columns
-                raw[cols] = raw[cols].astype(numpy.float32)
+    version = {
+        'pbp': pbp_cache.upstream_version(pbp_url),
+        'participation': pbp_cache.upstream_version(partic_url) if year >= 2016 else 'missing',
+        'downcast': downcast,
+    }
 
-            # write parquet to path, partitioned by season
-            raw.to_parquet(path, partition_cols='season')
+    if pbp_cache.is_current(path, year, version):
+        events.emit('done', dataset='pbp_cache', year=year, status='up to date')
+        return 'up to date', 0
 
-            print(str(year) + ' done.')
+    # upstream changed, so copies in the download cache may be outdated
+    with leased():
+        source = fetch(pbp_url, 'pbp', revalidate=True)
+        with events.timed('decode', url=pbp_url, dataset='pbp', year=year) as event:
+            raw = __decode_parquet(source, downcast=downcast)
+            raw['season'] = year
+            event['rows'] = len(raw)
 
-        except Exception as e:
-            warn(
-                f"Caching failed for {year}, skipping.\n"
-                "In nfl_data_py 1.0, this will raise an exception.\n"
-                f"Failure: {e}",
-                DeprecationWarning,
-                stacklevel=2
-            )
+    if version['participation'] != 'missing':
+        with leased():
+            source = fetch(partic_url, 'pbp_participation', revalidate=True)
+            with events.timed(
+                'decode', url=partic_url, dataset='pbp_participation', year=year
+            ) as event:
+                part = __decode_parquet(source, downcast=downcast)
+                event['rows'] = len(part)
+        with events.timed('merge', dataset='pbp', year=year) as event:
+            raw = raw.merge(part, how='left', on=['play_id','old_game_id'])
+            event['rows'] = len(raw)
 
-            next
-            
+        if downcast:
+            with events.timed('downcast', dataset='pbp', year=year) as event:
+                raw = backends.downcast_floats(raw)
+                event['rows'] = len(raw)
+
+    written = pbp_cache.write_season(path, year, raw, version)
+
+    events.emit('done', dataset='pbp_cache', year=year, rows=len(raw))
+    return 'cached', written['size']
 
+
+@memoize
 def import_weekly_data(
         years, 
         columns=None, 
         downcast=True,
-        thread_requests=False
+        thread_requests=True,
+        filters=None,
+        backend='pandas'
     ):
     """Imports weekly player data
     
@@ -265,8 +693,13 @@ def import_weekly_data(
         years (List[int]): years to get weekly data for
         columns (List[str]): only return these columns
         downcast (bool): convert float64 to float32, default True
+        thread_requests (bool): use thread pool to read files, default True
+            (False before 0.3.4)
+        filters (List): only return rows matching these (column, op, value) predicates
+        backend (str): 'pandas' for a DataFrame, 'arrow' for a pyarrow.Table,
+            'polars' for a polars.LazyFrame over the parquet files
     Returns:
-        DataFrame
+        DataFrame, pyarrow.Table or polars.LazyFrame depending on backend
     """
     
     # check variable types
@@ -279,47 +712,47 @@ def import_weekly_data(
     if not columns:
         columns = []
 
-    url = r'https://github.com/nflverse/nflverse-data/releases/download/player_stats/player_stats_{0}.parquet'
-
-    if thread_requests:
-        with ThreadPoolExecutor() as executor:
-            # Create a list of the same size as years, initialized with None
-            data = [None]*len(years)
-            # Create a mapping of futures to their corresponding index in the data
-            futures_map = {
-                executor.submit(
-                    pandas.read_parquet,
-                    path=url.format(year),
-                    columns=columns if columns else None,
-                    engine='auto'
-                ): idx
-                for idx, year in enumerate(years)
-            }
-            for future in as_completed(futures_map):
-                data[futures_map[future]] = future.result()
-            data = pandas.concat(data)
-    else:
-        # read weekly data
-        data = pandas.concat([pandas.read_parquet(url.format(x), engine='auto') for x in years])        
+    backends.validate(backend)
+    filters = __validate_filters(filters)
+    years = __prune_years(years, filters)
+    if not years:
+        return backends.empty(backend, columns)
+
+    # read weekly data
+    data = backends.concat(map_ordered(
+        lambda x: __read_parquet(
+            source_url('player_stats', year=x), 'player_stats', columns, filters, backend,
+            downcast=downcast
+        ),
+        years,
+        thread_requests
+    ), backend)
 
     if columns:
-        data = data[columns]
+        data = backends.select(data, columns)
 
-    # converts float64 to float32, saves ~30% memory
+    # floats were converted to float32 while decoding, saves ~30% memory,
+    # this only catches columns whose type differed between seasons
     if downcast:
-        print('Downcasting floats.')
-        cols = data.select_dtypes(include=[numpy.float64]).columns
-        data[cols] = data[cols].astype(numpy.float32)
+        with events.timed('downcast', dataset='player_stats') as event:
+            data = backends.downcast_floats(data)
+            event['rows'] = backends.num_rows(data)
 
     return data
 
 
-def import_seasonal_data(years, s_type='REG'):
+@memoize(bypass=('state',))
+def import_seasonal_data(years, s_type='REG', thread_requests=True, weekly=None, state=None):
     """Imports seasonal player data
     
     Args:
         years (List[int]): years to get seasonal data for
         s_type (str): season type to include in average ('ALL','REG','POST')
+        thread_requests (bool): use thread pool to read files, default True
+        weekly (DataFrame): already loaded weekly data to aggregate instead
+            of downloading it, e.g. from import_weekly_data
+        state (str): directory of saved seasonal sums, only games not yet
+            in it are aggregated and added before the result is built
     Returns:
         DataFrame
     """
@@ -335,55 +768,31 @@ def import_seasonal_data(years, s_type='REG'):
         raise ValueError('Only REG, ALL, POST allowed for s_type.')
     
     # import weekly data
-    url = r'https://github.com/nflverse/nflverse-data/releases/download/player_stats/player_stats_{0}.parquet'
-    data = pandas.concat([pandas.read_parquet(url.format(x), engine='auto') for x in years])
+    if weekly is None:
+        data = pandas.concat(map_ordered(
+            lambda x: __read_parquet(source_url('player_stats', year=x), 'player_stats'),
+            years,
+            thread_requests
+        ))
+    else:
+        data = weekly[weekly['season'].isin(years)]
+
+    if state is not None:
+        aggregates = seasonal.SeasonalAggregates.load(state)
+        aggregates.update(data)
+        aggregates.save(state)
+        return aggregates.result(years, s_type)
     
     # filter to appropriate season_type
     if s_type != 'ALL':
         data = data[(data['season_type'] == s_type)]
 
-    # calc per game stats
-    pgstats = data[['recent_team', 'season', 'week', 'attempts', 'completions', 'passing_yards', 'passing_tds',
-                      'passing_air_yards', 'passing_yards_after_catch', 'passing_first_downs',
-                      'fantasy_points_ppr']].groupby(
-        ['recent_team', 'season', 'week']).sum().reset_index()
-    pgstats.columns = ['recent_team', 'season', 'week', 'atts', 'comps', 'p_yds', 'p_tds', 'p_ayds', 'p_yac', 'p_fds',
-                       'ppr_pts']
-    all_stats = data[
-        ['player_id', 'player_name', 'recent_team', 'season', 'week', 'carries', 'rushing_yards', 'rushing_tds',
-         'rushing_first_downs', 'rushing_2pt_conversions', 'receptions', 'targets', 'receiving_yards', 'receiving_tds',
-         'receiving_air_yards', 'receiving_yards_after_catch', 'receiving_first_downs', 'receiving_epa',
-         'fantasy_points_ppr']].merge(pgstats, how='left', on=['recent_team', 'season', 'week']).fillna(0)
-    season_stats = all_stats.drop(['recent_team', 'week'], axis=1).groupby(
-        ['player_id', 'season']).sum(numeric_only=True).reset_index()
-
-    # calc custom receiving stats
-    season_stats['tgt_sh'] = season_stats['targets'] / season_stats['atts']
-    season_stats['ay_sh'] = season_stats['receiving_air_yards'] / season_stats['p_ayds']
-    season_stats['yac_sh'] = season_stats['receiving_yards_after_catch'] / season_stats['p_yac']
-    season_stats['wopr'] = season_stats['tgt_sh'] * 1.5 + season_stats['ay_sh'] * 0.8
-    season_stats['ry_sh'] = season_stats['receiving_yards'] / season_stats['p_yds']
-    season_stats['rtd_sh'] = season_stats['receiving_tds'] / season_stats['p_tds']
-    season_stats['rfd_sh'] = season_stats['receiving_first_downs'] / season_stats['p_fds']
-    season_stats['rtdfd_sh'] = (season_stats['receiving_tds'] + season_stats['receiving_first_downs']) / (
-                season_stats['p_tds'] + season_stats['p_fds'])
-    season_stats['dom'] = (season_stats['ry_sh'] + season_stats['rtd_sh']) / 2
-    season_stats['w8dom'] = season_stats['ry_sh'] * 0.8 + season_stats['rtd_sh'] * 0.2
-    season_stats['yptmpa'] = season_stats['receiving_yards'] / season_stats['atts']
-    season_stats['ppr_sh'] = season_stats['fantasy_points_ppr'] / season_stats['ppr_pts']
-
-    data.drop(['recent_team', 'week'], axis=1, inplace=True)
-    szn = data.groupby(['player_id', 'season', 'season_type']).sum(numeric_only=True).reset_index().merge(
-        data[['player_id', 'season', 'season_type']].groupby(['player_id', 'season']).count().reset_index().rename(
-            columns={'season_type': 'games'}), how='left', on=['player_id', 'season'])
-
-    szn = szn.merge(season_stats[['player_id', 'season', 'tgt_sh', 'ay_sh', 'yac_sh', 'wopr', 'ry_sh', 'rtd_sh',
-                                  'rfd_sh', 'rtdfd_sh', 'dom', 'w8dom', 'yptmpa', 'ppr_sh']], how='left',
-                    on=['player_id', 'season'])
-
-    return szn
+    # per player sums and the team totals of their games in one pass, then
+    # the share metrics (tgt_sh, wopr, dom, ...) over each season
+    return seasonal.finalize(seasonal.aggregate(data))
 
 
+@memoize
 def see_pbp_cols():
     """Identifies list of columns in pbp data
     
@@ -392,12 +801,13 @@ def see_pbp_cols():
     """
     
     # load pbp file, identify columns
-    data = pandas.read_parquet(r'https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_2020.parquet', engine='auto')
+    data = __read_parquet(source_url('pbp', year=2020), 'pbp')
     cols = data.columns
 
     return cols
 
 
+@memoize
 def see_weekly_cols():
     """Identifies list of columns in weekly data
     
@@ -406,18 +816,30 @@ def see_weekly_cols():
     """
     
     # load weekly file, identify columns
-    data = pandas.read_parquet(r'https://github.com/nflverse/nflverse-data/releases/download/player_stats/player_stats_2020.parquet', engine='auto')
+    data = __read_parquet(source_url('player_stats', year=2020), 'player_stats')
     cols = data.columns
 
     return cols
 
 
-def __import_rosters(release, years, columns=None):
+def __validate_columns(columns):
+    if columns is not None and not (
+        isinstance(columns, list) and
+        all(isinstance(x, str) for x in columns) and
+        len(columns) > 0
+    ):
+        raise ValueError('columns input must be a list of strings.')
+
+
+def __import_rosters(release, years, columns=None, thread_requests=True, required=()):
     """Imports roster data
     
     Args:
         years (List[int]): years to get rosters for
         columns (List[str]): list of columns to return with DataFrame
+        thread_requests (bool): use thread pool to read files, default True
+        required (List[str]): source columns read in addition to columns, so
+            they can be used before the caller selects its columns
         
     Returns:
         DataFrame
@@ -433,108 +855,115 @@ def __import_rosters(release, years, columns=None):
     if release not in ('seasonal', 'weekly'):
         raise ValueError("release input must be 'seasonal' or 'weekly'.")
     
-    if columns is not None and not (
-        isinstance(columns, list) and
-        all(isinstance(x, str) for x in columns) and
-        len(columns) > 0
-    ):
-        raise ValueError('columns input must be a list of strings.')
+    __validate_columns(columns)
+
+    # Pick the relevant dataset for the release type
+    dataset = "rosters" if release == "seasonal" else "weekly_rosters"
 
-    # Build the relevant URI for the release type
-    uri = "https://github.com/nflverse/nflverse-data/releases/download/"
-    if release == "seasonal":
-        uri += "rosters/roster_{0}.parquet"
-    elif release == "weekly":
-        uri += "weekly_rosters/roster_weekly_{0}.parquet"
+    renames = {'gsis_id': 'player_id', 'full_name': 'player_name'}
+    sources = {new: old for old, new in renames.items()}
+    read = [sources.get(c, c) for c in columns] + list(required) if columns else None
 
     # imports rosters for specified years
-    rosters = pandas.concat([
-        pandas.read_parquet(uri.format(y))
-        for y in years
-    ], ignore_index=True)
+    rosters = pandas.concat(map_ordered(
+        lambda y: __read_parquet(source_url(dataset, year=y), dataset, read),
+        years,
+        thread_requests
+    ), ignore_index=True)
     
     # Post-import processing
-    rosters['birth_date'] = pandas.to_datetime(rosters.birth_date)
-    rosters.rename(
-        columns={'gsis_id': 'player_id', 'full_name': 'player_name'},
-        inplace=True
-    )
-    if columns:
-        rosters = rosters[columns]
+    if 'birth_date' in rosters.columns:
+        rosters['birth_date'] = pandas.to_datetime(rosters.birth_date)
+    rosters.rename(columns=renames, inplace=True)
 
     return rosters
 
 
-def import_weekly_rosters(years, columns=None):
+def __select_roster_columns(rosters, columns):
+    """Selects the requested roster columns, keeping age alongside birth_date"""
+
+    if not columns:
+        return rosters
+
+    if 'birth_date' in columns and 'age' not in columns:
+        columns = columns + ['age']
+
+    return rosters[columns]
+
+
+@memoize
+def import_weekly_rosters(years, columns=None, thread_requests=True):
     """Imports roster data including mid-season changes
     
     Args:
         years (List[int]): years to get rosters for
         columns (List[str]): list of columns to return with DataFrame
+        thread_requests (bool): use thread pool to read files, default True
         
     Returns:
         DataFrame
     """
-    rosters = __import_rosters("weekly", years, columns)
-    
-    scheds = pandas.read_csv("http://www.habitatring.com/games.csv")
-    common_cols = ["season", "week", "gameday"]
-    week_team_dates = pandas.concat([
-        scheds[common_cols + ["home_team"]].rename(columns={"home_team": "team"}),
-        scheds[common_cols + ["away_team"]].rename(columns={"away_team": "team"})
-    ])
-    roster_dates = pandas.to_datetime(
-        rosters.merge(
-            week_team_dates,
-            on=["season", "week", "team"],
-            how="left"
-        ).gameday
+    rosters = __import_rosters(
+        "weekly", years, columns, thread_requests,
+        required=['season', 'week', 'team', 'birth_date']
+    )
+    
+    # date of each row's game, from an index kept per version of games.csv
+    with leased():
+        games = schedule.gameday_index(fetch(source_url('schedules'), 'schedules'))
+    roster_dates = pandas.Series(
+        games.lookup(rosters.season, rosters.week, rosters.team), index=rosters.index
     )
     rosters["age"] = ((roster_dates - rosters.birth_date).dt.days / 365.25).round(3)
     
-    return rosters
+    return __select_roster_columns(rosters, columns)
     
 
-def import_seasonal_rosters(years, columns=None):
+@memoize
+def import_seasonal_rosters(years, columns=None, thread_requests=True):
     """Imports roster data as of the end of the season
     
     Args:
         years (List[int]): years to get rosters for
         columns (List[str]): list of columns to return with DataFrame
+        thread_requests (bool): use thread pool to read files, default True
         
     Returns:
         DataFrame
     """
     
-    rosters = __import_rosters("seasonal", years, columns)
+    rosters = __import_rosters(
+        "seasonal", years, columns, thread_requests,
+        required=['season', 'gsis_id', 'birth_date']
+    )
     
-    # calculate age in season
+    # calculate age at the start of the season
     if 'birth_date' in rosters.columns:
-        rosters['szn_start'] = pandas.to_datetime(
-            rosters.season.apply(lambda x: datetime.datetime(int(x), 9, 1))
-        )
-        rosters["age"] = (
-            rosters.szn_start.dt.year - rosters.birth_date.dt.year  + numpy.where(
-                rosters.szn_start.dt.month > rosters.birth_date.dt.month, 0, -1
-            )
-        )
-        rosters.drop(['szn_start'], axis=1, inplace=True)
+        rosters["age"] = schedule.season_age(rosters.season, rosters.birth_date)
         
     rosters.dropna(subset=['player_id'], inplace=True)
 
-    return rosters
+    return __select_roster_columns(rosters, columns)
 
 
-def import_players():
+@memoize
+def import_players(columns=None, backend='pandas'):
     """Import descriptive data for all players
     
+    Args:
+        columns (List[str]): only return these columns, optional
+        backend (str): 'pandas' for a DataFrame, 'arrow' for a pyarrow.Table
     Returns:
-        DataFrame
+        DataFrame, or pyarrow.Table with backend='arrow'
     """
-    df = pandas.read_parquet(r'https://github.com/nflverse/nflverse-data/releases/download/players/players.parquet')
-    return df
+    __validate_columns(columns)
+    backends.validate(backend, backends.EAGER)
+
+    df = __read_parquet(source_url('players'), 'players', columns, backend=backend)
+    return backends.select(df, columns) if columns else df
     
     
+@memoize
 def import_team_desc():
     """Import team descriptive data
     
@@ -543,11 +972,18 @@ def import_team_desc():
     """
     
     # import desc data
-    df = pandas.read_csv(r'https://github.com/nflverse/nflfastR-data/raw/master/teams_colors_logos.csv')
+    df = __read_csv(source_url('teams'), 'teams')
     
     return df
 
 
+@memoize
+def __import_games():
+    """Imports the full schedule of games"""
+    return __read_csv(source_url('schedules'), 'schedules')
+
+
+@memoize
 def import_schedules(years):
     """Import schedules
     
@@ -565,15 +1001,14 @@ def import_schedules(years):
     if min(years) < 1999:
         raise ValueError('Data not available before 1999.')
     
-    scheds = pandas.DataFrame()
-    
     # import schedule for specified years
-    scheds = pandas.read_csv(r'http://www.habitatring.com/games.csv')    
+    scheds = __import_games()
     scheds = scheds[scheds['season'].isin(years)]
         
     return scheds
     
 
+@memoize
 def import_win_totals(years = None):
     """Import win total projections
     
@@ -593,13 +1028,14 @@ def import_win_totals(years = None):
         raise ValueError('years variable must be list or range.')
     
     # import win totals
-    url = "https://raw.githubusercontent.com/mrcaseb/nfl-data/master/data/nfl_lines_odds.csv.gz"
-    df = pandas.read_csv(url).loc[lambda df: df.game_id.notna()]
+    url = source_url('win_totals')
+    df = __read_csv(url, 'win_totals', compression='gzip').loc[lambda df: df.game_id.notna()]
     df["season"] = df.game_id.str[:4].astype(int)
 
     return df[df['season'].isin(years)] if years else df
     
 
+@memoize
 def import_officials(years=None):
     """Import game officials
     
@@ -618,7 +1054,7 @@ def import_officials(years=None):
         raise ValueError('years variable must be list or range.')
 
     # import officials data
-    df = pandas.read_csv(r'https://raw.githubusercontent.com/nflverse/nfldata/master/data/officials.csv')
+    df = __read_csv(source_url('officials'), 'officials')
     df['season'] = df['game_id'].str[0:4].astype(int)
     
     if len(years) > 0:
@@ -627,6 +1063,7 @@ def import_officials(years=None):
     return df
     
     
+@memoize
 def import_sc_lines(years=None):
     """Import weekly scoring lines
     
@@ -645,7 +1082,7 @@ def import_sc_lines(years=None):
         raise ValueError('years variable must be list or range.')
     
     # import data
-    df = pandas.read_csv(r'https://raw.githubusercontent.com/nflverse/nfldata/master/data/sc_lines.csv')
+    df = __read_csv(source_url('sc_lines'), 'sc_lines')
     
     if len(years) > 0:
         df = df[df['season'].isin(years)]
@@ -653,6 +1090,7 @@ def import_sc_lines(years=None):
     return df
     
     
+@memoize
 def import_draft_picks(years=None):
     """Import draft picks
     
@@ -671,7 +1109,7 @@ def import_draft_picks(years=None):
         raise ValueError('years variable must be list or range.')
 
     # import draft pick data
-    df = pandas.read_parquet(r'https://github.com/nflverse/nflverse-data/releases/download/draft_picks/draft_picks.parquet', engine='auto')
+    df = __read_parquet(source_url('draft_picks'), 'draft_picks')
     
     if len(years) > 0:
         df = df[df['season'].isin(years)]  
@@ -679,6 +1117,7 @@ def import_draft_picks(years=None):
     return df
     
 
+@memoize
 def import_draft_values(picks=None):
     """Import draft pick values from variety of models
     
@@ -697,7 +1136,7 @@ def import_draft_values(picks=None):
         raise ValueError('picks variable must be list or range.')
 
     # import data
-    df = pandas.read_csv(r'https://raw.githubusercontent.com/nflverse/nfldata/master/data/draft_values.csv')
+    df = __read_csv(source_url('draft_values'), 'draft_values')
 
     if len(picks) > 0:
         df = df[df['pick'].between(picks[0], picks[-1])]
@@ -705,6 +1144,7 @@ def import_draft_values(picks=None):
     return df      
 
 
+@memoize
 def import_combine_data(years=None, positions=None):
     """Import combine results for all position groups
     
@@ -730,7 +1170,7 @@ def import_combine_data(years=None, positions=None):
         raise ValueError('positions variable must be list.')
         
     # import data
-    df = pandas.read_parquet(r'https://github.com/nflverse/nflverse-data/releases/download/combine/combine.parquet', engine='auto')
+    df = __read_parquet(source_url('combine'), 'combine')
     
     # filter to years and positions
     if len(years) > 0 and len(positions) > 0:
@@ -743,6 +1183,7 @@ def import_combine_data(years=None, positions=None):
     return df    
 
 
+@memoize
 def import_ids(columns=None, ids=None):
     """Import mapping table of ids for most major data providers
     
@@ -762,7 +1203,7 @@ def import_ids(columns=None, ids=None):
     if not isinstance(ids, Iterable):
         raise ValueError('ids argument must be a list.')
         
-    df = pandas.read_csv("https://raw.githubusercontent.com/dynastyprocess/data/master/files/db_playerids.csv")
+    df = __read_csv(source_url('ids'), 'ids')
     
     id_cols = [c for c in df.columns if c.endswith('_id')]
     non_id_cols = [c for c in df.columns if not c.endswith('_id')]
@@ -773,8 +1214,24 @@ def import_ids(columns=None, ids=None):
     ret_columns = list(set([*ret_ids, *ret_cols]))
 
     return df[ret_columns]
+
+
+def import_id_index():
+    """Import a hashed index of the player id mapping table
+
+    The index is built once per downloaded version of the mapping table and
+    translates whole Series of ids between data providers, see
+    player_ids.IdIndex.
+
+    Returns:
+        IdIndex
+    """
+
+    with leased():
+        return player_ids.id_index(fetch(source_url('ids'), 'ids'))
     
 
+@memoize
 def import_contracts():
     """Imports historical contract data
     
@@ -782,19 +1239,23 @@ def import_contracts():
         DataFrame
     """
     
-    df = pandas.read_parquet(r'https://github.com/nflverse/nflverse-data/releases/download/contracts/historical_contracts.parquet')
+    df = __read_parquet(source_url('contracts'), 'contracts')
     
     return df
     
     
-def import_ngs_data(stat_type, years=None):
+@memoize
+def import_ngs_data(stat_type, years=None, columns=None, filters=None, backend='pandas'):
     """Imports seasonal NGS data
     
     Args:
         stat_type (str): type of stats to pull (receiving, passing, rushing)
         years (List[int]): years to get PBP data for, optional
+        columns (List[str]): only return these columns, optional
+        filters (List): only return rows matching these (column, op, value) predicates
+        backend (str): 'pandas' for a DataFrame, 'arrow' for a pyarrow.Table
     Returns:
-        DataFrame
+        DataFrame, or pyarrow.Table with backend='arrow'
     """
     
     # check variable types
@@ -806,25 +1267,35 @@ def import_ngs_data(stat_type, years=None):
         
     if not isinstance(years, (list, range)):
         raise ValueError('years variable must be list or range.')
+
+    __validate_columns(columns)
+    backends.validate(backend, backends.EAGER)
+    filters = __validate_filters(filters)
+
+    # the years argument is one more season filter
+    if len(years) > 0:
+        filters = [group + [('season', 'in', list(years))] for group in filters or [[]]]
     
     # import data
-    url = r'https://github.com/nflverse/nflverse-data/releases/download/nextgen_stats/ngs_{0}.parquet'.format(stat_type)
-    data = pandas.read_parquet(url)
-    
-    if len(years) > 0:
-        data = data[data['season'].isin([x for x in years])]
+    url = source_url('nextgen_stats', stat_type=stat_type)
+    data = __read_parquet(url, 'nextgen_stats', columns, filters, backend)
     
     # return
-    return data
+    return backends.select(data, columns) if columns else data
     
 
-def import_depth_charts(years):
+@memoize
+def import_depth_charts(years, thread_requests=True, columns=None, filters=None, backend='pandas'):
     """Imports team depth charts
     
     Args:
         years (List[int]): years to return depth charts for, optional
+        thread_requests (bool): use thread pool to read files, default True
+        columns (List[str]): only return these columns, optional
+        filters (List): only return rows matching these (column, op, value) predicates
+        backend (str): 'pandas' for a DataFrame, 'arrow' for a pyarrow.Table
     Returns:
-        DataFrame
+        DataFrame, or pyarrow.Table with backend='arrow'
     """
 
     # check variable types
@@ -837,22 +1308,37 @@ def import_depth_charts(years):
     if len(years) > 0:
         if min(years) < 2001:
             raise ValueError('Data not available before 2001.')
+
+    __validate_columns(columns)
+
+    backends.validate(backend, backends.EAGER)
+    filters = __validate_filters(filters)
+    years = __prune_years(years, filters)
+    if not years:
+        return backends.empty(backend, columns)
     
     # import data
-    url = r'https://github.com/nflverse/nflverse-data/releases/download/depth_charts/depth_charts_{0}.parquet'
-
-    df = pandas.concat([pandas.read_parquet(url.format(x), engine='auto') for x in years])
+    df = backends.concat(map_ordered(
+        lambda x: __read_parquet(source_url('depth_charts', year=x), 'depth_charts', columns, filters, backend),
+        years,
+        thread_requests
+    ), backend)
     
-    return df
+    return backends.select(df, columns) if columns else df
     
 
-def import_injuries(years):
+@memoize
+def import_injuries(years, thread_requests=True, columns=None, filters=None, backend='pandas'):
     """Imports team injury reports
     
     Args:
         years (List[int]): years to return injury reports for, optional
+        thread_requests (bool): use thread pool to read files, default True
+        columns (List[str]): only return these columns, optional
+        filters (List): only return rows matching these (column, op, value) predicates
+        backend (str): 'pandas' for a DataFrame, 'arrow' for a pyarrow.Table
     Returns:
-        DataFrame
+        DataFrame, or pyarrow.Table with backend='arrow'
     """
 
     # check variable types
@@ -865,15 +1351,26 @@ def import_injuries(years):
     if len(years) > 0:
         if min(years) < 2009:
             raise ValueError('Data not available before 2009.')
+
+    __validate_columns(columns)
+
+    backends.validate(backend, backends.EAGER)
+    filters = __validate_filters(filters)
+    years = __prune_years(years, filters)
+    if not years:
+        return backends.empty(backend, columns)
     
     #import data
-    url = r'https://github.com/nflverse/nflverse-data/releases/download/injuries/injuries_{0}.parquet'
-
-    df = pandas.concat([pandas.read_parquet(url.format(x), engine='auto') for x in years])
+    df = backends.concat(map_ordered(
+        lambda x: __read_parquet(source_url('injuries', year=x), 'injuries', columns, filters, backend),
+        years,
+        thread_requests
+    ), backend)
     
-    return df
+    return backends.select(df, columns) if columns else df
     
 
+@memoize
 def import_qbr(years=None, level='nfl', frequency='season'):
     """Import NFL or college QBR data
     
@@ -903,9 +1400,9 @@ def import_qbr(years=None, level='nfl', frequency='season'):
         raise ValueError('frequency must be season or weekly')
     
     # import data
-    url = r'https://raw.githubusercontent.com/nflverse/espnscrapeR-data/master/data/qbr-{}-{}.csv'.format(level, frequency)
+    url = source_url('qbr', level=level, frequency=frequency)
 
-    df = pandas.read_csv(url)
+    df = __read_csv(url, 'qbr')
             
     # filter to desired years
     if len(years) > 0:
@@ -934,6 +1431,7 @@ def __validate_pfr_inputs(s_type, years=None):
 
     return years
     
+@memoize
 def import_seasonal_pfr(s_type, years=None):
     """Import PFR advanced season-level statistics
     
@@ -946,18 +1444,20 @@ def import_seasonal_pfr(s_type, years=None):
     
     years = __validate_pfr_inputs(s_type, years)
 
-    url = f"https://github.com/nflverse/nflverse-data/releases/download/pfr_advstats/advstats_season_{s_type}.parquet"
-    df = pandas.read_parquet(url)
+    url = source_url('pfr_season', s_type=s_type)
+    df = __read_parquet(url, 'pfr_season')
 
     return df[df.season.isin(years)] if years else df
 
 
-def import_weekly_pfr(s_type, years=None):
+@memoize
+def import_weekly_pfr(s_type, years=None, thread_requests=True):
     """Import PFR advanced week-level statistics
     
     Args:
         s_type (str): must be one of pass, rec, rush, def
         years (List[int]): years to return data for, optional
+        thread_requests (bool): use thread pool to read files, default True
     Returns:
         DataFrame
     """
@@ -967,22 +1467,27 @@ def import_weekly_pfr(s_type, years=None):
     if len(years) == 0:
         years = list(import_seasonal_pfr(s_type).season.unique())
     
-    url = "https://github.com/nflverse/nflverse-data/releases/download/pfr_advstats/advstats_week_{0}_{1}.parquet"
-    df = pandas.concat([
-        pandas.read_parquet(url.format(s_type, yr))
-        for yr in years
-    ])
+    df = pandas.concat(map_ordered(
+        lambda yr: __read_parquet(source_url('pfr_week', s_type=s_type, year=yr), 'pfr_week'),
+        years,
+        thread_requests
+    ))
     
     return df[df.season.isin(years)] if years else df
     
     
-def import_snap_counts(years):
+@memoize
+def import_snap_counts(years, thread_requests=True, columns=None, filters=None, backend='pandas'):
     """Import snap count data for individual players
     
     Args:
         years (List[int]): years to return snap counts for
+        thread_requests (bool): use thread pool to read files, default True
+        columns (List[str]): only return these columns, optional
+        filters (List): only return rows matching these (column, op, value) predicates
+        backend (str): 'pandas' for a DataFrame, 'arrow' for a pyarrow.Table
     Returns:
-        DataFrame
+        DataFrame, or pyarrow.Table with backend='arrow'
     """
 
     # check variables types
@@ -995,24 +1500,34 @@ def import_snap_counts(years):
     if len(years) > 0:
         if min(years) < 2012:
             raise ValueError('Data not available before 2012.')
-    
-    df = pandas.DataFrame()
+
+    __validate_columns(columns)
+
+    backends.validate(backend, backends.EAGER)
+    filters = __validate_filters(filters)
+    years = __prune_years(years, filters)
+    if not years:
+        return backends.empty(backend, columns)
     
     # import data
-        
-    url = r'https://github.com/nflverse/nflverse-data/releases/download/snap_counts/snap_counts_{0}.parquet'
-
-    df = pandas.concat([pandas.read_parquet(url.format(x)) for x in years])
+    df = backends.concat(map_ordered(
+        lambda x: __read_parquet(source_url('snap_counts', year=x), 'snap_counts', columns, filters, backend),
+        years,
+        thread_requests
+    ), backend)
     
-    return df
+    return backends.select(df, columns) if columns else df
 
 
 
+@memoize
 def import_ftn_data(
         years, 
         columns=None, 
         downcast=True,
-        thread_requests=False
+        thread_requests=True,
+        filters=None,
+        backend='pandas'
     ):
     """Imports FTN charting data
     
@@ -1026,9 +1541,13 @@ def import_ftn_data(
         years (List[int]): years to get weekly data for
         columns (List[str]): only return these columns, default None
         downcast (bool): convert float64 to float32, default True
-        thread_requests (bool): use thread pool to read files, default False
+        thread_requests (bool): use thread pool to read files, default True
+            (False before 0.3.4)
+        filters (List): only return rows matching these (column, op, value) predicates
+        backend (str): 'pandas' for a DataFrame, 'arrow' for a pyarrow.Table,
+            'polars' for a polars.LazyFrame over the parquet files
     Returns:
-        DataFrame
+        DataFrame, pyarrow.Table or polars.LazyFrame depending on backend
     """
     
     # check variable types
@@ -1038,118 +1557,45 @@ def import_ftn_data(
     if min(years) < 2022:
         raise ValueError('Data not available before 2022.')
 
-    url = r'https://github.com/nflverse/nflverse-data/releases/download/ftn_charting/ftn_charting_{0}.parquet'
-
-    if thread_requests:
-        with ThreadPoolExecutor() as executor:
-            # Create a list of the same size as years, initialized with None
-            data = [None]*len(years)
-            # Create a mapping of futures to their corresponding index in the data
-            futures_map = {
-                executor.submit(
-                    pandas.read_parquet,
-                    path=url.format(year),
-                    columns=columns if columns else None,
-                    engine='auto'
-                ): idx
-                for idx, year in enumerate(years)
-            }
-            for future in as_completed(futures_map):
-                data[futures_map[future]] = future.result()
-            data = pandas.concat(data)
-    else:
-        # read charting data
-        data = pandas.concat([pandas.read_parquet(url.format(x), engine='auto', columns=columns) for x in years])
+    backends.validate(backend)
+    filters = __validate_filters(filters)
+    years = __prune_years(years, filters)
+    if not years:
+        return backends.empty(backend, columns)
+
+    # read charting data
+    data = backends.concat(map_ordered(
+        lambda x: __read_parquet(
+            source_url('ftn_charting', year=x), 'ftn_charting', columns, filters, backend,
+            downcast=downcast
+        ),
+        years,
+        thread_requests
+    ), backend)
+
+    if columns:
+        data = backends.select(data, columns)
 
-    # converts float64 to float32, saves ~30% memory
+    # floats were converted to float32 while decoding, saves ~30% memory,
+    # this only catches columns whose type differed between seasons
     if downcast:
-        print('Downcasting floats.')
-        cols = data.select_dtypes(include=[numpy.float64]).columns
-        data[cols] = data[cols].astype(numpy.float32)
+        with events.timed('downcast', dataset='ftn_charting') as event:
+            data = backends.downcast_floats(data)
+            event['rows'] = backends.num_rows(data)
 
     return data
 
     
-def clean_nfl_data(df):
+def clean_nfl_data(df, replacements=None):
     """Cleans descriptive data for players and teams to help with consistency across datasets
     
     Args:
         df (DataFrame): DataFrame to be cleaned
+        replacements (Dict[str, Dict]): optional, extra {value: replacement}
+            tables by column, applied after the built-in ones
         
     Returns:
         DataFrame
     """
 
-    name_repl = {
-        'Gary Jennings Jr': 'Gary Jennings',
-        'DJ Chark': 'D.J. Chark',
-        'Cedrick Wilson Jr.': 'Cedrick Wilson',
-        'Deangelo Yancey': 'DeAngelo Yancey',
-        'Ardarius Stewart': 'ArDarius Stewart',
-        'Calvin Johnson  HOF': 'Calvin Johnson',
-        'Mike Sims-Walker': 'Mike Walker',
-        'Kenneth Moore': 'Kenny Moore',
-        'Devante Parker': 'DeVante Parker',
-        'Brandon Lafell': 'Brandon LaFell',
-        'Desean Jackson': 'DeSean Jackson',
-        'Deandre Hopkins': 'DeAndre Hopkins',
-        'Deandre Smelter': 'DeAndre Smelter',
-        'William Fuller': 'Will Fuller',
-        'Lavon Brazill': 'LaVon Brazill',
-        'Devier Posey': 'DeVier Posey',
-        'Demarco Sampson': 'DeMarco Sampson',
-        'Deandrew Rubin': 'DeAndrew Rubin',
-        'Latarence Dunbar': 'LaTarence Dunbar',
-        'Jajuan Dawson': 'JaJuan Dawson',
-        "Andre' Davis": 'Andre Davis',
-        'Johnathan Holland': 'Jonathan Holland',
-        'Johnnie Lee Higgins Jr.': 'Johnnie Lee Higgins',
-        'Marquis Walker': 'Marquise Walker',
-        'William Franklin': 'Will Franklin',
-        'Ted Ginn Jr.': 'Ted Ginn',
-        'Jonathan Baldwin': 'Jon Baldwin',
-        'T.J. Graham': 'Trevor Graham',
-        'Odell Beckham Jr.': 'Odell Beckham',
-        'Michael Pittman Jr.': 'Michael Pittman',
-        'DK Metcalf': 'D.K. Metcalf',
-        'JJ Arcega-Whiteside': 'J.J. Arcega-Whiteside',
-        'Lynn Bowden Jr.': 'Lynn Bowden',
-        'Laviska Shenault Jr.': 'Laviska Shenault',
-        'Henry Ruggs III': 'Henry Ruggs',
-        'KJ Hamler': 'K.J. Hamler',
-        'KJ Osborn': 'K.J. Osborn',
-        'Devonta Smith': 'DeVonta Smith',
-        'Terrace Marshall Jr.': 'Terrace Marshall',
-        "Ja'Marr Chase": 'JaMarr Chase'
-    }
-
-    col_tm_repl = {
-        'Ole Miss': 'Mississippi',
-        'Texas Christian': 'TCU',
-        'Central Florida': 'UCF',
-        'Bowling Green State': 'Bowling Green',
-        'West. Michigan': 'Western Michigan',
-        'Pitt': 'Pittsburgh',
-        'Brigham Young': 'BYU',
-        'Texas-El Paso': 'UTEP',
-        'East. Michigan': 'Eastern Michigan',
-        'Middle Tenn. State': 'Middle Tennessee State',
-        'Southern Miss': 'Southern Mississippi',
-        'Louisiana State': 'LSU'
-    }
-
-    na_replace = {
-        'NA':numpy.nan
-    }
-
-    for col in df.columns:
-        if df[col].dtype == 'object':
-            df.replace({col:na_replace}, inplace=True)
-
-    if 'name' in df.columns:
-        df.replace({'name': name_repl}, inplace=True)
-
-    if 'col_team' in df.columns:
-        df.replace({'col_team': col_tm_repl}, inplace=True)
-
-    return df
+    return cleaning.clean(df, replacements)
@@ -0,0 +1,264 @@
+"""
+Awaitable versions of the nfl_data_py import functions
+
+    import asyncio
+    from nfl_data_py import aio
+
+    pbp, weekly = await asyncio.gather(
+        aio.import_pbp_data([2022, 2023]),
+        aio.import_weekly_data([2022, 2023]),
+    )
+
+Each function takes the same arguments and returns the same frame as its
+counterpart in nfl_data_py. The files a call needs are downloaded concurrently
+on an httpx.AsyncClient, bounded per event loop by MAX_CONNECTIONS and going
+through the shared download cache, or through the record or replay transport
+when one is configured (see nfl_data_py.transport). Parsing and
+post-processing then run in the loop's default executor, so the event loop
+never blocks on decoding.
+
+Requires httpx, install with `pip install nfl_data_py[async]`.
+"""
+import io
+import os
+import time
+import asyncio
+import inspect
+import functools
+import contextvars
+import weakref
+from urllib.error import HTTPError, URLError
+
+try:
+    import httpx
+except ImportError as e:
+    raise ImportError(
+        'nfl_data_py.aio requires httpx, install it with pip install nfl_data_py[async]'
+    ) from e
+
+import nfl_data_py as nfl
+from nfl_data_py import cache, events, transport
+from nfl_data_py.sources import url as source_url
+
+MAX_CONNECTIONS = 16
+TIMEOUT = 60
+
+_semaphores = weakref.WeakKeyDictionary()
+
+
+async def prefetch(files):
+    """Downloads files concurrently ahead of a load
+
+    Args:
+        files (Iterable[Tuple[str, str]]): (url, dataset) pairs
+    Returns:
+        Dict mapping each url to a cached path, its bytes when the download
+        cache is disabled, or the exception raised while downloading it
+    """
+
+    # files of a local mirror are read in place by the loader
+    files = {url: dataset for url, dataset in files if cache.local_path(url) is None}
+    if not files:
+        return {}
+
+    async with httpx.AsyncClient(follow_redirects=True, timeout=TIMEOUT) as client:
+        results = await asyncio.gather(*(
+            __download(client, url, dataset) for url, dataset in files.items()
+        ))
+
+    return dict(zip(files, results))
+
+
+async def __download(client, url, dataset):
+    loop = asyncio.get_running_loop()
+    if not transport.is_live():
+        # recorded and replayed files go through the transport like sync loads
+        async with __semaphore(loop):
+            return await loop.run_in_executor(None, __fetch, url, dataset)
+
+    start = time.perf_counter()
+    src, status, size = await __get(client, url, dataset)
+    if status is not None:
+        events.emit(
+            'fetch', url=url, dataset=dataset, cache=status, bytes=size,
+            seconds=time.perf_counter() - start
+        )
+    return src
+
+
+async def __get(client, url, dataset):
+    # (result, cache status, bytes downloaded), status None for failures
+    loop = asyncio.get_running_loop()
+    enabled = cache._config['enabled']
+    path, headers = None, {}
+
+    async with __semaphore(loop):
+        if enabled:
+            path, fresh, headers = cache.lookup(url, dataset)
+            if fresh:
+                return path, 'hit', 0
+
+        try:
+            async with client.stream('GET', url, headers=headers) as resp:
+                if resp.status_code == 304 or resp.status_code >= 400:
+                    error = HTTPError(
+                        url, resp.status_code, resp.reason_phrase, resp.headers, None
+                    )
+                    src = __resolve(url, path, error)
+                    if isinstance(src, Exception):
+                        return src, None, 0
+                    return src, 'revalidated' if resp.status_code == 304 else 'stale', 0
+
+                if not enabled:
+                    body = await resp.aread()
+                    return body, 'disabled', len(body)
+
+                # the body goes straight to the cache's temp file, so only one
+                # chunk per download is held in memory
+                tmp, size = await __receive(loop, resp)
+                headers = resp.headers
+        except httpx.HTTPError as e:
+            return __resolve(url, path, URLError(e)), None, 0
+
+    path = await loop.run_in_executor(None, cache.store, url, dataset, tmp, headers)
+    return path, 'miss', size
+
+
+async def __receive(loop, resp):
+    # (path of the complete body, bytes received)
+    f, tmp = await loop.run_in_executor(None, cache.open_partial)
+    size = 0
+    try:
+        with f:
+            async for chunk in resp.aiter_bytes(cache._CHUNK):
+                await loop.run_in_executor(None, f.write, chunk)
+                size += len(chunk)
+    except BaseException:
+        os.remove(tmp)
+        raise
+    return tmp, size
+
+
+def __fetch(url, dataset):
+    try:
+        src = cache.fetch(url, dataset)
+    except Exception as exc:
+        return exc
+    return src.getvalue() if isinstance(src, io.BytesIO) else src
+
+
+def __resolve(url, path, error):
+    # same handling as the sync cache, but hand the error to the loader
+    # instead of raising it here so it surfaces where the sync API raises it
+    try:
+        return cache.fallback(url, path, error)
+    except Exception as exc:
+        return exc
+
+
+def __semaphore(loop):
+    if loop not in _semaphores:
+        _semaphores[loop] = asyncio.Semaphore(MAX_CONNECTIONS)
+    return _semaphores[loop]
+
+
+def __years(dataset):
+    return lambda years, **_: [(source_url(dataset, year=y), dataset) for y in years]
+
+
+def __single(dataset):
+    return lambda **_: [(source_url(dataset), dataset)]
+
+
+def __plan_pbp(years, include_participation, cache, **_):
+    if cache:
+        return []
+
+    files = [(source_url('pbp', year=y), 'pbp') for y in years]
+    if include_participation:
+        files += [(source_url('pbp_participation', year=y), 'pbp_participation') for y in years]
+
+    return files
+
+
+def __plan_weekly_pfr(s_type, years, **_):
+    if not years:
+        return [(source_url('pfr_season', s_type=s_type), 'pfr_season')]
+    return [(source_url('pfr_week', s_type=s_type, year=y), 'pfr_week') for y in years]
+
+
+# files each import function reads, from its bound arguments
+_PLANS = {
+    'import_pbp_data': __plan_pbp,
+    'import_weekly_data': __years('player_stats'),
+    'import_seasonal_data': lambda years, weekly, **_: (
+        __years('player_stats')(years) if weekly is None else []
+    ),
+    'import_seasonal_rosters': __years('rosters'),
+    'import_weekly_rosters': lambda years, **_: (
+        __years('weekly_rosters')(years) + [(source_url('schedules'), 'schedules')]
+    ),
+    'import_depth_charts': __years('depth_charts'),
+    'import_injuries': __years('injuries'),
+    'import_snap_counts': __years('snap_counts'),
+    'import_ftn_data': __years('ftn_charting'),
+    'import_weekly_pfr': __plan_weekly_pfr,
+    'import_seasonal_pfr': lambda s_type, **_: [
+        (source_url('pfr_season', s_type=s_type), 'pfr_season')
+    ],
+    'import_ngs_data': lambda stat_type, **_: [
+        (source_url('nextgen_stats', stat_type=stat_type), 'nextgen_stats')
+    ],
+    'import_qbr': lambda level, frequency, **_: [
+        (source_url('qbr', level=level, frequency=frequency), 'qbr')
+    ],
+    'import_schedules': __single('schedules'),
+    'import_players': __single('players'),
+    'import_team_desc': __single('teams'),
+    'import_win_totals': __single('win_totals'),
+    'import_officials': __single('officials'),
+    'import_sc_lines': __single('sc_lines'),
+    'import_draft_picks': __single('draft_picks'),
+    'import_draft_values': __single('draft_values'),
+    'import_combine_data': __single('combine'),
+    'import_ids': __single('ids'),
+    'import_id_index': __single('ids'),
+    'import_contracts': __single('contracts'),
+    'see_pbp_cols': lambda **_: [(source_url('pbp', year=2020), 'pbp')],
+    'see_weekly_cols': lambda **_: [(source_url('player_stats', year=2020), 'player_stats')],
+}
+
+
+def __awaitable(func, plan):
+    sig = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            files = plan(**bound.arguments)
+        except Exception:
+            # invalid input, let the loader raise its usual error
+            files = []
+
+        # downloads land in the cache outside this context, so their files
+        # are leased up front and kept until the loader has read them
+        with cache.leased(url for url, _ in files):
+            prefetched = await prefetch(files)
+
+            ctx = contextvars.copy_context()
+            ctx.run(cache._prefetched.set, prefetched)
+
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, functools.partial(ctx.run, func, *args, **kwargs)
+            )
+
+    return wrapper
+
+
+for _name, _plan in _PLANS.items():
+    globals()[_name] = __awaitable(getattr(nfl, _name), _plan)
+
+__all__ = ['prefetch', *_PLANS]
@@ -0,0 +1,505 @@
+"""
+Frame operations shared by the pandas, arrow and polars return modes
+
+Loaders that take a backend argument build their result through these helpers,
+so the same code path returns a pandas DataFrame (backend='pandas'), a
+pyarrow.Table (backend='arrow') or a polars.LazyFrame (backend='polars').
+
+Arrow results go straight from the parquet reader to the caller: nothing is
+converted to numpy, and seasons are combined with concat_tables, which only
+collects the chunks of each table. Polars results are query plans over the
+downloaded or cached parquet files; nothing is read until they are collected,
+so later projections and filters are pushed into the scans.
+
+The arrow backend requires pyarrow, install with `pip install nfl_data_py[arrow]`,
+and the polars backend requires polars, install with
+`pip install nfl_data_py[polars]`.
+"""
+import numpy
+import pandas
+
+BACKENDS = ('pandas', 'arrow', 'polars')
+
+# backends of loaders that return materialized results only
+EAGER = ('pandas', 'arrow')
+
+# string columns with at most this share of distinct values are dictionary encoded
+COMPACT_RATIO = 0.5
+
+# rows decoded at a time when floats are downcast while reading
+BATCH_ROWS = 65536
+
+# read buffer when streaming a file batch by batch
+STREAM_BYTES = 1 << 20
+
+
+def validate(backend, supported=BACKENDS):
+    """Checks backend is supported and its library is installed"""
+
+    if backend not in supported:
+        raise ValueError(f'backend must be one of {", ".join(supported)}.')
+
+    if backend == 'arrow':
+        pyarrow()
+    elif backend == 'polars':
+        polars()
+
+
+def pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "backend='arrow' requires pyarrow, install it with pip install nfl_data_py[arrow]"
+        ) from e
+
+    return pyarrow
+
+
+def polars():
+    try:
+        import polars
+    except ImportError as e:
+        raise ImportError(
+            "backend='polars' requires polars, install it with pip install nfl_data_py[polars]"
+        ) from e
+
+    return polars
+
+
+def is_table(df):
+    return type(df).__module__.startswith('pyarrow')
+
+
+def is_lazy(df):
+    return type(df).__module__.startswith('polars')
+
+
+def read_parquet(source, backend='pandas', columns=None, downcast=False, **kwargs):
+    """Decodes a parquet file
+
+    With downcast, float64 columns are converted to float32 while the file
+    is decoded, so a float64 copy of the full frame never exists.
+    """
+
+    if backend == 'polars':
+        pl = polars()
+        # season is set by the loaders, never taken from hive style paths
+        lf = pl.scan_parquet(source, hive_partitioning=False)
+        if columns is not None:
+            lf = lf.select(columns)
+        return lf.with_columns(pl.col(pl.Float64).cast(pl.Float32)) if downcast else lf
+
+    if backend == 'arrow':
+        return __read_table(source, columns, downcast, **kwargs)
+
+    if not downcast:
+        return pandas.read_parquet(source, engine='auto', columns=columns, **kwargs)
+
+    try:
+        table = __read_table(source, columns, downcast, **kwargs)
+    except ImportError:
+        return __read_fastparquet(source, columns, **kwargs)
+
+    # hand each column to pandas and free its arrow buffers right away
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def __read_table(source, columns=None, downcast=False, filters=None, **kwargs):
+    pa = pyarrow()
+    pq = pa.parquet
+
+    if not downcast:
+        return pq.read_table(source, columns=columns, filters=filters, **kwargs)
+
+    # decode a batch of rows at a time and convert it before the next is read,
+    # only one batch is ever held as float64
+    pf = pq.ParquetFile(source, pre_buffer=False, buffer_size=STREAM_BYTES)
+    expr = pq.filters_to_expression(filters) if filters else None
+    # skip row groups whose statistics rule the filters out, like read_table
+    row_groups = __row_groups(pf.metadata, filters) if filters else None
+    parts = []
+    for batch in pf.iter_batches(batch_size=BATCH_ROWS, row_groups=row_groups,
+                                 columns=columns, use_pandas_metadata=True):
+        part = pa.Table.from_batches([batch])
+        if expr is not None:
+            part = part.filter(expr)
+        parts.append(part.cast(__float32_schema(part.schema)))
+
+    if not parts:
+        table = pf.read_row_groups([], columns=columns, use_pandas_metadata=True)
+        return table.cast(__float32_schema(table.schema))
+
+    table = pa.concat_tables(parts)
+    # batches do not carry the file metadata pandas needs to rebuild the index
+    return table.replace_schema_metadata(pf.schema_arrow.metadata)
+
+
+def __row_groups(metadata, filters):
+    """Indices of the row groups whose statistics do not rule out filters"""
+
+    groups = filters if isinstance(filters[0], list) else [filters]
+    names = [metadata.schema.column(i).path for i in range(metadata.num_columns)]
+
+    keep = []
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        stats = {}
+        for j, name in enumerate(names):
+            s = row_group.column(j).statistics
+            if s is not None and s.has_min_max:
+                stats[name] = (s.min, s.max)
+
+        if any(all(__may_match(stats.get(col), op, value) for col, op, value in group)
+               for group in groups):
+            keep.append(i)
+
+    return keep
+
+
+def __may_match(bounds, op, value):
+    if bounds is None:
+        return True
+
+    low, high = bounds
+    try:
+        if op in ('==', '='):
+            return low <= value <= high
+        if op == '!=':
+            return not low == high == value
+        if op == '<':
+            return low < value
+        if op == '<=':
+            return low <= value
+        if op == '>':
+            return high > value
+        if op == '>=':
+            return high >= value
+        if op == 'in':
+            return any(low <= v <= high for v in value)
+        if op == 'not in':
+            return not (low == high and low in value)
+    except TypeError:
+        # statistics of a type the value does not compare with
+        pass
+
+    return True
+
+
+def __read_fastparquet(source, columns=None, filters=None, **kwargs):
+    import fastparquet
+
+    pf = fastparquet.ParquetFile(source)
+
+    # fastparquet allocates the frame from these dtypes and decodes into it,
+    # so stored columns not being read must be left out. A stored index is
+    # always read
+    index = [i for i in (pf.pandas_metadata or {}).get('index_columns', []) if isinstance(i, str)]
+    skipped = set(pf.columns) - set(columns if columns is not None else pf.columns) - set(index)
+    dtypes = {
+        col: numpy.dtype(numpy.float32) if dtype == numpy.float64 else dtype
+        for col, dtype in pf.dtypes.items() if col not in skipped
+    }
+
+    return pf.to_pandas(columns=columns, filters=filters, dtypes=dtypes, **kwargs)
+
+
+def __float32_schema(schema):
+    pa = pyarrow()
+    fields = [
+        f.with_type(pa.float32()) if pa.types.is_float64(f.type) else f
+        for f in schema
+    ]
+    return pa.schema(fields, schema.metadata)
+
+
+def concat(frames, backend='pandas', **kwargs):
+    """Concatenates frames, without copying column data for arrow tables"""
+
+    if backend == 'polars':
+        return polars().concat(frames, how='diagonal_relaxed')
+
+    if backend != 'arrow':
+        return pandas.concat(frames, **kwargs)
+
+    pa = pyarrow()
+    try:
+        # seasons may differ in a column's type or presence
+        return pa.concat_tables(frames, promote_options='permissive')
+    except TypeError:
+        return pa.concat_tables(frames, promote=True)
+
+
+def empty(backend='pandas', columns=None):
+    if backend == 'arrow':
+        pa = pyarrow()
+        return pa.table({c: pa.array([], pa.null()) for c in columns or []})
+
+    if backend == 'polars':
+        return polars().LazyFrame({c: [] for c in columns or []})
+
+    return pandas.DataFrame(columns=columns)
+
+
+def column(df, name):
+    """Single column as a pandas Series"""
+    return df.column(name).to_pandas() if is_table(df) else df[name]
+
+
+def names(df):
+    if is_lazy(df):
+        return df.collect_schema().names()
+
+    return df.column_names if is_table(df) else list(df.columns)
+
+
+def select(df, columns):
+    return df.select(columns) if is_table(df) or is_lazy(df) else df[columns]
+
+
+def drop(df, columns):
+    if is_table(df) or is_lazy(df):
+        return df.select([c for c in names(df) if c not in columns])
+
+    return df.drop(columns=columns)
+
+
+def take(df, mask):
+    """Rows of df where the boolean numpy mask is set"""
+    return df.filter(pyarrow().array(mask)) if is_table(df) else df[mask]
+
+
+def slice_rows(df, start, stop):
+    if is_table(df):
+        return df.slice(start, stop - start)
+
+    return df.iloc[start:stop].reset_index(drop=True)
+
+
+def set_constant(df, name, value):
+    """Sets column name of df to value on every row"""
+
+    if is_lazy(df):
+        pl = polars()
+        return df.with_columns(pl.lit(value, dtype=pl.Int64).alias(name))
+
+    if not is_table(df):
+        df[name] = value
+        return df
+
+    pa = pyarrow()
+    values = pa.array(numpy.full(len(df), value))
+    if name in df.column_names:
+        return df.set_column(df.column_names.index(name), name, values)
+
+    return df.append_column(name, values)
+
+
+def downcast_floats(df):
+    """Converts float64 columns to float32, in place for pandas frames"""
+
+    if is_lazy(df):
+        pl = polars()
+        return df.with_columns(pl.col(pl.Float64).cast(pl.Float32))
+
+    if is_table(df):
+        return df.cast(__float32_schema(df.schema))
+
+    cols = df.select_dtypes(include=[numpy.float64]).columns
+    if len(cols):
+        df[cols] = df[cols].astype(numpy.float32)
+
+    return df
+
+
+def num_rows(df):
+    # lazy plans have no row count until they are collected
+    return None if is_lazy(df) else len(df)
+
+
+def memory_bytes(df):
+    if is_table(df):
+        return df.nbytes
+
+    return int(df.memory_usage(deep=True).sum())
+
+
+def encode_repetitive(df, max_ratio=COMPACT_RATIO):
+    """Dictionary encodes string columns with few distinct values
+
+    pandas columns become categoricals, arrow columns dictionary arrays.
+    """
+
+    if is_table(df):
+        pa = pyarrow()
+        import pyarrow.compute as pc
+
+        for idx, field in enumerate(df.schema):
+            if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+                continue
+            values = df.column(idx)
+            if pc.count_distinct(values).as_py() <= max_ratio * len(df):
+                df = df.set_column(idx, field.name, values.dictionary_encode())
+
+        return df
+
+    for col in df.select_dtypes(include=['object']).columns:
+        values = df[col]
+        if pandas.api.types.infer_dtype(values, skipna=True) != 'string':
+            continue
+        if values.nunique() <= max_ratio * len(df):
+            df[col] = values.astype('category')
+
+    return df
+
+
+def align_categories(frames):
+    """Gives every frame the same categories per encoded column
+
+    Concatenating categoricals with differing categories falls back to
+    object columns, so all seasons get the sorted union of categories.
+    """
+
+    if frames and is_table(frames[0]):
+        pa = pyarrow()
+        encoded = {
+            field.name for df in frames for field in df.schema
+            if pa.types.is_dictionary(field.type)
+        }
+        aligned = []
+        for df in frames:
+            for idx, field in enumerate(df.schema):
+                if field.name in encoded and not pa.types.is_dictionary(field.type):
+                    df = df.set_column(idx, field.name, df.column(idx).dictionary_encode())
+            aligned.append(df)
+        return aligned
+
+    encoded = {col for df in frames for col in df.select_dtypes(include=['category']).columns}
+    for col in encoded:
+        parts = [
+            df[col].astype('category') for df in frames
+            if col in df.columns and df[col].dtype in ('object', 'category')
+        ]
+        categories = pandas.api.types.union_categoricals(parts, sort_categories=True).categories
+        dtype = pandas.CategoricalDtype(categories)
+        for df in frames:
+            if col in df.columns:
+                df[col] = df[col].astype(dtype)
+
+    return frames
+
+
+def downcast_ints(df):
+    """Stores integer columns in the smallest signed width holding their values"""
+
+    if is_table(df):
+        pa = pyarrow()
+        import pyarrow.compute as pc
+
+        for idx, field in enumerate(df.schema):
+            if not pa.types.is_integer(field.type) or len(df) == 0:
+                continue
+            bounds = pc.min_max(df.column(idx))
+            low, high = bounds['min'].as_py(), bounds['max'].as_py()
+            if low is None:
+                continue
+            for width in (pa.int8(), pa.int16(), pa.int32()):
+                info = numpy.iinfo(width.to_pandas_dtype())
+                if info.min <= low and high <= info.max:
+                    if width.bit_width < field.type.bit_width:
+                        df = df.set_column(idx, field.name, df.column(idx).cast(width))
+                    break
+
+        return df
+
+    for col in df.select_dtypes(include=['integer']).columns:
+        df[col] = pandas.to_numeric(df[col], downcast='integer')
+
+    return df
+
+
+def unify_dictionaries(df):
+    """Makes concatenated arrow seasons share one dictionary per column"""
+    return df.unify_dictionaries() if is_table(df) else df
+
+
+def left_merge(left, right, left_on, right_on):
+    """Left join keeping the row order of left, like DataFrame.merge"""
+
+    if is_lazy(left):
+        return __lazy_left_merge(left, right, left_on, right_on)
+
+    if not is_table(left):
+        return left.merge(right, how='left', left_on=left_on, right_on=right_on)
+
+    pa = pyarrow()
+
+    # arrow joins drop the right keys and do not keep row order, so join on
+    # copies of the keys and sort on a row number afterwards
+    keys = [f'__key{i}' for i in range(len(right_on))]
+    for key, lcol, rcol in zip(keys, left_on, right_on):
+        right = right.append_column(key, right.column(rcol).cast(left.schema.field(lcol).type))
+
+    # a key named alike on both sides appears once, as with pandas
+    right = drop(right, [rcol for lcol, rcol in zip(left_on, right_on) if lcol == rcol])
+
+    left = left.append_column('__row', pa.array(numpy.arange(len(left))))
+    joined = left.join(
+        right, keys=left_on, right_keys=keys, join_type='left outer',
+        left_suffix='_x', right_suffix='_y'
+    )
+
+    return drop(joined.sort_by('__row'), ['__row'])
+
+
+def predicate(filters):
+    """Polars expression for normalized (column, op, value) filters"""
+
+    pl = polars()
+    ops = {
+        '==': lambda c, v: c == v,
+        '=': lambda c, v: c == v,
+        '!=': lambda c, v: c != v,
+        '<': lambda c, v: c < v,
+        '<=': lambda c, v: c <= v,
+        '>': lambda c, v: c > v,
+        '>=': lambda c, v: c >= v,
+        'in': lambda c, v: c.is_in(list(v)),
+        'not in': lambda c, v: ~c.is_in(list(v)),
+    }
+
+    expr = None
+    for group in filters:
+        term = pl.all_horizontal([ops[op](pl.col(col), value) for col, op, value in group])
+        expr = term if expr is None else expr | term
+
+    return expr
+
+
+def __lazy_left_merge(left, right, left_on, right_on):
+    pl = polars()
+    left_schema = left.collect_schema()
+    right_schema = right.collect_schema()
+
+    # join on copies of the right keys so they stay in the result, as with
+    # pandas, and cast them to the left key types
+    keys = [f'__key{i}' for i in range(len(right_on))]
+    right = right.with_columns([
+        pl.col(rcol).cast(left_schema[lcol]).alias(key)
+        for key, lcol, rcol in zip(keys, left_on, right_on)
+    ])
+    right = right.drop([rcol for lcol, rcol in zip(left_on, right_on) if lcol == rcol])
+
+    shared = [c for c in right_schema.names() if c in left_schema and c not in left_on]
+    left = left.rename({c: c + '_x' for c in shared})
+    right = right.rename({c: c + '_y' for c in shared})
+
+    try:
+        return left.join(
+            right, how='left', left_on=left_on, right_on=keys, coalesce=True,
+            maintain_order='left'
+        )
+    except TypeError:
+        # older polars keep the left order of a left join by default
+        return left.join(right, how='left', left_on=left_on, right_on=keys)
@@ -0,0 +1,627 @@
+"""
+Disk cache shared by the nfl_data_py loaders
+
+Every file a loader downloads goes through fetch(), which keeps a copy on disk
+keyed by its source URL. Copies younger than their dataset's TTL are served
+without touching the network; older copies are revalidated with a conditional
+request (ETag / Last-Modified) and only downloaded again when upstream changed.
+Once the cache grows past its byte budget the least recently used entries are
+evicted. Files fetched inside a leased() block are never evicted before the
+block exits, so loaders can read what fetch() returned; leases are held per
+process.
+"""
+import os
+import io
+import atexit
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import threading
+import posixpath
+import contextlib
+import contextvars
+import urllib.request
+from urllib.parse import urlparse
+from urllib.error import HTTPError, URLError
+from warnings import warn
+
+import pandas
+import appdirs
+
+from nfl_data_py import events, transport
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3
+DEFAULT_TTL = HOUR
+
+# seconds a cached copy is trusted before it is revalidated upstream
+DATASET_TTL = {
+    'players': DAY,
+    'teams': DAY,
+    'officials': DAY,
+    'draft_picks': DAY,
+    'draft_values': DAY,
+    'combine': DAY,
+    'contracts': DAY,
+    'ids': DAY,
+    'pfr_season': DAY,
+}
+
+_CHUNK = 1024 * 1024
+
+_config = {
+    'enabled': True,
+    'path': None,
+    'max_bytes': DEFAULT_MAX_BYTES,
+    'ttl': {},
+}
+_lock = threading.Lock()
+
+# url -> path, bytes or exception already downloaded for the current context
+_prefetched = contextvars.ContextVar('prefetched', default=None)
+
+# cache key -> number of leased() blocks using the file, never evicted
+_leases = {}
+
+# keys leased by the innermost leased() block of the current context
+_lease_scope = contextvars.ContextVar('lease_scope', default=None)
+
+# (cached path, mtime) -> pinned link, kept until the process exits
+_pinned = {}
+_pin_dir = []
+
+
+def configure_cache(enabled=None, path=None, max_bytes=None, ttl=None):
+    """Configure the download cache used by all import functions
+
+    Args:
+        enabled (bool): turn the cache on or off, default on
+        path (str): directory for cached files if not nfl_data_py default,
+            False goes back to the default
+        max_bytes (int): disk budget, least recently used files are evicted beyond it
+        ttl (int or Dict[str, int]): seconds before a cached file is revalidated,
+            either for every dataset or per dataset name, False goes back to
+            the defaults
+    """
+
+    if enabled is not None:
+        _config['enabled'] = bool(enabled)
+
+    if path is False:
+        _config['path'] = None
+    elif path is not None:
+        _config['path'] = str(path)
+
+    if max_bytes is not None:
+        if max_bytes < 0:
+            raise ValueError('max_bytes must be non-negative.')
+        _config['max_bytes'] = int(max_bytes)
+
+    if ttl is False:
+        _config['ttl'] = {}
+    elif ttl is not None:
+        if isinstance(ttl, dict):
+            _config['ttl'].update(ttl)
+        else:
+            _config['ttl'] = {None: ttl}
+
+
+def cache_dir():
+    """Directory holding cached downloads
+
+    Returns:
+        str
+    """
+
+    if _config['path']:
+        return _config['path']
+
+    return os.path.join(appdirs.user_cache_dir('nfl_data_py', 'nflverse'), 'http')
+
+
+def cache_info():
+    """Describe the files currently held in the download cache
+
+    Returns:
+        DataFrame
+    """
+
+    cols = ['url', 'dataset', 'size', 'etag', 'last_modified', 'fetched', 'accessed']
+    entries = [meta for _, meta in __entries(cache_dir())]
+    df = pandas.DataFrame(entries, columns=cols)
+
+    for col in ('fetched', 'accessed'):
+        df[col] = pandas.to_datetime(df[col], unit='s')
+
+    return df.sort_values('accessed', ascending=False, ignore_index=True)
+
+
+def clear_cache(dataset=None):
+    """Remove cached downloads
+
+    Args:
+        dataset (str): only remove files of this dataset, default all
+    """
+
+    root = cache_dir()
+
+    with _lock:
+        for key, meta in __entries(root):
+            if dataset is None or meta.get('dataset') == dataset:
+                __remove(root, key, meta)
+
+
+def prune_cache(max_bytes=None, older_than=None):
+    """Shrink the download cache
+
+    Args:
+        max_bytes (int): remove least recently used files until the cache
+            fits, default the configured budget
+        older_than (int): first remove files not accessed for this many seconds
+    Returns:
+        int number of bytes removed
+    """
+
+    root = cache_dir()
+    budget = _config['max_bytes'] if max_bytes is None else max_bytes
+    cutoff = None if older_than is None else time.time() - older_than
+    removed = 0
+
+    with _lock:
+        entries = sorted(__entries(root), key=lambda x: x[1].get('accessed', 0))
+        total = sum(meta.get('size', 0) for _, meta in entries)
+
+        for key, meta in entries:
+            expired = cutoff is not None and meta.get('accessed', 0) < cutoff
+            if key in _leases or (not expired and total <= budget):
+                continue
+            __remove(root, key, meta)
+            total -= meta.get('size', 0)
+            removed += meta.get('size', 0)
+
+    return removed
+
+
+def verify_cache(remove=False):
+    """Check every cached file against its metadata and file format
+
+    Args:
+        remove (bool): remove the entries that fail the check
+    Returns:
+        DataFrame of url, dataset, size and problem, None for intact files
+    """
+
+    root = cache_dir()
+    rows = []
+
+    with _lock:
+        for key, meta in __entries(root):
+            problem = __problem(os.path.join(root, meta.get('file') or ''), meta)
+            if problem is not None and remove:
+                __remove(root, key, meta)
+            rows.append((meta.get('url'), meta.get('dataset'), meta.get('size'), problem))
+
+    return pandas.DataFrame(rows, columns=['url', 'dataset', 'size', 'problem'])
+
+
+def fetch(url, dataset=None, revalidate=False):
+    """Get the contents of url, from the disk cache when possible
+
+    Args:
+        url (str): location of the file
+        dataset (str): dataset name, selects the TTL applied to the file
+        revalidate (bool): check with the server even if the cached copy is
+            within its TTL, default False
+    Returns:
+        str path to the cached file, or a buffer when the cache is disabled
+    """
+
+    scope = _lease_scope.get()
+    if scope is not None:
+        # leased before the lookup, so the copy cannot go between here and the read
+        __lease(scope, url)
+
+    prefetched = _prefetched.get()
+    if prefetched and url in prefetched:
+        # the async API already reported its download
+        src = prefetched[url]
+        if isinstance(src, BaseException):
+            raise src
+        return io.BytesIO(src) if isinstance(src, bytes) else src
+
+    start = time.perf_counter()
+    src, status, size = __fetch(url, dataset, revalidate)
+    events.emit(
+        'fetch', url=url, dataset=dataset, cache=status, bytes=size,
+        seconds=time.perf_counter() - start
+    )
+    return src
+
+
+def __fetch(url, dataset, revalidate):
+    # (source, cache status, bytes downloaded) of fetch
+    local = local_path(url)
+    if local is not None:
+        # files of a local mirror are read in place
+        if not os.path.isfile(local):
+            raise HTTPError(url, 404, 'Not Found', {}, None)
+        return local, 'local', 0
+
+    if not _config['enabled']:
+        buf = io.BytesIO()
+        with __open(url) as resp:
+            shutil.copyfileobj(resp, buf, _CHUNK)
+        buf.seek(0)
+        return buf, 'disabled', buf.getbuffer().nbytes
+
+    path, fresh, headers = lookup(url, dataset, revalidate)
+    if fresh:
+        return path, 'hit', 0
+
+    try:
+        resp = __open(url, headers)
+    except URLError as e:
+        status = 'revalidated' if getattr(e, 'code', None) == 304 else 'stale'
+        return fallback(url, path, e), status, 0
+
+    with resp:
+        path = store(url, dataset, resp, resp.headers)
+    return path, 'miss', os.path.getsize(path)
+
+
+@contextlib.contextmanager
+def leased(urls=()):
+    """Keeps cached files from eviction while they are read
+
+    The files of urls, and of every url fetched inside the with block,
+    including on worker threads started with a copy of the context, stay in
+    the cache until the block exits. Blocks nest.
+
+    Args:
+        urls (Iterable[str]): files to lease before they are fetched, e.g.
+            downloads that finish outside the block's context
+    """
+
+    keys = []
+    token = _lease_scope.set(keys)
+    try:
+        for url in urls:
+            __lease(keys, url)
+        yield
+    finally:
+        _lease_scope.reset(token)
+        with _lock:
+            for key in keys:
+                _leases[key] -= 1
+                if not _leases[key]:
+                    del _leases[key]
+
+
+def pin(source):
+    """Keeps a cached file readable after it is evicted
+
+    Lazy readers (polars scans) open their files long after fetch returned
+    them. Files in the download cache are hard linked, or copied where links
+    are not supported, into a directory outside the cache that is removed
+    when the process exits. Anything else is returned unchanged.
+
+    Returns:
+        path of the pinned file, or source
+    """
+
+    if not isinstance(source, (str, os.PathLike)):
+        return source
+
+    path = os.path.abspath(source)
+    if os.path.dirname(path) != os.path.abspath(cache_dir()):
+        return source
+
+    with _lock:
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns)
+        if key not in _pinned:
+            if not _pin_dir:
+                _pin_dir.append(tempfile.mkdtemp(prefix='nfl_data_py-pinned-'))
+                atexit.register(shutil.rmtree, _pin_dir[0], True)
+            fd, pinned = tempfile.mkstemp(dir=_pin_dir[0], suffix=__suffix(path))
+            os.close(fd)
+            os.remove(pinned)
+            try:
+                os.link(path, pinned)
+            except OSError:
+                shutil.copyfile(path, pinned)
+            _pinned[key] = pinned
+
+    return _pinned[key]
+
+
+def lookup(url, dataset=None, revalidate=False):
+    """Finds the cached copy of url
+
+    Returns:
+        (path, fresh, headers) where path is None if nothing is cached, fresh
+        tells whether the copy is within its TTL and headers holds the
+        conditional request headers to revalidate it otherwise
+    """
+
+    root = cache_dir()
+    key = __key(url)
+    meta = __read_meta(root, key)
+    path = os.path.join(root, key + __suffix(url))
+
+    if meta is None or not os.path.exists(path):
+        return None, False, {}
+
+    # a recording transport only sees the files that are requested
+    fresh = not revalidate and not transport.recording()
+    if fresh and time.time() - meta['fetched'] < __ttl(dataset):
+        __touch(root, key, meta)
+        return path, True, {}
+
+    headers = {}
+    if meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+    if meta.get('last_modified'):
+        headers['If-Modified-Since'] = meta['last_modified']
+
+    return path, False, headers
+
+
+def fallback(url, path, error):
+    """Resolves a failed or conditional request against the cached copy at path
+
+    A 304 refreshes the cached copy. Server and network errors fall back to
+    the stale copy with a warning. Anything else is raised.
+    """
+
+    if path is None:
+        raise error
+
+    code = getattr(error, 'code', None)
+
+    if code == 304:
+        root, key = cache_dir(), __key(url)
+        meta = __read_meta(root, key)
+        meta['fetched'] = time.time()
+        __touch(root, key, meta)
+        return path
+
+    if code is not None and code < 500:
+        raise error
+
+    warn(f'Serving stale cached copy of {url}: {error}', stacklevel=4)
+    return path
+
+
+def open_partial():
+    """Opens a temporary file in the cache directory for a body being received
+
+    Returns:
+        (binary file object, path), the path is passed to store() once the
+        body is complete, or removed by the caller if the download fails
+    """
+
+    root = cache_dir()
+    os.makedirs(root, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=root, suffix='.part')
+    return os.fdopen(fd, 'wb'), tmp
+
+
+def store(url, dataset, stream, headers):
+    """Writes the response body in stream to the cache
+
+    Args:
+        url (str): location the body was downloaded from
+        dataset (str): dataset name of the file
+        stream: file-like object holding the body, or the path of a complete
+            body written to a file from open_partial()
+        headers: response headers, used for later revalidation
+    Returns:
+        str path to the cached file
+    """
+
+    root = cache_dir()
+    key = __key(url)
+    path = os.path.join(root, key + __suffix(url))
+
+    if isinstance(stream, str):
+        tmp = stream
+    else:
+        f, tmp = open_partial()
+        try:
+            with f:
+                shutil.copyfileobj(stream, f, _CHUNK)
+        except BaseException:
+            os.remove(tmp)
+            raise
+
+    try:
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+    now = time.time()
+    meta = {
+        'url': url,
+        'dataset': dataset,
+        'file': os.path.basename(path),
+        'size': os.path.getsize(path),
+        'etag': headers.get('ETag'),
+        'last_modified': headers.get('Last-Modified'),
+        'fetched': now,
+        'accessed': now,
+    }
+
+    __write_meta(root, key, meta)
+    __evict(root, keep=key)
+
+    return path
+
+
+def remote_fingerprint(url):
+    """Identifies the current upstream version of url without downloading it
+
+    Returns:
+        Dict of etag, last_modified and size, or None when the server sends
+        neither an ETag nor a Last-Modified date
+    Raises:
+        HTTPError: e.g. 404 when the file is not published
+    """
+
+    local = local_path(url)
+    if local is not None:
+        try:
+            stat = os.stat(local)
+        except FileNotFoundError:
+            raise HTTPError(url, 404, 'Not Found', {}, None)
+        return {'etag': None, 'last_modified': stat.st_mtime_ns, 'size': stat.st_size}
+
+    with transport.request(url, method='HEAD') as resp:
+        headers = resp.headers
+
+    if not headers.get('ETag') and not headers.get('Last-Modified'):
+        return None
+
+    return {
+        'etag': headers.get('ETag'),
+        'last_modified': headers.get('Last-Modified'),
+        'size': headers.get('Content-Length'),
+    }
+
+
+def local_path(url):
+    """Filesystem path of url if it is a local path or file URL, else None"""
+
+    parsed = urlparse(url)
+    if parsed.scheme == 'file':
+        return urllib.request.url2pathname(parsed.path)
+    if parsed.scheme in ('http', 'https', 'ftp'):
+        return None
+    return url
+
+
+def __key(url):
+    return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+
+def __lease(keys, url):
+    key = __key(url)
+    with _lock:
+        _leases[key] = _leases.get(key, 0) + 1
+        keys.append(key)
+
+
+def __open(url, headers=None):
+    return transport.request(url, headers)
+
+
+def __ttl(dataset):
+    ttl = _config['ttl']
+
+    if dataset in ttl:
+        return ttl[dataset]
+    if None in ttl:
+        return ttl[None]
+
+    return DATASET_TTL.get(dataset, DEFAULT_TTL)
+
+
+def __suffix(url):
+    # keep the extension so readers can still infer compression from the path
+    name = posixpath.basename(urlparse(url).path)
+    suffix = name[name.find('.'):] if '.' in name else ''
+
+    return suffix if len(suffix) <= 16 else ''
+
+
+def __read_meta(root, key):
+    try:
+        with open(os.path.join(root, key + '.json')) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def __write_meta(root, key, meta):
+    fd, tmp = tempfile.mkstemp(dir=root, suffix='.part')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(meta, f)
+    os.replace(tmp, os.path.join(root, key + '.json'))
+
+
+def __problem(path, meta):
+    """Why the cached file at path is unusable, None if it looks intact"""
+
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return 'file is missing'
+
+    if size != meta.get('size'):
+        return 'size does not match the download'
+
+    # parquet files start and end with PAR1, gzip files start with 1f 8b
+    with open(path, 'rb') as f:
+        head = f.read(4)
+        f.seek(max(size - 4, 0))
+        tail = f.read(4)
+
+    if path.endswith('.parquet') and (head != b'PAR1' or tail != b'PAR1'):
+        return 'not a complete parquet file'
+    if path.endswith('.gz') and head[:2] != b'\x1f\x8b':
+        return 'not a gzip file'
+
+    return None
+
+
+def __touch(root, key, meta):
+    meta['accessed'] = time.time()
+    try:
+        __write_meta(root, key, meta)
+    except OSError:
+        pass
+
+
+def __entries(root):
+    if not os.path.isdir(root):
+        return []
+
+    entries = []
+    for fname in os.listdir(root):
+        if fname.endswith('.json'):
+            key = fname[:-len('.json')]
+            meta = __read_meta(root, key)
+            if meta is not None:
+                entries.append((key, meta))
+
+    return entries
+
+
+def __remove(root, key, meta):
+    for fname in (meta.get('file'), key + '.json'):
+        if fname:
+            try:
+                os.remove(os.path.join(root, fname))
+            except FileNotFoundError:
+                pass
+
+
+def __evict(root, keep):
+    with _lock:
+        entries = sorted(__entries(root), key=lambda x: x[1].get('accessed', 0))
+        total = sum(meta.get('size', 0) for _, meta in entries)
+
+        for key, meta in entries:
+            if total <= _config['max_bytes']:
+                break
+            # leased files are still being read, the budget is enforced
+            # again on the next store
+            if key == keep or key in _leases:
+                continue
+            __remove(root, key, meta)
+            total -= meta.get('size', 0)
@@ -0,0 +1,268 @@
+"""
+Replacement tables behind clean_nfl_data
+
+Every column with a replacement table gets a compiled lookup: a hashed index
+of the values to replace and an array of their replacements. A column is
+factorized once and only its distinct values are looked up, so a whole
+column is remapped with one take. Categorical columns only have their
+categories remapped. Object columns without a table are scanned once for
+'NA' strings, all other columns are left untouched.
+
+Tables can be extended for the whole process with register(), or for a
+single call through the replacements argument of clean().
+"""
+import threading
+
+import numpy
+import pandas
+from pandas.api.types import is_object_dtype
+
+# strings that stand for a missing value in object columns
+NA_VALUES = ('NA',)
+
+NAMES = {
+    'Gary Jennings Jr': 'Gary Jennings',
+    'DJ Chark': 'D.J. Chark',
+    'Cedrick Wilson Jr.': 'Cedrick Wilson',
+    'Deangelo Yancey': 'DeAngelo Yancey',
+    'Ardarius Stewart': 'ArDarius Stewart',
+    'Calvin Johnson  HOF': 'Calvin Johnson',
+    'Mike Sims-Walker': 'Mike Walker',
+    'Kenneth Moore': 'Kenny Moore',
+    'Devante Parker': 'DeVante Parker',
+    'Brandon Lafell': 'Brandon LaFell',
+    'Desean Jackson': 'DeSean Jackson',
+    'Deandre Hopkins': 'DeAndre Hopkins',
+    'Deandre Smelter': 'DeAndre Smelter',
+    'William Fuller': 'Will Fuller',
+    'Lavon Brazill': 'LaVon Brazill',
+    'Devier Posey': 'DeVier Posey',
+    'Demarco Sampson': 'DeMarco Sampson',
+    'Deandrew Rubin': 'DeAndrew Rubin',
+    'Latarence Dunbar': 'LaTarence Dunbar',
+    'Jajuan Dawson': 'JaJuan Dawson',
+    "Andre' Davis": 'Andre Davis',
+    'Johnathan Holland': 'Jonathan Holland',
+    'Johnnie Lee Higgins Jr.': 'Johnnie Lee Higgins',
+    'Marquis Walker': 'Marquise Walker',
+    'William Franklin': 'Will Franklin',
+    'Ted Ginn Jr.': 'Ted Ginn',
+    'Jonathan Baldwin': 'Jon Baldwin',
+    'T.J. Graham': 'Trevor Graham',
+    'Odell Beckham Jr.': 'Odell Beckham',
+    'Michael Pittman Jr.': 'Michael Pittman',
+    'DK Metcalf': 'D.K. Metcalf',
+    'JJ Arcega-Whiteside': 'J.J. Arcega-Whiteside',
+    'Lynn Bowden Jr.': 'Lynn Bowden',
+    'Laviska Shenault Jr.': 'Laviska Shenault',
+    'Henry Ruggs III': 'Henry Ruggs',
+    'KJ Hamler': 'K.J. Hamler',
+    'KJ Osborn': 'K.J. Osborn',
+    'Devonta Smith': 'DeVonta Smith',
+    'Terrace Marshall Jr.': 'Terrace Marshall',
+    "Ja'Marr Chase": 'JaMarr Chase',
+}
+
+COLLEGE_TEAMS = {
+    'Ole Miss': 'Mississippi',
+    'Texas Christian': 'TCU',
+    'Central Florida': 'UCF',
+    'Bowling Green State': 'Bowling Green',
+    'West. Michigan': 'Western Michigan',
+    'Pitt': 'Pittsburgh',
+    'Brigham Young': 'BYU',
+    'Texas-El Paso': 'UTEP',
+    'East. Michigan': 'Eastern Michigan',
+    'Middle Tenn. State': 'Middle Tennessee State',
+    'Southern Miss': 'Southern Mississippi',
+    'Louisiana State': 'LSU',
+}
+
+# column -> {value: replacement}
+_tables = {'name': dict(NAMES), 'col_team': dict(COLLEGE_TEAMS)}
+_compiled = {}
+_lock = threading.Lock()
+
+
+class Replacements:
+    """A replacement table compiled for vectorized lookups
+
+    Attributes:
+        keys (pandas.Index): hashed values to replace
+        values (numpy.ndarray): replacement of each key
+    """
+
+    def __init__(self, mapping):
+        self.keys = pandas.Index(list(mapping), dtype=object)
+        self.values = numpy.empty(len(mapping), dtype=object)
+        self.values[:] = list(mapping.values())
+
+    def apply(self, uniques):
+        """Replaces distinct values
+
+        Args:
+            uniques (array-like): distinct values of a column
+        Returns:
+            (numpy object array of the replaced values, bool whether any changed)
+        """
+
+        uniques = numpy.asarray(uniques, dtype=object)
+        pos = self.keys.get_indexer(uniques)
+        found = pos >= 0
+        if not found.any():
+            return uniques, False
+
+        replaced = uniques.copy()
+        replaced[found] = self.values[pos[found]]
+        return replaced, True
+
+    def replace(self, col):
+        """col with its values replaced, or None if nothing matched"""
+
+        if isinstance(col.dtype, pandas.CategoricalDtype):
+            categories, changed = self.apply(col.cat.categories)
+            if not changed:
+                return None
+
+            # replacements may merge categories or make them missing
+            remap, merged = pandas.factorize(categories)
+            codes = col.cat.codes.to_numpy()
+            codes = numpy.where(codes >= 0, numpy.append(remap, -1)[codes], -1)
+            result = pandas.Categorical.from_codes(
+                codes, pandas.Index(merged), ordered=col.cat.ordered
+            )
+            return pandas.Series(result, index=col.index, name=col.name)
+
+        values = self.map(col)
+        if values is None:
+            return None
+
+        result = pandas.Series(values, index=col.index, name=col.name)
+        if col.dtype != object:
+            try:
+                return result.astype(col.dtype)
+            except (TypeError, ValueError):
+                pass
+        return result.infer_objects()
+
+    def map(self, values):
+        """Replaced values as an object array, or None if nothing matched"""
+
+        codes, uniques = pandas.factorize(values)
+        uniques, changed = self.apply(uniques)
+        if not changed:
+            return None
+
+        # position -1 picks the appended missing value
+        return numpy.append(uniques, numpy.nan)[codes]
+
+
+def register(column, mapping):
+    """Adds replacements that clean_nfl_data applies to column
+
+    Args:
+        column (str): column name, e.g. 'name'
+        mapping (Dict): value -> replacement, extends any existing table
+    """
+
+    with _lock:
+        _tables[column] = {**_tables.get(column, {}), **mapping}
+        _compiled.clear()
+
+
+def tables():
+    """Copy of the registered replacement tables, by column"""
+
+    with _lock:
+        return {col: dict(mapping) for col, mapping in _tables.items()}
+
+
+def compiled(column, extra=None, na=False):
+    """Compiled table of column
+
+    Args:
+        column (str): column name
+        extra (Dict): replacements of this call only, applied after the table
+        na (bool): also map NA strings to missing values
+    Returns:
+        Replacements, or None if the column has nothing to replace
+    """
+
+    nas = {value: numpy.nan for value in NA_VALUES} if na else {}
+    if extra:
+        with _lock:
+            base = _tables.get(column, {})
+        return Replacements({**nas, **base, **extra})
+
+    with _lock:
+        table = _compiled.get((column, na))
+        if table is None and column in _tables:
+            table = _compiled[column, na] = Replacements({**nas, **_tables[column]})
+    return table
+
+
+def clean(df, replacements=None):
+    """Applies the replacement tables and NA strings to df in place
+
+    Args:
+        df (DataFrame): DataFrame to be cleaned
+        replacements (Dict[str, Dict]): column -> {value: replacement}, extra
+            replacements for this call
+    Returns:
+        DataFrame, the same object as df
+    """
+
+    replacements = replacements or {}
+    updates = {}
+
+    for col, dtype in list(df.dtypes.items()):
+        # NA strings are only replaced in object columns, as they always were
+        is_object = is_object_dtype(dtype)
+        table = compiled(col, replacements.get(col), na=is_object)
+        if is_object:
+            values = df[col].to_numpy()
+            replaced = __replace_na(values) if table is None else table.map(values)
+            if replaced is not None:
+                updates[col] = replaced
+        elif table is not None:
+            result = table.replace(df[col])
+            if result is not None:
+                df[col] = result
+
+    __store(df, updates)
+    return df
+
+
+def __replace_na(values):
+    """Object array of values with NA strings replaced, None if there are none"""
+
+    missing = values == NA_VALUES[0]
+    for na in NA_VALUES[1:]:
+        missing |= values == na
+    if missing.any():
+        return numpy.where(missing, numpy.nan, values)
+    return None
+
+
+def __store(df, updates):
+    """Stores the replaced values of object columns in one assignment
+
+    Assigning the columns one at a time would split the frame's object block
+    once per column.
+
+    Args:
+        updates (Dict[str, numpy.ndarray]): column -> object array of its new values
+    """
+
+    if not updates:
+        return
+
+    batch = pandas.DataFrame(updates, index=df.index, copy=False).infer_objects()
+
+    # columns left without any strings change dtype and need blocks of their own
+    for col, dtype in list(batch.dtypes.items()):
+        if not is_object_dtype(dtype):
+            df[col] = batch.pop(col)
+
+    if len(batch.columns):
+        df.loc[:, list(batch.columns)] = batch
@@ -0,0 +1,265 @@
+"""
+nfl-data command line tool for managing the nfl_data_py caches
+
+    nfl-data warm --datasets pbp player_stats --years 2022 2023 --workers 16
+    nfl-data warm --pbp-cache --years 2023
+    nfl-data status
+    nfl-data prune --older-than 30
+    nfl-data verify --remove
+
+warm downloads files into the download cache, and with --pbp-cache also
+rebuilds seasons of the local pbp cache, on a pool of --workers threads. It
+reports throughput and exits with status 1 if any file failed, so cron jobs
+can warm the caches ahead of the runs that read them.
+"""
+import os
+import sys
+import time
+import argparse
+import datetime
+from urllib.error import HTTPError
+
+import pandas
+
+import nfl_data_py as nfl
+from nfl_data_py import cache, mirror, pbp_cache, sources
+from nfl_data_py.parallel import map_ordered
+
+FIRST_SEASON = 1999
+MB = 1024 ** 2
+
+
+def current_season(today=None):
+    """Latest season that has started, seasons start in September"""
+
+    today = today or datetime.date.today()
+    return today.year if today.month >= 9 else today.year - 1
+
+
+def warm(datasets=None, years=None, workers=None, revalidate=False):
+    """Downloads files into the download cache
+
+    Args:
+        datasets (List[str]): keys of sources.URLS, default all
+        years (List[int]): seasons of the datasets split by season, default all
+        workers (int): concurrent downloads
+        revalidate (bool): check every cached file with the server
+    Returns:
+        DataFrame with the dataset, url, status ('downloaded', 'cached',
+        'local', 'missing' or 'failed'), bytes, seconds and error of every file
+    """
+
+    if years is None:
+        years = range(FIRST_SEASON, current_season() + 1)
+
+    items = [
+        (dataset, sources.url(dataset, **params))
+        for dataset, params in mirror.files(datasets, years)
+    ]
+
+    # __warm_file reports failures in its row instead of raising them
+    rows = map_ordered(lambda item: __warm_file(*item, revalidate), items, max_workers=workers)
+
+    cols = ['dataset', 'url', 'status', 'bytes', 'seconds', 'error']
+    return pandas.DataFrame(rows, columns=cols)
+
+
+def warm_pbp(years, workers=None, path=None):
+    """Rebuilds seasons of the local pbp cache whose upstream files changed
+
+    Returns:
+        DataFrame with the year, status ('cached', 'up to date' or 'failed'),
+        bytes, seconds and error of every season, as returned by cache_pbp
+    """
+
+    # cache_pbp reports failed seasons in its rows instead of raising them
+    reports = map_ordered(
+        lambda year: nfl.cache_pbp([year], alt_path=path, thread_requests=False),
+        years, max_workers=workers
+    )
+    return pandas.concat(reports, ignore_index=True)
+
+
+def __warm_file(dataset, url, revalidate):
+    start = time.time()
+    path = cache.local_path(url)
+    if path is not None:
+        # files of a local mirror are read in place, there is nothing to warm
+        status = 'local' if os.path.isfile(path) else 'missing'
+        return dataset, url, status, 0, time.time() - start, None
+
+    before, fresh, _ = cache.lookup(url, dataset, revalidate)
+    if fresh:
+        return dataset, url, 'cached', 0, time.time() - start, None
+    stamp = __stamp(before)
+
+    try:
+        path = cache.fetch(url, dataset, revalidate=revalidate)
+    except HTTPError as e:
+        status = 'missing' if e.code == 404 else 'failed'
+        return dataset, url, status, 0, time.time() - start, None if e.code == 404 else str(e)
+    except Exception as e:
+        return dataset, url, 'failed', 0, time.time() - start, str(e)
+
+    if isinstance(path, (str, os.PathLike)) and __stamp(path) != stamp:
+        return dataset, url, 'downloaded', os.path.getsize(path), time.time() - start, None
+
+    return dataset, url, 'cached', 0, time.time() - start, None
+
+
+def __stamp(path):
+    try:
+        stat = os.stat(path)
+    except (OSError, TypeError):
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def __throughput(report, seconds):
+    moved = report['bytes'].sum()
+    counts = report['status'].value_counts()
+    summary = ', '.join(f'{n} {status}' for status, n in counts.items())
+    return (
+        f'{len(report)} files ({summary}) in {seconds:.1f}s: '
+        f'{moved / MB:.1f} MB, {moved / MB / seconds:.2f} MB/s, {len(report) / seconds:.2f} files/s'
+    )
+
+
+def __years(args):
+    return list(args.years or range(FIRST_SEASON, current_season() + 1))
+
+
+def __cmd_warm(args):
+    failed = 0
+    if not args.pbp_only:
+        start = time.time()
+        report = warm(args.datasets, __years(args), args.workers, args.revalidate)
+        print(__throughput(report, max(time.time() - start, 1e-9)))
+        for row in report[report.status == 'failed'].itertuples():
+            print(f'failed {row.url}: {row.error}', file=sys.stderr)
+        failed += int((report.status == 'failed').sum())
+
+    if args.pbp_cache or args.pbp_only:
+        start = time.time()
+        report = warm_pbp(__years(args), args.workers, args.path)
+        seconds = max(time.time() - start, 1e-9)
+        moved = report['bytes'].sum()
+        print(
+            f'pbp cache: {len(report)} seasons in {seconds:.1f}s, '
+            f'{moved / MB:.1f} MB, {moved / MB / seconds:.2f} MB/s, {len(report) / seconds:.2f} seasons/s'
+        )
+        for row in report[report.status == 'failed'].itertuples():
+            print(f'failed pbp cache {row.year}: {row.error}', file=sys.stderr)
+        failed += int((report.status == 'failed').sum())
+
+    return 1 if failed else 0
+
+
+def __cmd_status(args):
+    info = nfl.cache_info()
+    print(f'download cache: {cache.cache_dir()}')
+    if info.empty:
+        print('  empty')
+    else:
+        summary = info.groupby('dataset', dropna=False).agg(
+            files=('url', 'size'), mb=('size', 'sum'), fetched=('fetched', 'max')
+        )
+        summary['mb'] = (summary['mb'] / MB).round(1)
+        print(summary.to_string())
+        print(f'  total {len(info)} files, {info["size"].sum() / MB:.1f} MB')
+
+    root = args.path or pbp_cache.default_dir()
+    manifest = pbp_cache.read_manifest(root) or {}
+    print(f'pbp cache: {root}')
+    if not manifest:
+        print('  empty')
+    for year in sorted(manifest):
+        entry = manifest[year]
+        problem = pbp_cache.problem(root, entry)
+        detail = problem or f'{entry.get("rows", 0)} rows, {entry.get("size", 0) / MB:.1f} MB'
+        print(f'  {year}: {detail}')
+
+    mirror_at = sources.sources_info()['mirror']
+    if mirror_at:
+        print(f'mirror: {mirror_at}')
+
+    return 0
+
+
+def __cmd_prune(args):
+    older_than = args.older_than * 24 * 60 * 60 if args.older_than is not None else None
+    max_bytes = int(args.max_mb * MB) if args.max_mb is not None else None
+    removed = cache.prune_cache(max_bytes, older_than)
+    print(f'removed {removed / MB:.1f} MB from the download cache')
+    return 0
+
+
+def __cmd_verify(args):
+    report = cache.verify_cache(remove=args.remove)
+    broken = report[report.problem.notna()]
+    for row in broken.itertuples():
+        print(f'{"removed" if args.remove else "broken"} {row.url}: {row.problem}', file=sys.stderr)
+
+    root = args.path or pbp_cache.default_dir()
+    bad = 0
+    for year, entry in sorted((pbp_cache.read_manifest(root) or {}).items()):
+        problem = pbp_cache.problem(root, entry)
+        if problem is not None:
+            bad += 1
+            print(f'broken pbp cache {year}: {problem}', file=sys.stderr)
+
+    print(f'{len(report) - len(broken)} of {len(report)} cached files intact, {bad} broken pbp seasons')
+    return 1 if (len(broken) and not args.remove) or bad else 0
+
+
+def parser():
+    """Argument parser of the nfl-data command"""
+
+    root = argparse.ArgumentParser(prog='nfl-data', description=__doc__.split('\n')[1])
+    root.add_argument('--cache-dir', help='download cache directory if not the default')
+    root.add_argument('--mirror', help='local directory or URL to read files from')
+    commands = root.add_subparsers(dest='command', required=True)
+
+    cmd = commands.add_parser('warm', help='download files into the caches')
+    cmd.add_argument('--datasets', nargs='+', choices=sorted(sources.URLS), metavar='DATASET')
+    cmd.add_argument('--years', nargs='+', type=int, help='seasons, default all')
+    cmd.add_argument('--workers', type=int, help='concurrent downloads')
+    cmd.add_argument('--revalidate', action='store_true', help='check cached files with the server')
+    cmd.add_argument('--pbp-cache', action='store_true', help='also rebuild the local pbp cache')
+    cmd.add_argument('--pbp-only', action='store_true', help='only rebuild the local pbp cache')
+    cmd.add_argument('--path', help='local pbp cache directory if not the default')
+    cmd.set_defaults(run=__cmd_warm)
+
+    cmd = commands.add_parser('status', help='summarize the caches')
+    cmd.add_argument('--path', help='local pbp cache directory if not the default')
+    cmd.set_defaults(run=__cmd_status)
+
+    cmd = commands.add_parser('prune', help='shrink the download cache')
+    cmd.add_argument('--older-than', type=float, metavar='DAYS', help='remove files unused for DAYS')
+    cmd.add_argument('--max-mb', type=float, help='size to shrink to, default the cache budget')
+    cmd.set_defaults(run=__cmd_prune)
+
+    cmd = commands.add_parser('verify', help='check cached files for corruption')
+    cmd.add_argument('--remove', action='store_true', help='remove broken files')
+    cmd.add_argument('--path', help='local pbp cache directory if not the default')
+    cmd.set_defaults(run=__cmd_verify)
+
+    return root
+
+
+def main(argv=None):
+    args = parser().parse_args(argv)
+
+    if args.cache_dir:
+        nfl.configure_cache(path=args.cache_dir)
+    if args.mirror:
+        nfl.configure_sources(mirror=args.mirror)
+    if getattr(args, 'workers', None) is not None and args.workers < 1:
+        print('--workers must be at least 1', file=sys.stderr)
+        return 2
+
+    return args.run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,125 @@
+"""
+Structured events emitted while the loaders fetch and build frames
+
+Every stage of a load reports one event, a dict with a 'stage' key and the
+fields below, to the registered hooks and as a record of the 'nfl_data_py'
+logger, with the fields set as attributes of the record:
+
+    fetch     url, dataset, cache, bytes, seconds
+    decode    url, dataset, rows, seconds (year for pbp seasons)
+    merge     dataset, rows, seconds (year when one season is merged)
+    downcast  dataset, rows, seconds (year when one season is downcast)
+    compact   dataset, before, after (bytes)
+    done      dataset, year, rows or status
+    error     dataset, year, error
+
+cache is 'hit', 'miss', 'revalidated' (304), 'stale' (served after an error),
+'local' (mirror file read in place) or 'disabled'. bytes counts what came over
+the network. fetch, decode, merge and downcast are logged at DEBUG, compact
+and done at INFO and error at WARNING.
+
+    with nfl.collect_events() as events:
+        nfl.import_pbp_data([2022, 2023])
+    pandas.DataFrame(events).groupby(['stage', 'dataset']).seconds.sum()
+"""
+import time
+import logging
+import threading
+import contextlib
+
+logger = logging.getLogger('nfl_data_py')
+
+LEVELS = {
+    'fetch': logging.DEBUG,
+    'decode': logging.DEBUG,
+    'merge': logging.DEBUG,
+    'downcast': logging.DEBUG,
+    'compact': logging.INFO,
+    'done': logging.INFO,
+    'error': logging.WARNING,
+}
+
+_hooks = []
+_lock = threading.Lock()
+
+
+def add_event_hook(hook):
+    """Call hook with every event emitted by the loaders
+
+    Hooks run on the thread that loads the file, so they should be quick and
+    thread safe. Exceptions raised by a hook propagate into the load.
+
+    Args:
+        hook (Callable): function taking the event dict
+    """
+
+    with _lock:
+        _hooks.append(hook)
+
+
+def remove_event_hook(hook):
+    """Stop calling a hook registered with add_event_hook"""
+
+    with _lock:
+        if hook in _hooks:
+            _hooks.remove(hook)
+
+
+@contextlib.contextmanager
+def collect_events():
+    """Collects the events emitted inside the with block
+
+    Yields:
+        List the events are appended to
+    """
+
+    events = []
+    add_event_hook(events.append)
+    try:
+        yield events
+    finally:
+        remove_event_hook(events.append)
+
+
+def emit(stage, **fields):
+    """Sends one event to the hooks and the logger"""
+
+    level = LEVELS.get(stage, logging.DEBUG)
+    hooks = list(_hooks)
+    if not hooks and not logger.isEnabledFor(level):
+        return
+
+    event = dict(stage=stage, **fields)
+    for hook in hooks:
+        hook(event)
+
+    if logger.isEnabledFor(level):
+        logger.log(level, __message(event), extra=event)
+
+
+@contextlib.contextmanager
+def timed(stage, **fields):
+    """Emits an event with the seconds spent inside the with block
+
+    Yields:
+        Dict of the event fields, for the caller to add e.g. rows
+    """
+
+    start = time.perf_counter()
+    yield fields
+    fields['seconds'] = time.perf_counter() - start
+    emit(stage, **fields)
+
+
+def __message(event):
+    if event['stage'] == 'error':
+        return f'Data not available for {event.get("dataset")} {event.get("year")}: {event.get("error")}'
+
+    parts = [event['stage']]
+    for key, value in event.items():
+        if key == 'stage' or value is None:
+            continue
+        if isinstance(value, float):
+            value = f'{value:.4f}'
+        parts.append(f'{key}={value}')
+    return ' '.join(parts)
@@ -0,0 +1,169 @@
+"""
+In-process memoization of loaded frames
+
+Opt-in layer for long-lived workers that call the same import functions many
+times. Results are keyed by function, normalized arguments and the configured
+sources and transport, so a call made after switching to a mirror or to replay
+loads again. They are held up to a memory budget measured with
+memory_usage(deep=True), and evicted least recently used first. Callers always
+receive a copy, so mutating a returned frame never alters what is cached.
+"""
+import time
+import inspect
+import functools
+import threading
+from collections import OrderedDict
+
+from nfl_data_py import sources, transport
+
+DEFAULT_MAX_BYTES = 1024 ** 3
+
+_config = {
+    'enabled': False,
+    'max_bytes': DEFAULT_MAX_BYTES,
+    'ttl': None,
+}
+_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+_entries = OrderedDict()
+_lock = threading.Lock()
+
+
+def enable_memory_cache(max_bytes=DEFAULT_MAX_BYTES, ttl=None):
+    """Keep results of import functions in memory for reuse within this process
+
+    Args:
+        max_bytes (int): memory budget, least recently used results are dropped beyond it
+        ttl (int): seconds a result may be reused before it is loaded again, default no limit
+    """
+
+    if max_bytes < 0:
+        raise ValueError('max_bytes must be non-negative.')
+
+    with _lock:
+        _config.update(enabled=True, max_bytes=int(max_bytes), ttl=ttl)
+        __evict()
+
+
+def disable_memory_cache():
+    """Stop memoizing import functions and release cached results"""
+
+    _config['enabled'] = False
+    clear_memory_cache()
+
+
+def clear_memory_cache():
+    """Release cached results and reset hit/miss counters"""
+
+    with _lock:
+        _entries.clear()
+        _stats.update(hits=0, misses=0, evictions=0)
+
+
+def memory_cache_info():
+    """Describe the in-memory cache
+
+    Returns:
+        dict
+    """
+
+    with _lock:
+        return {
+            'enabled': _config['enabled'],
+            'hits': _stats['hits'],
+            'misses': _stats['misses'],
+            'evictions': _stats['evictions'],
+            'entries': len(_entries),
+            'bytes': sum(size for _, size, _ in _entries.values()),
+            'max_bytes': _config['max_bytes'],
+        }
+
+
+def memoize(func=None, bypass=()):
+    """Decorates an import function so its results go through the memory cache
+
+    Args:
+        bypass (Iterable[str]): arguments with side effects, calls passing any
+            of them other than None always run the function
+    """
+
+    if func is None:
+        return functools.partial(memoize, bypass=tuple(bypass))
+
+    sig = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _config['enabled']:
+            return func(*args, **kwargs)
+
+        try:
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if any(bound.arguments[name] is not None for name in bypass):
+                return func(*args, **kwargs)
+            key = (func.__qualname__, __normalize(bound.arguments), __origin())
+            hash(key)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        with _lock:
+            entry = _entries.get(key)
+            ttl = _config['ttl']
+            if entry is not None and (ttl is None or time.time() - entry[2] < ttl):
+                _entries.move_to_end(key)
+                _stats['hits'] += 1
+                return __copy(entry[0])
+            _stats['misses'] += 1
+
+        value = func(*args, **kwargs)
+        size = __size(value)
+
+        if size is not None and size <= _config['max_bytes']:
+            with _lock:
+                _entries[key] = (value, size, time.time())
+                _entries.move_to_end(key)
+                __evict()
+
+        return __copy(value)
+
+    return wrapper
+
+
+def __normalize(value):
+    # make equivalent arguments hash alike, e.g. [2020, 2021] and range(2020, 2022)
+    if isinstance(value, dict):
+        return tuple(sorted((k, __normalize(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, range)):
+        return tuple(__normalize(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(__normalize(v) for v in value))
+    return value
+
+
+def __origin():
+    # where files are read from, results loaded elsewhere are not reused
+    return __normalize(sources.sources_info()), __normalize(transport.transport_info())
+
+
+def __size(value):
+    usage = getattr(value, 'memory_usage', None)
+    if usage is None:
+        # arrow tables are immutable, so they are cached without copies
+        nbytes = getattr(value, 'nbytes', None)
+        return int(nbytes) if nbytes is not None else None
+
+    size = usage(deep=True)
+    return int(size.sum()) if hasattr(size, 'sum') else int(size)
+
+
+def __copy(value):
+    return value.copy() if hasattr(value, 'copy') else value
+
+
+def __evict():
+    total = sum(size for _, size, _ in _entries.values())
+
+    while _entries and total > _config['max_bytes']:
+        _, (_, size, _) = _entries.popitem(last=False)
+        total -= size
+        _stats['evictions'] += 1
@@ -0,0 +1,117 @@
+"""
+Local copies of the upstream files behind every import function
+
+sync_mirror() downloads files from their upstream sources into a directory
+laid out as <root>/<base name>/<path>, the layout configure_sources(mirror=...)
+reads from. Point the mirror at that directory, or serve it over HTTP, and
+import functions read from local disk or the LAN instead of GitHub.
+
+Files already in the mirror are only downloaded again if upstream has a newer
+version: every request carries the If-Modified-Since date of the local copy,
+and a downloaded file takes its upstream Last-Modified date as mtime.
+"""
+import os
+import time
+import shutil
+import tempfile
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.error import HTTPError
+
+import pandas
+
+from nfl_data_py import sources, transport
+from nfl_data_py.parallel import map_ordered
+
+_CHUNK = 1024 * 1024
+
+
+def files(datasets=None, years=None):
+    """Files of the given datasets and seasons
+
+    Args:
+        datasets (List[str]): keys of sources.URLS, default all
+        years (List[int]): seasons of the datasets split by season. Without
+            years those datasets are left out
+    Returns:
+        List of (dataset, params) tuples, one per file
+    """
+
+    datasets = list(sources.URLS) if datasets is None else list(datasets)
+    unknown = [d for d in datasets if d not in sources.URLS]
+    if unknown:
+        raise ValueError(f'Unknown datasets {", ".join(unknown)}.')
+
+    out = []
+    for dataset in datasets:
+        combos = [{}]
+        for field in sources.placeholders(dataset):
+            values = list(years or []) if field == 'year' else sources.PARAMS[field]
+            combos = [{**combo, field: value} for combo in combos for value in values]
+        out.extend((dataset, params) for params in combos)
+
+    return out
+
+
+def sync_mirror(datasets=None, years=None, path=None, thread_requests=True, max_workers=None):
+    """Downloads upstream files into a local mirror
+
+    Args:
+        datasets (List[str]): datasets to mirror, keys of sources.URLS, default all
+        years (List[int]): seasons to mirror of the datasets split by season
+        path (str): mirror directory, default the local mirror set with
+            configure_sources
+        thread_requests (bool): download files concurrently, default True
+        max_workers (int): bound on concurrent downloads
+    Returns:
+        DataFrame with the dataset, url, path, status ('downloaded',
+        'unchanged' or 'missing'), size and seconds of every file
+    """
+
+    if path is None:
+        path = sources.sources_info()['mirror']
+        if path is None or sources.is_remote(path):
+            raise ValueError('path is required unless a local mirror is configured.')
+
+    todo = []
+    for dataset, params in files(datasets, years):
+        name, rel = sources.split(dataset, **params)
+        if name is None:
+            raise ValueError(f'{dataset} is not hosted under any of sources.BASES.')
+        dest = sources.join(os.fspath(path), f'{name}/{rel}')
+        todo.append((dataset, sources.upstream_url(dataset, **params), dest))
+
+    report = map_ordered(lambda item: __sync_file(*item), todo, thread_requests, max_workers)
+    cols = ['dataset', 'url', 'path', 'status', 'size', 'seconds']
+    return pandas.DataFrame(report, columns=cols)
+
+
+def __sync_file(dataset, url, dest):
+    start = time.time()
+    headers = {}
+    if os.path.exists(dest):
+        headers['If-Modified-Since'] = formatdate(os.path.getmtime(dest), usegmt=True)
+
+    try:
+        resp = transport.request(url, headers)
+    except HTTPError as e:
+        if e.code not in (304, 404):
+            raise
+        status = 'unchanged' if e.code == 304 else 'missing'
+        size = os.path.getsize(dest) if status == 'unchanged' else 0
+        return dataset, url, dest, status, size, time.time() - start
+
+    os.makedirs(os.path.dirname(dest), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(dest), suffix='.part')
+    try:
+        with resp, os.fdopen(fd, 'wb') as f:
+            shutil.copyfileobj(resp, f, _CHUNK)
+        modified = resp.headers.get('Last-Modified')
+        if modified:
+            mtime = parsedate_to_datetime(modified).timestamp()
+            os.utime(tmp, (mtime, mtime))
+        os.replace(tmp, dest)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+    return dataset, url, dest, 'downloaded', os.path.getsize(dest), time.time() - start
@@ -0,0 +1,143 @@
+"""
+Concurrent fetch engine shared by the multi-file loaders
+
+map_ordered() runs a load function over many items (usually seasons) on a
+bounded thread pool, so the wall time of a multi-season pull is close to that
+of its slowest file. Results come back in input order and every failure is
+reported against the item that caused it.
+"""
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_WORKERS = 8
+
+
+class FetchError(Exception):
+    """Raised when some items of a concurrent load failed
+
+    The error raised by map_ordered also subclasses the type of the first
+    failure in input order, so callers catching e.g. HTTPError around a
+    loader still catch it, as they did when seasons were loaded one by one.
+
+    Attributes:
+        failures (Dict): item -> exception raised while loading it
+        results (List): (item, result) tuples for the items that loaded
+    """
+
+    def __init__(self, failures, results):
+        self.failures = failures
+        self.results = results
+        detail = ', '.join(f'{item} ({exc})' for item, exc in failures.items())
+        # not super(), whose __init__ may be that of the failure type
+        Exception.__init__(self, f'Failed to load {detail}')
+
+    def __str__(self):
+        return str(self.args[0])
+
+
+_error_types = {}
+
+
+def __fetch_error(failures, results):
+    """FetchError that is also an instance of the first failure's type"""
+
+    first = next(iter(failures.values()))
+    base = type(first)
+    if base not in _error_types:
+        try:
+            _error_types[base] = type('FetchError', (FetchError, base), {})
+        except TypeError:
+            _error_types[base] = FetchError
+
+    error = _error_types[base].__new__(_error_types[base])
+    # attributes such as HTTPError.code come from the original failure
+    error.__dict__.update(vars(first))
+    FetchError.__init__(error, failures, results)
+    return error
+
+
+def map_ordered(func, items, thread_requests=True, max_workers=None):
+    """Calls func on every item, concurrently unless thread_requests is False
+
+    Args:
+        func (Callable): function taking a single item
+        items (Iterable): items to load, e.g. years
+        thread_requests (bool): use a thread pool, default True
+        max_workers (int): bound on concurrent calls, default MAX_WORKERS
+    Returns:
+        List of results in the order of items
+    Raises:
+        FetchError: after all items ran, if any of them failed
+    """
+
+    items = list(items)
+    outcomes = [None] * len(items)
+
+    if thread_requests and len(items) > 1:
+        workers = min(max_workers or MAX_WORKERS, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # run each call in a copy of the caller's context so context-local
+            # state (e.g. files prefetched by the async API) reaches the workers
+            futures = [
+                executor.submit(contextvars.copy_context().run, func, item)
+                for item in items
+            ]
+            for idx, future in enumerate(futures):
+                exc = future.exception()
+                outcomes[idx] = (False, exc) if exc else (True, future.result())
+    else:
+        for idx, item in enumerate(items):
+            try:
+                outcomes[idx] = (True, func(item))
+            except Exception as exc:
+                outcomes[idx] = (False, exc)
+
+    failures = {item: out for item, (ok, out) in zip(items, outcomes) if not ok}
+    results = [(item, out) for item, (ok, out) in zip(items, outcomes) if ok]
+
+    if failures:
+        raise __fetch_error(failures, results) from next(iter(failures.values()))
+
+    return [out for _, out in results]
+
+
+class Prefetcher:
+    """Starts calls for all items in the background and hands out results on demand
+
+    Used as a context manager. With thread_requests False nothing runs ahead
+    and result() simply calls func, so callers behave the same in both modes.
+    """
+
+    def __init__(self, func, items, thread_requests=True, max_workers=None):
+        items = list(items)
+        self.func = func
+        self._executor = None
+        self._futures = {}
+
+        if thread_requests and items:
+            workers = min(max_workers or MAX_WORKERS, len(items))
+            self._executor = ThreadPoolExecutor(max_workers=workers)
+            self._futures = {
+                item: self._executor.submit(contextvars.copy_context().run, func, item)
+                for item in items
+            }
+
+    def result(self, item):
+        """Waits for and returns func(item), raising whatever it raised"""
+
+        if item in self._futures:
+            return self._futures[item].result()
+
+        return self.func(item)
+
+    def close(self):
+        if self._executor is not None:
+            for future in self._futures.values():
+                future.cancel()
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
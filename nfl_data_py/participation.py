@@ -0,0 +1,229 @@
+"""
+Int-coded on-field players of play-by-play data
+
+Participation data lists the players on the field as semicolon-delimited
+gsis ids in offense_players and defense_players. OnField parses those strings
+once into a compressed sparse row layout per side: `codes` holds a player
+code for every player on every play and `offsets` marks where each play's
+players start, so play i has codes[offsets[i]:offsets[i + 1]]. Player codes
+index the sorted `players` array.
+
+    from nfl_data_py import participation
+
+    pbp = nfl.import_pbp_data([2023])
+    on_field = participation.OnField.from_pbp(pbp)
+    mahomes = pbp[on_field.plays_with_player(['00-0033873'])]
+
+Queries work on the integer arrays only, so on-field filters, snap counts and
+lineup groupings over several seasons take milliseconds.
+"""
+import numpy
+import pandas
+
+from nfl_data_py import backends
+
+SIDES = ('offense', 'defense')
+
+
+class OnField:
+    """Players on the field for every play of a pbp frame
+
+    Attributes:
+        players (numpy.ndarray): sorted gsis ids, indexed by player code
+        offsets (Dict[str, numpy.ndarray]): per side, row offsets into codes
+        codes (Dict[str, numpy.ndarray]): per side, int32 player codes
+    """
+
+    def __init__(self, players, offsets, codes):
+        self.players = players
+        self.offsets = offsets
+        self.codes = codes
+
+    @classmethod
+    def from_pbp(cls, pbp):
+        """Parses offense_players and defense_players of a pbp frame
+
+        Args:
+            pbp (DataFrame): pandas DataFrame or pyarrow.Table with participation
+        Returns:
+            OnField aligned with the rows of pbp
+        """
+
+        if backends.is_lazy(pbp):
+            raise ValueError('Collect the LazyFrame before building OnField.')
+
+        available = backends.names(pbp)
+        missing = [f'{side}_players' for side in SIDES if f'{side}_players' not in available]
+        if missing:
+            raise ValueError(f'pbp has no {", ".join(missing)} column, load it with participation.')
+
+        flat, offsets = {}, {}
+        for side in SIDES:
+            flat[side], offsets[side] = cls.__split(backends.column(pbp, f'{side}_players'))
+
+        # hash the ids, then sort only the distinct ones
+        inverse, players = pandas.factorize(numpy.concatenate([flat[side] for side in SIDES]))
+        order = numpy.argsort(players)
+        rank = numpy.empty(len(order), numpy.int32)
+        rank[order] = numpy.arange(len(order), dtype=numpy.int32)
+        inverse = rank[inverse]
+
+        split = len(flat[SIDES[0]])
+        codes = {SIDES[0]: inverse[:split], SIDES[1]: inverse[split:]}
+        players = numpy.asarray(players, dtype=object)[order]
+
+        return cls(players, offsets, codes)
+
+    def __len__(self):
+        return len(self.offsets[SIDES[0]]) - 1
+
+    def player_codes(self, ids):
+        """Codes of the given gsis ids, -1 for players never on the field"""
+
+        ids = numpy.asarray(list(ids), dtype=object)
+        if not len(self.players):
+            return numpy.full(len(ids), -1, numpy.int32)
+
+        pos = numpy.minimum(numpy.searchsorted(self.players, ids), len(self.players) - 1)
+        return numpy.where(self.players[pos] == ids, pos, -1).astype(numpy.int32)
+
+    def plays_with_player(self, ids, side=None, how='any'):
+        """Boolean mask of the plays the given players were on the field for
+
+        Args:
+            ids (List[str]): gsis ids
+            side (str): 'offense' or 'defense', default either
+            how (str): 'any' for plays with at least one of the players,
+                'all' for plays with every one of them
+        Returns:
+            numpy.ndarray of bool, aligned with the pbp rows
+        """
+
+        if how not in ('any', 'all'):
+            raise ValueError("how must be 'any' or 'all'.")
+
+        wanted = numpy.zeros(len(self.players), bool)
+        codes = self.player_codes(ids)
+        if how == 'all' and (codes < 0).any():
+            return numpy.zeros(len(self), bool)
+        wanted[codes[codes >= 0]] = True
+
+        # count the wanted players per play, locating only the matching entries
+        hits = numpy.zeros(len(self), numpy.int64)
+        for s in self.__sides(side):
+            entries = numpy.flatnonzero(wanted[self.codes[s]])
+            plays = numpy.searchsorted(self.offsets[s], entries, side='right') - 1
+            hits += numpy.bincount(plays, minlength=len(self))
+
+        if how == 'any':
+            return hits > 0
+
+        return hits == len(numpy.unique(codes))
+
+    def players_on(self, play, side=None):
+        """gsis ids on the field for the play at row position play"""
+
+        players = []
+        for s in self.__sides(side):
+            start, stop = self.offsets[s][play], self.offsets[s][play + 1]
+            players.extend(self.players[self.codes[s][start:stop]])
+
+        return players
+
+    def snap_counts(self, side=None, mask=None):
+        """Plays on the field per player
+
+        Args:
+            side (str): 'offense' or 'defense', default either
+            mask (numpy.ndarray): only count plays where mask is True
+        Returns:
+            Series of play counts indexed by gsis id, largest first
+        """
+
+        counts = numpy.zeros(len(self.players), numpy.int64)
+        for s in self.__sides(side):
+            codes = self.codes[s]
+            if mask is not None:
+                codes = codes[numpy.repeat(numpy.asarray(mask, bool), numpy.diff(self.offsets[s]))]
+            counts += numpy.bincount(codes, minlength=len(self.players))
+
+        counts = pandas.Series(counts, index=pandas.Index(self.players, name='player_id'))
+        return counts[counts > 0].sort_values(ascending=False, kind='stable')
+
+    def lineup_ids(self, side='offense'):
+        """Integer id of the set of players on the field, per play
+
+        Plays with the same players share an id whatever order the players
+        were listed in, plays without participation get -1.
+        """
+
+        # every player gets a random 64 bit weight, the wrapping sum over a
+        # play identifies its set of players without sorting any lineup. Two
+        # of a million lineups colliding has a chance of about 1 in 30 million
+        rng = numpy.random.default_rng(0)
+        weights = rng.integers(0, 2**63, size=len(self.players), dtype=numpy.uint64)
+        keys = self.__per_play(side, weights[self.codes[side]])
+
+        listed = numpy.diff(self.offsets[side]) > 0
+        ids = numpy.full(len(self), -1, numpy.int64)
+        ids[listed] = pandas.factorize(keys[listed])[0]
+
+        return ids
+
+    def to_long(self):
+        """One row per player per play: play (row position), player_id, side"""
+
+        frames = [
+            pandas.DataFrame({
+                'play': self.__rows(s),
+                'player_id': pandas.Categorical.from_codes(self.codes[s], self.players),
+                'side': s,
+            })
+            for s in SIDES
+        ]
+        long = pandas.concat(frames, ignore_index=True)
+        long['side'] = long['side'].astype(pandas.CategoricalDtype(SIDES))
+        return long
+
+    def to_arrow(self, side='offense'):
+        """pyarrow ListArray with the player codes of each play"""
+
+        pa = backends.pyarrow()
+        return pa.ListArray.from_arrays(
+            pa.array(self.offsets[side].astype(numpy.int32)), pa.array(self.codes[side])
+        )
+
+    def __sides(self, side):
+        if side is None:
+            return SIDES
+        if side not in SIDES:
+            raise ValueError("side must be 'offense' or 'defense'.")
+        return (side,)
+
+    def __per_play(self, side, values):
+        """Sums values, one per entry in codes[side], over each play"""
+
+        total = numpy.zeros(len(values) + 1, values.dtype)
+        numpy.cumsum(values, out=total[1:])
+        offsets = self.offsets[side]
+        return total[offsets[1:]] - total[offsets[:-1]]
+
+    def __rows(self, side):
+        """Play row of every entry in codes[side]"""
+        return numpy.repeat(
+            numpy.arange(len(self), dtype=numpy.int32), numpy.diff(self.offsets[side])
+        )
+
+    @staticmethod
+    def __split(values):
+        """Flattens semicolon-delimited ids into (ids, offsets)"""
+
+        values = values.fillna('').astype(str).to_numpy()
+        counts = numpy.array([v.count(';') + 1 if v else 0 for v in values], numpy.int64)
+        offsets = numpy.zeros(len(values) + 1, numpy.int64)
+        numpy.cumsum(counts, out=offsets[1:])
+
+        joined = ';'.join(v for v in values if v)
+        flat = numpy.array(joined.split(';') if joined else [], dtype=object)
+
+        return flat, offsets
@@ -0,0 +1,294 @@
+"""
+Local play-by-play cache written by cache_pbp
+
+Each season lives in <root>/season=<year>/part.0.parquet. Files are written
+next to their final location and renamed into place. Their manifest entry is
+staged before the rename and committed after it, and readers accept the
+staged entry once its file is in place, so an interrupted run never leaves a
+season missing, half written or unreadable.
+
+manifest.json indexes the cache: for every season it records the file, its
+row count, size and modification time, a hash of its schema, the upstream
+version it was built from and when it was written. Readers resolve seasons
+from the manifest alone and reject stale entries before opening any parquet,
+and cache_pbp skips seasons whose upstream version did not change. Reads never
+download or rebuild anything: a season downcast when the read asks for
+float64 is rejected, and columns a season lacks are skipped.
+"""
+import os
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from urllib.error import HTTPError, URLError
+
+import appdirs
+
+from nfl_data_py.cache import remote_fingerprint
+
+MANIFEST = 'manifest.json'
+PART = 'part.0.parquet'
+
+# bumped whenever the content of cached seasons changes shape
+LAYOUT = 1
+
+_lock = threading.Lock()
+
+
+def default_dir():
+    """Directory of the local pbp cache if no alt_path is given"""
+    return os.path.join(appdirs.user_cache_dir('nfl_data_py', 'nflverse'), 'pbp')
+
+
+def season_dir(root, year):
+    return os.path.join(root, f'season={year}')
+
+
+def upstream_version(url):
+    """Upstream fingerprint of url
+
+    Returns:
+        fingerprint dict, 'missing' if the file is not published, or None
+        when the version cannot be determined
+    """
+
+    try:
+        return remote_fingerprint(url)
+    except HTTPError as e:
+        return 'missing' if e.code == 404 else None
+    except URLError:
+        return None
+
+
+def read_manifest(root):
+    """Reads the manifest of the cache at root
+
+    Seasons whose staged entry matches the file on disk, because a write was
+    interrupted after its rename, are described by the staged entry.
+
+    Returns:
+        Dict mapping season (str) to its entry, None if root has no manifest
+    """
+
+    manifest = __load(root)
+    if manifest is None:
+        return None
+
+    for year, entry in list(manifest.items()):
+        staged = entry.pop('staged', None)
+        if staged is not None and __in_place(root, staged):
+            manifest[year] = staged
+        elif 'file' not in entry:
+            # first write of the season, interrupted before its rename
+            del manifest[year]
+
+    return manifest
+
+
+def update_manifest(root, year, entry):
+    """Records entry for season year"""
+
+    with _lock:
+        manifest = __load(root) or {}
+        manifest[str(year)] = entry
+        __write_json(root, MANIFEST, manifest)
+
+
+def problem(root, entry):
+    """Why the cached file of entry cannot be used, None if it can
+
+    Only the manifest and a stat of the file are consulted.
+    """
+
+    if entry is None:
+        return 'is not cached'
+
+    if entry.get('layout') != LAYOUT:
+        return 'was cached by an incompatible version of nfl_data_py'
+
+    if schema_hash(entry.get('columns', {})) != entry.get('schema'):
+        return 'has a corrupt manifest entry'
+
+    try:
+        stat = os.stat(os.path.join(root, entry['file']))
+    except OSError:
+        return 'cache file does not exist'
+
+    if stat.st_size != entry.get('size') or stat.st_mtime_ns != entry.get('mtime'):
+        return 'cache file was modified after it was written'
+
+    return None
+
+
+def mismatch(entry, columns=None, downcast=None):
+    """Why an intact cached season does not fit a read, None if it does
+
+    Args:
+        columns (List[str]): columns the read needs
+        downcast (bool): whether the read downcasts floats, a season cached
+            with downcast=True cannot be read as float64
+    """
+
+    if downcast is False and entry.get('downcast', False):
+        return 'was cached with downcast=True'
+
+    stored = entry.get('columns', {})
+    missing = [c for c in dict.fromkeys(columns or ()) if c != 'season' and c not in stored]
+    if missing:
+        return f'does not have columns {", ".join(missing)}'
+
+    return None
+
+
+def is_current(root, year, version):
+    """Whether season year is cached intact and was built from version
+
+    Versions holding an unknown (None) part never count as current.
+    """
+
+    if None in version.values():
+        return False
+
+    entry = (read_manifest(root) or {}).get(str(year))
+    if problem(root, entry) is not None:
+        return False
+
+    return {key: entry.get(key) for key in version} == version
+
+
+def locate(root, years, downcast=None):
+    """Resolves the cached file of each season through the manifest
+
+    Seasons the manifest does not index, because they were cached before it
+    existed, are located by scanning their season directories.
+
+    Args:
+        downcast (bool): whether the read downcasts floats
+    Returns:
+        Dict mapping year to file path
+    Raises:
+        ValueError: if a season is missing, its entry is stale or it was
+            cached with downcast=True for a float64 read
+    """
+
+    manifest = read_manifest(root) or {}
+
+    paths = {}
+    for year in years:
+        entry = manifest.get(str(year))
+        if entry is None:
+            paths.update(__scan(root, [year]))
+            continue
+        reason = problem(root, entry) or mismatch(entry, downcast=downcast)
+        if reason is not None:
+            raise ValueError(f'{year} {reason}, run cache_pbp([{year}]) to rebuild it.')
+        paths[year] = os.path.join(root, entry['file'])
+
+    return paths
+
+
+def schema_hash(columns):
+    """Stable hash of a {column: dtype} mapping"""
+    blob = json.dumps(columns, sort_keys=True).encode('utf-8')
+    return hashlib.sha256(blob).hexdigest()
+
+
+def write_season(root, year, df, version=None):
+    """Atomically replaces the cached file of season year with df
+
+    The new manifest entry is staged before the file is renamed into place
+    and committed after, so the manifest matches whichever file an
+    interruption leaves behind.
+
+    Args:
+        version (dict): upstream version the season was built from, stored
+            in its entry
+    Returns:
+        Dict the manifest records for the season
+    """
+
+    folder = season_dir(root, year)
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, PART)
+
+    # season is encoded in the directory name, as with partitioned writes
+    df = df.drop(columns=['season'], errors='ignore')
+
+    fd, tmp = tempfile.mkstemp(dir=folder, prefix='.', suffix='.part')
+    os.close(fd)
+    try:
+        df.to_parquet(tmp)
+        columns = {col: str(dtype) for col, dtype in df.dtypes.items()}
+        # renaming keeps the size and mtime the entry is checked against
+        stat = os.stat(tmp)
+        entry = dict(
+            version or {},
+            file=os.path.relpath(path, root),
+            rows=len(df),
+            columns=columns,
+            schema=schema_hash(columns),
+            size=stat.st_size,
+            mtime=stat.st_mtime_ns,
+            written=time.time(),
+            layout=LAYOUT,
+        )
+        __stage(root, year, entry)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+    # files left by earlier layouts would otherwise shadow the new one
+    for fname in os.listdir(folder):
+        if fname.endswith('.parquet') and fname != PART:
+            os.remove(os.path.join(folder, fname))
+
+    update_manifest(root, year, entry)
+    return entry
+
+
+def __load(root):
+    # the manifest as stored, staged entries included
+    try:
+        with open(os.path.join(root, MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except ValueError:
+        return {}
+
+
+def __stage(root, year, entry):
+    with _lock:
+        manifest = __load(root) or {}
+        manifest.setdefault(str(year), {})['staged'] = entry
+        __write_json(root, MANIFEST, manifest)
+
+
+def __in_place(root, entry):
+    try:
+        stat = os.stat(os.path.join(root, entry['file']))
+    except OSError:
+        return False
+    return stat.st_size == entry['size'] and stat.st_mtime_ns == entry['mtime']
+
+
+def __scan(root, years):
+    paths = {}
+    for year in years:
+        folder = season_dir(root, year)
+        files = sorted(f for f in os.listdir(folder) if f.endswith('.parquet')) \
+            if os.path.isdir(folder) else []
+        if not files:
+            raise ValueError(f'{year} is not cached, run cache_pbp([{year}]) to cache it.')
+        paths[year] = os.path.join(folder, files[-1])
+
+    return paths
+
+
+def __write_json(root, name, obj):
+    fd, tmp = tempfile.mkstemp(dir=root, suffix='.part')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(obj, f, indent=1, sort_keys=True)
+    os.replace(tmp, os.path.join(root, name))
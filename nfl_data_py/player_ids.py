@@ -0,0 +1,197 @@
+"""
+Translation of player ids between data providers
+
+IdIndex is built from the dynastyprocess crosswalk returned by import_ids.
+Each id system (gsis, pfr, espn, sleeper, ...) gets a hash table from its
+ids to crosswalk rows, so whole Series of ids are translated with one
+vectorized lookup instead of a merge. Ids are compared as canonical strings:
+3139477, 3139477.0 and '3139477' are the same espn id.
+
+Indexes are kept per version of the downloaded crosswalk for the life of the
+process, and can be saved to and loaded from a parquet file.
+"""
+import os
+import threading
+
+import numpy
+import pandas
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+class IdIndex:
+    """Hashed lookups between every id column of the crosswalk
+
+    Attributes:
+        table (DataFrame): the crosswalk the index was built from
+        systems (List[str]): names of the id systems, e.g. 'gsis' for gsis_id
+    """
+
+    def __init__(self, table):
+        self.table = table.reset_index(drop=True)
+        self.systems = [c[:-3] for c in self.table.columns if c.endswith('_id')]
+        self._keys = {}
+        self._lock = threading.Lock()
+
+    def translate(self, values, source, target):
+        """Maps ids of one system to another
+
+        Args:
+            values (Iterable): ids in the source system, e.g. a Series
+            source (str): id system of values, e.g. 'gsis' or 'gsis_id'
+            target (str): id system to return, or any crosswalk column
+        Returns:
+            Series of target ids aligned with values, NaN where unmapped
+        """
+
+        values = self.__as_series(values)
+        column = self.table[self.__column(target)]
+        rows = self.rows(values, source)
+
+        # position -1 picks the appended missing value
+        filled = numpy.append(column.to_numpy(dtype=object), numpy.nan)
+        result = pandas.Series(filled[rows], index=values.index, name=column.name)
+        return result.infer_objects()
+
+    def lookup(self, values, source, columns=None):
+        """Crosswalk rows of the given ids
+
+        Args:
+            values (Iterable): ids in the source system
+            source (str): id system of values
+            columns (List[str]): crosswalk columns to return, default all
+        Returns:
+            DataFrame aligned with values, all missing where unmapped
+        """
+
+        values = self.__as_series(values)
+        rows = self.rows(values, source)
+        table = self.table if columns is None else self.table[columns]
+
+        # reindex with -1 gives the all missing row of unmapped ids
+        result = table.reindex(rows)
+        result.index = values.index
+        return result
+
+    def unmapped(self, values, source, target=None):
+        """Distinct ids without a crosswalk row, or without a target id
+
+        Args:
+            values (Iterable): ids in the source system
+            source (str): id system of values
+            target (str): also report ids whose row has no id in this system
+        Returns:
+            numpy array of the distinct ids that could not be mapped
+        """
+
+        values = self.__as_series(values)
+        _, uniques = pandas.factorize(values)
+        rows = self.__find(uniques, source)
+        missing = rows < 0
+        if target is not None:
+            column = self.table[self.__column(target)].to_numpy(dtype=object)
+            missing |= pandas.isna(numpy.append(column, numpy.nan)[rows])
+
+        return numpy.asarray(uniques)[missing]
+
+    def rows(self, values, source):
+        """Crosswalk row of every id, -1 where unmapped"""
+
+        codes, uniques = pandas.factorize(self.__as_series(values))
+        rows = self.__find(uniques, source)
+        return numpy.where(codes >= 0, numpy.append(rows, -1)[codes], -1)
+
+    def save(self, path):
+        """Writes the crosswalk behind the index to a parquet file"""
+        self.table.to_parquet(path)
+
+    @classmethod
+    def load(cls, path):
+        return cls(pandas.read_parquet(path))
+
+    def __find(self, uniques, source):
+        """Crosswalk rows of distinct ids, hashing only the distinct values"""
+
+        keys, rows = self.__keys(source)
+        if not len(keys):
+            return numpy.full(len(uniques), -1, numpy.int64)
+
+        pos = keys.get_indexer(canonical(uniques))
+        return numpy.where(pos >= 0, rows[pos], -1)
+
+    def __keys(self, source):
+        """Hash table of a system's ids and their rows, built on first use"""
+
+        column = self.__column(source)
+        with self._lock:
+            entry = self._keys.get(column)
+        if entry is None:
+            keys = canonical(self.table[column].to_numpy(dtype=object))
+            rows = numpy.flatnonzero(pandas.notna(keys))
+            keys = pandas.Index(keys[rows], dtype=object)
+            # an id listed on several rows maps to the first of them
+            first = ~keys.duplicated()
+            entry = keys[first], rows[first]
+            with self._lock:
+                self._keys[column] = entry
+        return entry
+
+    @staticmethod
+    def __as_series(values):
+        if isinstance(values, pandas.Series):
+            return values
+        return pandas.Series(list(values), dtype=object)
+
+    def __column(self, system):
+        if system in self.table.columns:
+            return system
+        if f'{system}_id' in self.table.columns:
+            return f'{system}_id'
+        raise ValueError(f'Unknown id system {system}, use one of {", ".join(self.systems)}.')
+
+
+def canonical(values):
+    """Ids as comparable strings, None where missing"""
+
+    return numpy.array([__canonical(v) for v in values], dtype=object)
+
+
+def id_index(source):
+    """IdIndex of the crosswalk at source, built once per version of the file
+
+    Args:
+        source (str or file): db_playerids.csv, as returned by the download cache
+    Returns:
+        IdIndex
+    """
+
+    if not isinstance(source, (str, os.PathLike)):
+        return IdIndex(pandas.read_csv(source))
+
+    stat = os.stat(source)
+    key = (os.fspath(source), stat.st_size, stat.st_mtime_ns)
+
+    with _lock:
+        index = _indexes.get(key)
+    if index is None:
+        index = IdIndex(pandas.read_csv(source))
+        with _lock:
+            for old in [k for k in _indexes if k[0] == key[0]]:
+                del _indexes[old]
+            _indexes[key] = index
+
+    return index
+
+
+def __canonical(value):
+    if value is None or value is pandas.NA:
+        return None
+    if isinstance(value, (float, numpy.floating)):
+        if numpy.isnan(value):
+            return None
+        return str(int(value)) if float(value).is_integer() else str(value)
+    if isinstance(value, (int, numpy.integer)):
+        return str(int(value))
+    value = str(value).strip()
+    return value or None
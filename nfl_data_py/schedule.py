@@ -0,0 +1,126 @@
+"""
+Game dates by season, week and team
+
+GamedayIndex maps (season, week, team) to the date of that team's game with
+a sorted array of integer keys, so dates for a whole roster are found with a
+single searchsorted instead of merging against a home/away copy of the
+schedule. Indexes are built from games.csv once per downloaded copy of the
+file and kept for the life of the process.
+"""
+import os
+import threading
+
+import numpy
+import pandas
+
+COLUMNS = ['season', 'week', 'gameday', 'home_team', 'away_team']
+
+# weeks per season reserved in the integer keys
+MAX_WEEKS = 100
+
+_indexes = {}
+_lock = threading.Lock()
+
+
+class GamedayIndex:
+    """Date of every team's game, looked up by season, week and team"""
+
+    def __init__(self, games):
+        """
+        Args:
+            games (DataFrame): schedule with season, week, gameday,
+                home_team and away_team columns
+        """
+
+        teams = pandas.concat([games['home_team'], games['away_team']])
+        self.teams = numpy.sort(teams.dropna().unique().astype(str))
+
+        season = numpy.concatenate([games['season'].to_numpy()] * 2)
+        week = numpy.concatenate([games['week'].to_numpy()] * 2)
+        gameday = numpy.concatenate([pandas.to_datetime(games['gameday']).to_numpy()] * 2)
+
+        keys = self.keys_of(season, week, teams.to_numpy())
+        found = keys >= 0
+        keys, first = numpy.unique(keys[found], return_index=True)
+        self.keys = keys
+        self.gamedays = gameday[found][first]
+
+    def keys_of(self, season, week, team):
+        """Integer keys of (season, week, team) triples, -1 if not indexable"""
+
+        season = pandas.to_numeric(pandas.Series(season), errors='coerce').to_numpy(numpy.float64)
+        week = pandas.to_numeric(pandas.Series(week), errors='coerce').to_numpy(numpy.float64)
+        team = numpy.asarray(pandas.Series(team).fillna('').astype(str), dtype=object)
+
+        if len(self.teams):
+            code = numpy.minimum(numpy.searchsorted(self.teams, team), len(self.teams) - 1)
+            known = self.teams[code] == team
+        else:
+            code = numpy.zeros(len(team), numpy.int64)
+            known = numpy.zeros(len(team), bool)
+
+        valid = known & ~numpy.isnan(season) & ~numpy.isnan(week)
+        valid &= (week >= 0) & (week < MAX_WEEKS)
+        season = numpy.where(valid, season, 0).astype(numpy.int64)
+        week = numpy.where(valid, week, 0).astype(numpy.int64)
+
+        keys = (season * MAX_WEEKS + week) * len(self.teams) + code
+        return numpy.where(valid, keys, -1)
+
+    def lookup(self, season, week, team):
+        """Game dates for arrays of seasons, weeks and teams
+
+        Returns:
+            numpy datetime64 array, NaT where the team has no game that week
+        """
+
+        keys = self.keys_of(season, week, team)
+        if not len(self.keys):
+            return numpy.full(len(keys), numpy.datetime64('NaT'), 'datetime64[ns]')
+
+        pos = numpy.minimum(numpy.searchsorted(self.keys, keys), len(self.keys) - 1)
+        hit = (keys >= 0) & (self.keys[pos] == keys)
+        return numpy.where(hit, self.gamedays[pos], numpy.datetime64('NaT'))
+
+
+def gameday_index(source):
+    """Index of games.csv at source, built once per version of the file
+
+    Args:
+        source (str or file): games.csv, as returned by the download cache
+    Returns:
+        GamedayIndex
+    """
+
+    if not isinstance(source, (str, os.PathLike)):
+        return GamedayIndex(pandas.read_csv(source, usecols=COLUMNS))
+
+    stat = os.stat(source)
+    key = (os.fspath(source), stat.st_size, stat.st_mtime_ns)
+
+    with _lock:
+        index = _indexes.get(key)
+    if index is None:
+        index = GamedayIndex(pandas.read_csv(source, usecols=COLUMNS))
+        with _lock:
+            # older versions of the same file are no longer needed
+            for old in [k for k in _indexes if k[0] == key[0]]:
+                del _indexes[old]
+            _indexes[key] = index
+
+    return index
+
+
+def season_age(season, birth_date):
+    """Age in whole years on September 1st of season
+
+    Args:
+        season (Series): season of each row
+        birth_date (Series): datetime64 birth dates
+    Returns:
+        Series, NaN where birth_date is missing
+    """
+
+    # a birthday in September or later has not been reached by September 1st
+    born = birth_date.dt
+    return season.astype(numpy.int64) - born.year + numpy.where(9 > born.month, 0, -1)
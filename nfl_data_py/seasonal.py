@@ -0,0 +1,312 @@
+"""
+Seasonal player stats aggregated from weekly player stats
+
+aggregate() reduces weekly rows to additive sums per player, season and
+season type: every numeric stat, the number of games and, for the receiving
+share metrics, the player's own totals next to the matching team totals of
+the weeks the player appeared in. finalize() turns those sums into the frame
+returned by import_seasonal_data, with share metrics such as tgt_sh, wopr and
+dom computed over the whole season.
+
+Both steps are grouped numpy reductions over integer group codes, every
+column is summed with a single bincount and no intermediate frame is joined.
+
+The sums are additive, so SeasonalAggregates keeps them as a persisted state
+and only aggregates the games that arrived since it was last updated.
+"""
+import os
+import json
+import tempfile
+
+import numpy
+import pandas
+
+# index file of a saved SeasonalAggregates directory
+STATE = 'state.json'
+
+KEYS = ['player_id', 'season', 'season_type']
+
+# team totals per game: output name -> weekly column
+TEAM_TOTALS = {
+    'atts': 'attempts',
+    'comps': 'completions',
+    'p_yds': 'passing_yards',
+    'p_tds': 'passing_tds',
+    'p_ayds': 'passing_air_yards',
+    'p_yac': 'passing_yards_after_catch',
+    'p_fds': 'passing_first_downs',
+    'ppr_pts': 'fantasy_points_ppr',
+}
+
+# player stats the share metrics divide by team totals
+SHARE_INPUTS = [
+    'targets', 'receiving_air_yards', 'receiving_yards_after_catch', 'receiving_yards',
+    'receiving_tds', 'receiving_first_downs', 'fantasy_points_ppr',
+]
+
+SHARES = [
+    'tgt_sh', 'ay_sh', 'yac_sh', 'wopr', 'ry_sh', 'rtd_sh', 'rfd_sh', 'rtdfd_sh', 'dom',
+    'w8dom', 'yptmpa', 'ppr_sh',
+]
+
+
+def stat_columns(data):
+    """Numeric weekly columns summed into seasonal stats"""
+
+    # checks dtypes rather than select_dtypes, which copies the data
+    return [
+        col for col, dtype in data.dtypes.items()
+        if pandas.api.types.is_numeric_dtype(dtype) and col not in ('season', 'week')
+    ]
+
+
+def aggregate(data, by_type=False):
+    """Sums weekly player stats per player, season and season type
+
+    Rows without a season type are kept as their own group: they count
+    towards the season's share metrics but not its games, as before.
+
+    Args:
+        data (DataFrame): weekly player stats
+        by_type (bool): total team stats per season type too, so the sums can
+            later be narrowed to one season type
+    Returns:
+        DataFrame keyed by player_id, season and season_type with the summed
+        stats, games and the team totals of each player's games
+    """
+
+    stats = stat_columns(data)
+    seasons = pandas.factorize(data['season'], sort=True)
+    n_seasons = max(len(seasons[1]), 1)
+
+    # sorted codes, so groups come out in groupby order
+    player, players = pandas.factorize(data['player_id'], sort=True)
+    s_type, s_types = pandas.factorize(data['season_type'], sort=True)
+    typed = s_type >= 0
+    s_type = numpy.where(typed, s_type, len(s_types))
+
+    # team totals of every (team, season, week), looked up for each row
+    team, _ = pandas.factorize(data['recent_team'])
+    week, weeks = pandas.factorize(data['week'])
+    game = (team.astype(numpy.int64) * n_seasons + seasons[0]) * max(len(weeks), 1) + week
+    if by_type:
+        game = game * (len(s_types) + 1) + s_type
+    has_game = (team >= 0) & (week >= 0)
+    games, game = numpy.unique(game[has_game], return_inverse=True)
+
+    team_totals = {}
+    for name, col in TEAM_TOTALS.items():
+        totals = numpy.bincount(game, weights=__values(data[col])[has_game], minlength=len(games))
+        per_row = numpy.zeros(len(data))
+        per_row[has_game] = totals[game]
+        team_totals[name] = per_row
+
+    keep = player >= 0
+    if keep.all():
+        keep = slice(None)
+    key = (player.astype(numpy.int64) * n_seasons + seasons[0]) * (len(s_types) + 1) + s_type
+    groups, group = numpy.unique(key[keep], return_inverse=True)
+
+    def total(values):
+        return numpy.bincount(group, weights=values[keep], minlength=len(groups))
+
+    s_type_code = groups % (len(s_types) + 1)
+    season_code = groups // (len(s_types) + 1) % n_seasons
+    sums = {
+        'player_id': players[groups // (len(s_types) + 1) // n_seasons],
+        'season': seasons[1][season_code],
+        'season_type': numpy.append(numpy.asarray(s_types, dtype=object), numpy.nan)[s_type_code],
+    }
+    for col in stats:
+        sums[col] = __cast(total(__values(data[col])), data[col].dtype)
+    sums['games'] = total(typed.astype(numpy.float64)).astype(numpy.int64)
+    for name, per_row in team_totals.items():
+        sums[name] = total(per_row)
+
+    return pandas.DataFrame(sums)
+
+
+def finalize(sums):
+    """Seasonal stats with share metrics from aggregated sums
+
+    Args:
+        sums (DataFrame): output of aggregate, sorted by its keys
+    Returns:
+        DataFrame with one row per player, season and season type
+    """
+
+    # consecutive rows of a player and season form one season group
+    player = sums['player_id'].to_numpy()
+    season = sums['season'].to_numpy()
+    first = numpy.ones(len(sums), bool)
+    first[1:] = (player[1:] != player[:-1]) | (season[1:] != season[:-1])
+    group = numpy.cumsum(first) - 1
+    starts = numpy.flatnonzero(first)
+
+    def season_total(col):
+        values = sums[col].to_numpy(dtype=numpy.float64)
+        return numpy.add.reduceat(values, starts) if len(values) else values
+
+    s = {col: season_total(col) for col in SHARE_INPUTS + list(TEAM_TOTALS) + ['games']}
+
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        shares = {
+            'tgt_sh': s['targets'] / s['atts'],
+            'ay_sh': s['receiving_air_yards'] / s['p_ayds'],
+            'yac_sh': s['receiving_yards_after_catch'] / s['p_yac'],
+            'ry_sh': s['receiving_yards'] / s['p_yds'],
+            'rtd_sh': s['receiving_tds'] / s['p_tds'],
+            'rfd_sh': s['receiving_first_downs'] / s['p_fds'],
+            'rtdfd_sh': (s['receiving_tds'] + s['receiving_first_downs']) / (s['p_tds'] + s['p_fds']),
+            'yptmpa': s['receiving_yards'] / s['atts'],
+            'ppr_sh': s['fantasy_points_ppr'] / s['ppr_pts'],
+        }
+        shares['wopr'] = shares['tgt_sh'] * 1.5 + shares['ay_sh'] * 0.8
+        shares['dom'] = (shares['ry_sh'] + shares['rtd_sh']) / 2
+        shares['w8dom'] = shares['ry_sh'] * 0.8 + shares['rtd_sh'] * 0.2
+
+    typed = sums['season_type'].notna().to_numpy()
+    szn = sums.loc[typed, KEYS + [c for c in sums.columns if c not in KEYS + list(TEAM_TOTALS) + ['games']]]
+    szn = szn.reset_index(drop=True)
+    szn['games'] = s['games'][group[typed]].astype(numpy.int64)
+    for name in SHARES:
+        szn[name] = shares[name][group[typed]]
+
+    return szn
+
+
+def __values(col):
+    """Column as float64 with missing values as 0, as a groupby sum skips them"""
+
+    values = col.to_numpy(dtype=numpy.float64, na_value=numpy.nan)
+    missing = numpy.isnan(values)
+    return numpy.where(missing, 0.0, values) if missing.any() else values
+
+
+def __cast(values, dtype):
+    # match the dtypes a pandas groupby sum keeps
+    if pandas.api.types.is_bool_dtype(dtype):
+        return values.astype(numpy.int64)
+    if pandas.api.types.is_extension_array_dtype(dtype):
+        return pandas.array(values, dtype=dtype) if dtype.kind in 'iu' else values
+    return values.astype(dtype)
+
+
+class SeasonalAggregates:
+    """Seasonal sums that grow as new weeks of weekly stats arrive
+
+    Weekly rows are applied once per team game, a (season, week, team)
+    triple, so refreshing after a game day only aggregates the games that
+    were not applied yet and adds their sums to the state. Team totals of a
+    game only depend on that game's rows, which keeps the sums additive.
+
+    Team totals are kept per season type, as every game has a single one,
+    so results of any s_type equal those of import_seasonal_data.
+
+    The state can be saved to and loaded from a directory, see save().
+
+    Attributes:
+        sums (DataFrame): output of aggregate over every applied game
+        games (DataFrame): season, week and recent_team of the applied games
+    """
+
+    def __init__(self, sums=None, games=None):
+        self.sums = sums
+        self.games = games if games is not None else pandas.DataFrame(
+            {'season': [], 'week': [], 'recent_team': []}
+        )
+
+    def update(self, weekly):
+        """Adds the games of weekly that were not applied yet
+
+        Args:
+            weekly (DataFrame): weekly player stats, e.g. the current season
+        Returns:
+            int number of weekly rows applied
+        """
+
+        units = pandas.MultiIndex.from_frame(weekly[list(self.games.columns)])
+        applied = pandas.MultiIndex.from_frame(self.games)
+        new = weekly[~units.isin(applied)]
+        if new.empty:
+            return 0
+
+        sums = aggregate(new, by_type=True)
+        if self.sums is not None:
+            # group keys are sorted, so the combined sums stay in groupby order
+            sums = pandas.concat([self.sums, sums], ignore_index=True).groupby(
+                KEYS, sort=True, dropna=False
+            ).sum().reset_index()
+
+        self.sums = sums
+        self.games = pandas.concat(
+            [self.games, new[list(self.games.columns)].drop_duplicates()], ignore_index=True
+        )
+
+        return len(new)
+
+    def result(self, years=None, s_type='REG'):
+        """Seasonal stats of the applied games, as import_seasonal_data returns
+
+        Args:
+            years (List[int]): seasons to return, default all
+            s_type (str): season type to include ('ALL','REG','POST')
+        Returns:
+            DataFrame
+        """
+
+        if self.sums is None:
+            return pandas.DataFrame(columns=KEYS)
+
+        sums = self.sums
+        if years is not None:
+            sums = sums[sums['season'].isin(years)]
+        if s_type != 'ALL':
+            sums = sums[sums['season_type'] == s_type]
+
+        return finalize(sums.reset_index(drop=True))
+
+    def save(self, path):
+        """Writes the state to directory path
+
+        Both tables are written under a new version and state.json is then
+        replaced to point at them, so readers never see half a state.
+        """
+
+        os.makedirs(path, exist_ok=True)
+        current = self.__read_state(path)
+        version = current['version'] + 1 if current else 1
+
+        for name, df in (('sums', self.sums), ('games', self.games)):
+            if df is not None:
+                df.to_parquet(os.path.join(path, f'{name}-{version}.parquet'))
+
+        fd, tmp = tempfile.mkstemp(dir=path, prefix='.', suffix='.part')
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'version': version, 'sums': self.sums is not None}, f)
+        os.replace(tmp, os.path.join(path, STATE))
+
+        for fname in os.listdir(path):
+            if fname.endswith('.parquet') and not fname.endswith(f'-{version}.parquet'):
+                os.remove(os.path.join(path, fname))
+
+    @classmethod
+    def load(cls, path):
+        """Reads a state written by save(), an empty state if there is none"""
+
+        state = cls.__read_state(path)
+        if not state:
+            return cls()
+
+        def read(name):
+            return pandas.read_parquet(os.path.join(path, f'{name}-{state["version"]}.parquet'))
+
+        return cls(read('sums') if state['sums'] else None, read('games'))
+
+    @staticmethod
+    def __read_state(path):
+        try:
+            with open(os.path.join(path, STATE)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
@@ -0,0 +1,174 @@
+"""
+Locations of the files behind every import function
+
+Each dataset maps to a URL template; loaders fill in the template with
+url(dataset, **params) instead of spelling out addresses inline, so the
+sync and async APIs always request the same files.
+
+Every template starts with one of the upstream BASES. configure_sources()
+can point single bases elsewhere, or send every file to a mirror: a local
+directory or an HTTP server laid out as <mirror>/<base name>/<path>, the
+layout sync_mirror() writes.
+"""
+import os
+import string
+import threading
+from urllib.parse import urlparse
+
+NFLVERSE_RELEASES = 'https://github.com/nflverse/nflverse-data/releases/download/'
+NFLFASTR_DATA = 'https://github.com/nflverse/nflfastR-data/raw/master/'
+GITHUB_RAW = 'https://raw.githubusercontent.com/'
+HABITATRING = 'http://www.habitatring.com/'
+
+# base name -> upstream location, names are the top directories of a mirror
+BASES = {
+    'nflverse-data': NFLVERSE_RELEASES,
+    'nflfastR-data': NFLFASTR_DATA,
+    'githubusercontent': GITHUB_RAW,
+    'habitatring': HABITATRING,
+}
+
+# values of the non-year placeholders an import function accepts
+PARAMS = {
+    'stat_type': ('passing', 'rushing', 'receiving'),
+    's_type': ('pass', 'rec', 'rush', 'def'),
+    'level': ('nfl', 'college'),
+    'frequency': ('season', 'weekly'),
+}
+
+URLS = {
+    'pbp': NFLVERSE_RELEASES + 'pbp/play_by_play_{year}.parquet',
+    'pbp_participation': NFLVERSE_RELEASES + 'pbp_participation/pbp_participation_{year}.parquet',
+    'player_stats': NFLVERSE_RELEASES + 'player_stats/player_stats_{year}.parquet',
+    'rosters': NFLVERSE_RELEASES + 'rosters/roster_{year}.parquet',
+    'weekly_rosters': NFLVERSE_RELEASES + 'weekly_rosters/roster_weekly_{year}.parquet',
+    'players': NFLVERSE_RELEASES + 'players/players.parquet',
+    'draft_picks': NFLVERSE_RELEASES + 'draft_picks/draft_picks.parquet',
+    'combine': NFLVERSE_RELEASES + 'combine/combine.parquet',
+    'contracts': NFLVERSE_RELEASES + 'contracts/historical_contracts.parquet',
+    'nextgen_stats': NFLVERSE_RELEASES + 'nextgen_stats/ngs_{stat_type}.parquet',
+    'depth_charts': NFLVERSE_RELEASES + 'depth_charts/depth_charts_{year}.parquet',
+    'injuries': NFLVERSE_RELEASES + 'injuries/injuries_{year}.parquet',
+    'pfr_season': NFLVERSE_RELEASES + 'pfr_advstats/advstats_season_{s_type}.parquet',
+    'pfr_week': NFLVERSE_RELEASES + 'pfr_advstats/advstats_week_{s_type}_{year}.parquet',
+    'snap_counts': NFLVERSE_RELEASES + 'snap_counts/snap_counts_{year}.parquet',
+    'ftn_charting': NFLVERSE_RELEASES + 'ftn_charting/ftn_charting_{year}.parquet',
+    'teams': NFLFASTR_DATA + 'teams_colors_logos.csv',
+    'schedules': HABITATRING + 'games.csv',
+    'win_totals': GITHUB_RAW + 'mrcaseb/nfl-data/master/data/nfl_lines_odds.csv.gz',
+    'officials': GITHUB_RAW + 'nflverse/nfldata/master/data/officials.csv',
+    'sc_lines': GITHUB_RAW + 'nflverse/nfldata/master/data/sc_lines.csv',
+    'draft_values': GITHUB_RAW + 'nflverse/nfldata/master/data/draft_values.csv',
+    'ids': GITHUB_RAW + 'dynastyprocess/data/master/files/db_playerids.csv',
+    'qbr': GITHUB_RAW + 'nflverse/espnscrapeR-data/master/data/qbr-{level}-{frequency}.csv',
+}
+
+
+_config = {'mirror': None, 'bases': {}}
+_lock = threading.Lock()
+
+
+def configure_sources(mirror=None, bases=None):
+    """Choose where import functions download their files from
+
+    Args:
+        mirror (str): local directory or http(s) URL holding a copy of every
+            file, as written by sync_mirror. False goes back to upstream
+        bases (Dict[str, str]): base name (see BASES) -> location replacing
+            that base only, takes precedence over mirror. None values reset
+    """
+
+    with _lock:
+        if mirror is False:
+            _config['mirror'] = None
+        elif mirror is not None:
+            _config['mirror'] = os.fspath(mirror)
+
+        for name, location in (bases or {}).items():
+            if name not in BASES:
+                raise ValueError(f'Unknown base {name}, use one of {", ".join(BASES)}.')
+            if location is None:
+                _config['bases'].pop(name, None)
+            else:
+                _config['bases'][name] = os.fspath(location)
+
+
+def sources_info():
+    """Current mirror and base overrides
+
+    Returns:
+        Dict with mirror (str or None) and bases (Dict[str, str])
+    """
+
+    with _lock:
+        return {'mirror': _config['mirror'], 'bases': dict(_config['bases'])}
+
+
+def url(dataset, **params):
+    """Builds the URL of one file of a dataset
+
+    Args:
+        dataset (str): key of URLS
+        params: values for the placeholders of the dataset's template, e.g. year
+    Returns:
+        str, a local path when the file is read from a local directory
+    """
+
+    name, path = split(dataset, **params)
+    if name is None:
+        return path
+
+    with _lock:
+        location = _config['bases'].get(name)
+        if location is None and _config['mirror'] is not None:
+            location = join(_config['mirror'], name)
+
+    if location is None:
+        return BASES[name] + path
+
+    return join(location, path)
+
+
+def upstream_url(dataset, **params):
+    """URL of one file of a dataset at its upstream source, ignoring mirrors"""
+
+    name, path = split(dataset, **params)
+    return path if name is None else BASES[name] + path
+
+
+def split(dataset, **params):
+    """Base name and path below the base of one file of a dataset
+
+    Returns:
+        (str, str), e.g. ('nflverse-data', 'pbp/play_by_play_2020.parquet'),
+        or (None, full URL) if the template starts with none of the BASES
+    """
+
+    if dataset not in URLS:
+        raise ValueError(f'Unknown dataset {dataset}.')
+
+    template = URLS[dataset]
+    for name, base in BASES.items():
+        if template.startswith(base):
+            return name, template[len(base):].format(**params)
+
+    return None, template.format(**params)
+
+
+def placeholders(dataset):
+    """Names of the placeholders in a dataset's template, e.g. ['year']"""
+
+    return [field for _, field, _, _ in string.Formatter().parse(URLS[dataset]) if field]
+
+
+def is_remote(location):
+    """Whether location is fetched over the network rather than read from disk"""
+    return urlparse(location).scheme in ('http', 'https', 'ftp')
+
+
+def join(location, path):
+    """Appends a '/' separated path to a URL or local directory"""
+
+    if is_remote(location) or location.startswith('file:'):
+        return location.rstrip('/') + '/' + path
+    return os.path.join(location, *path.split('/'))
@@ -0,0 +1,58 @@
+from unittest import skipIf
+import asyncio
+import os
+
+import pandas as pd
+
+import nfl_data_py as nfl
+from nfl_data_py.tests.upstream import upstream_server
+
+try:
+    from nfl_data_py import aio
+except ImportError:
+    aio = None
+
+
+@skipIf(aio is None, 'httpx is not installed')
+class test_aio(upstream_server):
+    def setUp(self):
+        super().setUp()
+        for year in (2020, 2021):
+            self.write(pd.DataFrame({
+                'player_id': ['a', 'b'], 'season': [year, year], 'value': [1.0, 2.0]
+            }), 'player_stats', year=year)
+            self.write(pd.DataFrame({'season': [year], 'team': ['KC']}), 'depth_charts', year=year)
+
+    def test_matches_sync_api(self):
+        async def load():
+            return await asyncio.gather(
+                aio.import_weekly_data([2020, 2021]),
+                aio.import_depth_charts([2020, 2021]),
+            )
+
+        weekly, depth = asyncio.run(load())
+        self.assertEqual(len(self.requests), 4)
+        pd.testing.assert_frame_equal(weekly, nfl.import_weekly_data([2020, 2021]))
+        pd.testing.assert_frame_equal(depth, nfl.import_depth_charts([2020, 2021]))
+        self.assertEqual(len(self.requests), 4)
+
+    def test_streams_downloads_into_the_cache(self):
+        with nfl.collect_events() as collected:
+            asyncio.run(aio.import_weekly_data([2020, 2021]))
+        fetched = {e['url']: e['bytes'] for e in collected if e['stage'] == 'fetch'}
+        stored = nfl.cache_info().set_index('url')['size'].to_dict()
+        self.assertEqual(fetched, stored)
+        cached = os.listdir(os.path.join(self.root, 'cache'))
+        self.assertFalse([name for name in cached if name.endswith('.part')])
+
+    def test_works_without_disk_cache(self):
+        nfl.configure_cache(enabled=False)
+        weekly = asyncio.run(aio.import_weekly_data([2020]))
+        self.assertEqual(weekly.season.tolist(), [2020, 2020])
+        self.assertEqual(len(os.listdir(self.root)), 1)
+
+    def test_raises_loader_errors(self):
+        with self.assertRaises(ValueError):
+            asyncio.run(aio.import_depth_charts([1990]))
+        with self.assertRaises(nfl.FetchError):
+            asyncio.run(aio.import_depth_charts([2022]))
@@ -0,0 +1,47 @@
+from unittest import skipIf
+
+import pandas as pd
+
+import nfl_data_py as nfl
+from nfl_data_py.tests.pbp_test import pbp_server
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+
+@skipIf(pa is None, 'pyarrow is not installed')
+class test_arrow_backend(pbp_server):
+    def test_matches_pandas_result(self):
+        table = nfl.import_pbp_data([2020, 2021, 2022], backend='arrow')
+        self.assertIsInstance(table, pa.Table)
+        pd.testing.assert_frame_equal(
+            table.to_pandas(), nfl.import_pbp_data([2020, 2021, 2022]), check_dtype=False
+        )
+        self.assertEqual(table.schema.field('epa').type, pa.float32())
+        self.assertEqual(table.schema.field('offense_formation').type, pa.string())
+
+    def test_concatenates_without_copying(self):
+        table = nfl.import_pbp_data([2020, 2021, 2022], include_participation=False, backend='arrow')
+        self.assertEqual(table.column('play_id').num_chunks, 3)
+
+    def test_filters_columns_and_chunks(self):
+        table = nfl.import_pbp_data(
+            [2020, 2021], columns=['epa'], filters=[('play_id', '<', 2)], backend='arrow'
+        )
+        self.assertEqual(table.num_rows, 4)
+        self.assertNotIn('offense_players', table.column_names)
+
+        chunks = list(nfl.iter_pbp_data([2020, 2021, 2022], chunksize=5, backend='arrow'))
+        self.assertEqual([c.num_rows for c in chunks], [5, 5, 2])
+
+    def test_rejects_unknown_backend(self):
+        self.assertRaises(ValueError, nfl.import_pbp_data, [2020], backend='numpy')
+
+    def test_compact_shares_dictionaries(self):
+        table = nfl.import_pbp_data([2020, 2021, 2022], compact=True, backend='arrow')
+        chunks = table.column('game_id').chunks
+        self.assertTrue(pa.types.is_dictionary(table.schema.field('game_id').type))
+        self.assertTrue(all(c.dictionary.equals(chunks[0].dictionary) for c in chunks))
+        self.assertEqual(table.schema.field('play_id').type, pa.int8())
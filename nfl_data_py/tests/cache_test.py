@@ -0,0 +1,75 @@
+from unittest import TestCase
+import tempfile
+import shutil
+import os
+
+import pandas as pd
+
+import nfl_data_py as nfl
+from nfl_data_py import cache
+from nfl_data_py.tests.upstream import serve
+
+
+class test_fetch_cache(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.files = os.path.join(self.root, 'files')
+        os.makedirs(self.files)
+        pd.DataFrame({'a': [1.0, 2.0], 'season': [2020, 2020]}).to_parquet(
+            os.path.join(self.files, 'x.parquet')
+        )
+        self.server, self.requests = serve(self.files)
+        self.url = f'http://127.0.0.1:{self.server.server_port}/'
+        nfl.configure_cache(path=os.path.join(self.root, 'cache'), ttl=3600)
+
+    def tearDown(self):
+        self.server.shutdown()
+        nfl.configure_cache(path=False, ttl=False, max_bytes=cache.DEFAULT_MAX_BYTES)
+        shutil.rmtree(self.root)
+
+    def test_second_fetch_is_served_from_disk(self):
+        first = cache.fetch(self.url + 'x.parquet', 'pbp')
+        second = cache.fetch(self.url + 'x.parquet', 'pbp')
+        self.assertEqual(first, second)
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(pd.read_parquet(second).a.tolist(), [1.0, 2.0])
+
+    def test_revalidates_after_ttl(self):
+        nfl.configure_cache(ttl={'pbp': 0})
+        cache.fetch(self.url + 'x.parquet', 'pbp')
+        cache.fetch(self.url + 'x.parquet', 'pbp')
+        self.assertEqual(len(self.requests), 2)
+        self.assertIn('If-Modified-Since', self.requests[1])
+        self.assertEqual(len(nfl.cache_info()), 1)
+
+    def test_evicts_least_recently_used(self):
+        for name in ('y.parquet', 'z.parquet'):
+            shutil.copy(os.path.join(self.files, 'x.parquet'), os.path.join(self.files, name))
+        size = os.path.getsize(os.path.join(self.files, 'x.parquet'))
+        nfl.configure_cache(max_bytes=2 * size)
+
+        for name in ('x.parquet', 'y.parquet', 'z.parquet'):
+            cache.fetch(self.url + name)
+
+        urls = nfl.cache_info().url.tolist()
+        self.assertCountEqual(urls, [self.url + 'y.parquet', self.url + 'z.parquet'])
+
+    def test_keeps_leased_files_until_they_are_read(self):
+        for name in ('y.parquet', 'z.parquet'):
+            shutil.copy(os.path.join(self.files, 'x.parquet'), os.path.join(self.files, name))
+        nfl.configure_cache(max_bytes=1)
+
+        with cache.leased():
+            first = cache.fetch(self.url + 'x.parquet')
+            cache.fetch(self.url + 'y.parquet')
+            self.assertEqual(nfl.prune_cache(), 0)
+            self.assertEqual(pd.read_parquet(first).a.tolist(), [1.0, 2.0])
+        self.assertEqual(cache._leases, {})
+
+        cache.fetch(self.url + 'z.parquet')
+        self.assertEqual(nfl.cache_info().url.tolist(), [self.url + 'z.parquet'])
+
+    def test_clear_cache(self):
+        cache.fetch(self.url + 'x.parquet', 'pbp')
+        nfl.clear_cache()
+        self.assertTrue(nfl.cache_info().empty)
@@ -0,0 +1,86 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+import nfl_data_py as nfl
+from nfl_data_py import cleaning
+
+
+class test_clean_nfl_data(TestCase):
+    def test_replaces_names_teams_and_na(self):
+        df = pd.DataFrame({
+            'name': ['DJ Chark', 'NA', 'Patrick Mahomes', None],
+            'col_team': ['Pitt', 'LSU', 'NA', 'Ole Miss'],
+            'position': ['WR', 'NA', 'QB', 'WR'],
+            'yards': [1.0, 2.0, np.nan, 4.0],
+        })
+        result = nfl.clean_nfl_data(df)
+
+        self.assertIs(result, df)
+        self.assertEqual(df['name'].tolist()[::2], ['D.J. Chark', 'Patrick Mahomes'])
+        self.assertEqual(df['col_team'].tolist()[:2], ['Pittsburgh', 'LSU'])
+        self.assertEqual(df['col_team'].iloc[3], 'Mississippi')
+        self.assertEqual(df['position'].isna().tolist(), [False, True, False, False])
+        self.assertTrue(pd.isna(df['name'].iloc[1]) and pd.isna(df['col_team'].iloc[2]))
+
+    def test_numbers_left_after_na_are_converted(self):
+        df = pd.DataFrame({'a': pd.Series([1, 'NA', 3], dtype=object), 'b': ['x', 'NA', 'y']})
+        nfl.clean_nfl_data(df)
+        self.assertEqual(df['a'].dtype, np.float64)
+        self.assertEqual(df['b'].dtype, object)
+
+    def test_categories_are_remapped(self):
+        df = pd.DataFrame({'name': pd.Categorical(['DJ Chark', 'D.J. Chark', 'NA', None])})
+        nfl.clean_nfl_data(df)
+
+        # NA strings are only missing values in object columns
+        self.assertEqual(df['name'].cat.categories.tolist(), ['D.J. Chark', 'NA'])
+        self.assertEqual(df['name'].cat.codes.tolist(), [0, 0, 1, -1])
+
+    def test_categories_can_map_to_missing(self):
+        df = pd.DataFrame({'college': pd.Categorical(['Old U', 'KC', 'Old U'])})
+        nfl.clean_nfl_data(df, replacements={'college': {'Old U': np.nan}})
+        self.assertEqual(df['college'].cat.categories.tolist(), ['KC'])
+        self.assertEqual(df['college'].cat.codes.tolist(), [-1, 0, -1])
+
+    def test_other_dtypes_untouched(self):
+        df = pd.DataFrame({'x': pd.Series(['NA', 'a'], dtype='string'), 'y': [1, 2]})
+        nfl.clean_nfl_data(df)
+        self.assertEqual(df['x'].tolist(), ['NA', 'a'])
+        self.assertEqual(df['y'].tolist(), [1, 2])
+
+
+class test_replacement_tables(TestCase):
+    def test_call_replacements_extend_the_tables(self):
+        df = pd.DataFrame({'name': ['DJ Chark', 'Gabe Davis'], 'team': ['OAK', 'KC']})
+        nfl.clean_nfl_data(df, {'name': {'Gabe Davis': 'Gabriel Davis'}, 'team': {'OAK': 'LV'}})
+        self.assertEqual(df['name'].tolist(), ['D.J. Chark', 'Gabriel Davis'])
+        self.assertEqual(df['team'].tolist(), ['LV', 'KC'])
+
+        # the registered tables are unchanged
+        self.assertNotIn('Gabe Davis', cleaning.tables()['name'])
+
+    def test_register(self):
+        cleaning.register('registered_test_col', {'old': 'new'})
+        self.assertEqual(cleaning.tables()['registered_test_col'], {'old': 'new'})
+
+        df = pd.DataFrame({'registered_test_col': ['old', 'NA', 'other']})
+        nfl.clean_nfl_data(df)
+        self.assertEqual(df['registered_test_col'].tolist()[::2], ['new', 'other'])
+        self.assertTrue(pd.isna(df['registered_test_col'].iloc[1]))
+
+    def test_matches_replace(self):
+        rng = np.random.default_rng(0)
+        names = list(cleaning.NAMES) + ['Patrick Mahomes', 'NA', None]
+        df = pd.DataFrame({
+            'name': rng.choice(np.array(names, dtype=object), 500),
+            'col_team': pd.Categorical(rng.choice(list(cleaning.COLLEGE_TEAMS) + ['Alabama'], 500)),
+            'other': rng.choice(np.array(['a', 'NA'], dtype=object), 500),
+        })
+        expected = df.copy()
+        for col in ['name', 'other']:
+            expected.replace({col: {'NA': np.nan}}, inplace=True)
+        expected.replace({'name': cleaning.NAMES, 'col_team': cleaning.COLLEGE_TEAMS}, inplace=True)
+
+        pd.testing.assert_frame_equal(nfl.clean_nfl_data(df), expected)
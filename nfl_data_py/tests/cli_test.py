@@ -0,0 +1,75 @@
+from contextlib import redirect_stdout, redirect_stderr
+import io
+import os
+
+import pandas as pd
+
+import nfl_data_py as nfl
+from nfl_data_py import cache, cli, sources
+from nfl_data_py.tests.upstream import upstream_server
+
+
+class test_cli(upstream_server):
+    def setUp(self):
+        super().setUp()
+        for year in (2021, 2022):
+            self.write(
+                pd.DataFrame({'player_id': ['a'] * 100, 'season': [year] * 100}),
+                'player_stats', year=year
+            )
+        self.cache = os.path.join(self.root, 'cache')
+
+    def run_cli(self, *args):
+        out, err = io.StringIO(), io.StringIO()
+        with redirect_stdout(out), redirect_stderr(err):
+            code = cli.main(['--cache-dir', self.cache, *args])
+        return code, out.getvalue(), err.getvalue()
+
+    def warm(self, *args):
+        return self.run_cli(
+            'warm', '--datasets', 'player_stats', '--years', '2021', '2022', '2030', *args
+        )
+
+    def test_warm_reports_throughput(self):
+        code, out, _ = self.warm('--workers', '2')
+        self.assertEqual(code, 0)
+        self.assertIn('2 downloaded, 1 missing', out)
+        self.assertIn('MB/s', out)
+        self.assertIn('files/s', out)
+
+        code, out, _ = self.warm()
+        self.assertEqual(code, 0)
+        self.assertIn('2 cached', out)
+
+    def test_warm_fails_on_partial_failure(self):
+        nfl.configure_sources(mirror='http://127.0.0.1:9/')
+        code, _, err = self.warm()
+        self.assertEqual(code, 1)
+        self.assertIn('failed', err)
+
+    def test_verify_and_prune(self):
+        self.warm()
+
+        code, out, _ = self.run_cli('verify')
+        self.assertEqual(code, 0)
+        self.assertIn('2 of 2 cached files intact', out)
+
+        path = cache.lookup(sources.url('player_stats', year=2021))[0]
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 1)
+        code, _, err = self.run_cli('verify')
+        self.assertEqual(code, 1)
+        self.assertIn('size does not match', err)
+
+        self.assertEqual(self.run_cli('verify', '--remove')[0], 0)
+        self.assertEqual(len(cache.cache_info()), 1)
+
+        code, out, _ = self.run_cli('status')
+        self.assertIn('player_stats', out)
+
+        self.run_cli('prune', '--max-mb', '0')
+        self.assertTrue(cache.cache_info().empty)
+
+    def test_rejects_unknown_dataset(self):
+        with redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            cli.main(['warm', '--datasets', 'nope'])
@@ -0,0 +1,53 @@
+import pandas as pd
+
+import nfl_data_py as nfl
+from nfl_data_py import events
+from nfl_data_py.tests.pbp_test import pbp_server
+
+
+class test_events(pbp_server):
+    def test_reports_every_stage_of_a_pbp_load(self):
+        with nfl.collect_events() as collected:
+            nfl.import_pbp_data([2020, 2021, 2022])
+        df = pd.DataFrame(collected)
+
+        fetches = df[df.stage == 'fetch']
+        self.assertEqual(len(fetches), 5)
+        self.assertTrue((fetches.cache == 'miss').all())
+        self.assertTrue((fetches.bytes > 0).all())
+
+        decoded = df[(df.stage == 'decode') & (df.dataset == 'pbp')]
+        self.assertEqual(dict(zip(decoded.year, decoded.rows)), {2020: 5, 2021: 3, 2022: 4})
+        self.assertEqual(len(df[(df.stage == 'merge') & df.year.notna()]), 2)
+        self.assertEqual(df[df.stage == 'done'].rows.sum(), 12)
+        self.assertTrue((df.loc[df.stage != 'done', 'seconds'] >= 0).all())
+
+        with nfl.collect_events() as collected:
+            nfl.import_pbp_data([2020])
+        caches = [e['cache'] for e in collected if e['stage'] == 'fetch']
+        self.assertEqual(caches, ['hit', 'hit'])
+
+    def test_missing_season_is_logged_as_warning(self):
+        with self.assertLogs('nfl_data_py', 'WARNING') as logs:
+            nfl.import_pbp_data([2020, 2023])
+        self.assertEqual(len(logs.records), 1)
+        self.assertEqual(logs.records[0].year, 2023)
+        self.assertIn('Data not available for pbp 2023', logs.output[0])
+
+    def test_records_carry_fields(self):
+        with self.assertLogs('nfl_data_py', 'DEBUG') as logs:
+            nfl.import_pbp_data([2020], include_participation=False)
+        fetch = next(r for r in logs.records if r.stage == 'fetch')
+        self.assertTrue(fetch.url.endswith('play_by_play_2020.parquet'))
+        self.assertEqual(fetch.cache, 'miss')
+
+    def test_hooks_can_be_removed(self):
+        seen = []
+        nfl.add_event_hook(seen.append)
+        nfl.import_pbp_data([2020], include_participation=False)
+        nfl.remove_event_hook(seen.append)
+        count = len(seen)
+        nfl.import_pbp_data([2021], include_participation=False)
+        self.assertGreater(count, 0)
+        self.assertEqual(len(seen), count)
+        self.assertEqual(events._hooks, [])
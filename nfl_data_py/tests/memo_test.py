@@ -0,0 +1,83 @@
+from unittest import TestCase
+
+import pandas as pd
+
+import nfl_data_py as nfl
+from nfl_data_py.memo import memoize
+
+
+calls = []
+saved = {}
+
+@memoize
+def load(years, columns=None):
+    calls.append(list(years))
+    return pd.DataFrame({'season': list(years), 'value': [1.5] * len(years)})
+
+
+@memoize(bypass=('state',))
+def update(years, state=None):
+    calls.append(list(years))
+    if state is not None:
+        saved.setdefault(state, []).append(list(years))
+    return pd.DataFrame({'season': list(years)})
+
+
+class test_memory_cache(TestCase):
+    def setUp(self):
+        calls.clear()
+        nfl.enable_memory_cache()
+
+    def tearDown(self):
+        nfl.disable_memory_cache()
+
+    def test_is_disabled_by_default(self):
+        nfl.disable_memory_cache()
+        load([2020])
+        load([2020])
+        self.assertEqual(len(calls), 2)
+
+    def test_reuses_results_for_equivalent_args(self):
+        load([2020, 2021])
+        load(range(2020, 2022), columns=None)
+        info = nfl.memory_cache_info()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((info['hits'], info['misses']), (1, 1))
+
+    def test_returns_defensive_copies(self):
+        load([2020])['value'] = 0
+        self.assertEqual(load([2020]).value.tolist(), [1.5])
+
+    def test_evicts_least_recently_used(self):
+        size = int(load([2020]).memory_usage(deep=True).sum())
+        nfl.enable_memory_cache(max_bytes=2 * size)
+        load([2021])
+        load([2020])
+        load([2022])
+        load([2020])
+        load([2021])
+        self.assertEqual(calls, [[2020], [2021], [2022], [2021]])
+        self.assertEqual(nfl.memory_cache_info()['entries'], 2)
+
+    def test_bypasses_calls_with_side_effects(self):
+        update([2020])
+        update([2020])
+        update([2020], state='state')
+        update([2020], state='state')
+        self.assertEqual(saved.pop('state'), [[2020], [2020]])
+        self.assertEqual(len(calls), 3)
+
+    def test_reloads_after_sources_or_transport_change(self):
+        load([2020])
+        nfl.configure_sources(mirror='/srv/nflverse')
+        try:
+            load([2020])
+        finally:
+            nfl.configure_sources(mirror=False)
+        load([2020])
+        nfl.configure_transport(lambda url, headers, method: None)
+        try:
+            load([2020])
+        finally:
+            nfl.configure_transport('live')
+        self.assertEqual(len(calls), 3)
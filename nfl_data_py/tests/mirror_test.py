@@ -0,0 +1,98 @@
+from unittest import TestCase, mock
+import tempfile
+import shutil
+import os
+
+import pandas as pd
+
+import nfl_data_py as nfl
+from nfl_data_py import sources, mirror
+from nfl_data_py.tests.upstream import serve
+
+
+class test_sources(TestCase):
+    def tearDown(self):
+        nfl.configure_sources(mirror=False, bases={name: None for name in sources.BASES})
+
+    def test_upstream_by_default(self):
+        self.assertEqual(
+            sources.url('pbp', year=2020),
+            'https://github.com/nflverse/nflverse-data/releases/download/pbp/play_by_play_2020.parquet'
+        )
+
+    def test_mirror_and_base_overrides(self):
+        nfl.configure_sources(mirror='http://mirror.lan/nfl/')
+        self.assertEqual(
+            sources.url('schedules'), 'http://mirror.lan/nfl/habitatring/games.csv'
+        )
+
+        nfl.configure_sources(bases={'nflverse-data': 'http://other.lan/releases'})
+        self.assertEqual(
+            sources.url('rosters', year=2021), 'http://other.lan/releases/rosters/roster_2021.parquet'
+        )
+        self.assertEqual(sources.upstream_url('schedules'), sources.HABITATRING + 'games.csv')
+
+    def test_unknown_base(self):
+        with self.assertRaises(ValueError):
+            nfl.configure_sources(bases={'github': 'http://x'})
+
+    def test_files_of_datasets(self):
+        self.assertEqual(mirror.files(['players', 'injuries']), [('players', {})])
+        self.assertEqual(
+            mirror.files(['pfr_week'], [2020]),
+            [('pfr_week', {'s_type': s, 'year': 2020}) for s in sources.PARAMS['s_type']]
+        )
+
+
+class test_sync_mirror(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        upstream = os.path.join(self.root, 'upstream')
+        os.makedirs(os.path.join(upstream, 'player_stats'))
+        for year in (2021, 2022):
+            pd.DataFrame({'player_id': ['a'], 'season': [year], 'week': [1]}).to_parquet(
+                os.path.join(upstream, 'player_stats', f'player_stats_{year}.parquet')
+            )
+        self.server, self.requests = serve(upstream)
+        base = f'http://127.0.0.1:{self.server.server_port}/'
+        # stand in for the upstream host of player_stats
+        self.patches = [
+            mock.patch.dict(sources.BASES, {'nflverse-data': base}),
+            mock.patch.dict(sources.URLS, {
+                'player_stats': base + 'player_stats/player_stats_{year}.parquet'
+            }),
+        ]
+        for patch in self.patches:
+            patch.start()
+        self.mirror = os.path.join(self.root, 'mirror')
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        self.server.shutdown()
+        nfl.configure_sources(mirror=False)
+        shutil.rmtree(self.root)
+
+    def test_sync_then_read_from_mirror(self):
+        report = nfl.sync_mirror(['player_stats'], [2021, 2022, 2023], path=self.mirror)
+        self.assertEqual(report.status.tolist(), ['downloaded', 'downloaded', 'missing'])
+
+        again = nfl.sync_mirror(['player_stats'], [2021, 2022], path=self.mirror)
+        self.assertEqual(again.status.tolist(), ['unchanged', 'unchanged'])
+        self.assertIn('If-Modified-Since', self.requests[-1])
+
+        requests = len(self.requests)
+        nfl.configure_sources(mirror=self.mirror)
+        path = sources.url('player_stats', year=2022)
+        self.assertTrue(path.startswith(self.mirror))
+        self.assertEqual(pd.read_parquet(nfl.fetch(path)).season.tolist(), [2022])
+        self.assertEqual(len(self.requests), requests)
+
+    def test_missing_local_file_is_not_found(self):
+        nfl.configure_sources(mirror=self.mirror)
+        with self.assertRaises(nfl.HTTPError):
+            nfl.fetch(sources.url('player_stats', year=2030))
+
+    def test_requires_a_local_path(self):
+        with self.assertRaises(ValueError):
+            nfl.sync_mirror(['players'])
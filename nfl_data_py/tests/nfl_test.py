@@ -1,15 +1,47 @@
-from unittest import TestCase
+from unittest import TestCase, skipIf
 from pathlib import Path
+import tempfile
 import shutil
 import random
+import io
+import os
 
 import pandas as pd
 
 import nfl_data_py as nfl
+from nfl_data_py import sources, transport
+
+# responses recorded from synthetic files, regenerate with record_fixtures.py
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# values in the checked-in store are noise, tests of upstream values need the
+# live files or a store recorded from them
+SYNTHETIC = (
+    os.environ.get('NFL_DATA_PY_TRANSPORT', 'replay') != 'live'
+    and os.path.abspath(os.environ.get('NFL_DATA_PY_FIXTURES', FIXTURES)) == FIXTURES
+)
+upstream_values = skipIf(SYNTHETIC, 'checks upstream values, the fixture store is synthetic')
+
+
+def setUpModule():
+    global saved, cache_dir
+    saved = nfl.transport_info()
+    if 'NFL_DATA_PY_TRANSPORT' not in os.environ:
+        nfl.configure_transport('replay', FIXTURES)
+    cache_dir = tempfile.mkdtemp()
+    nfl.configure_cache(path=cache_dir)
+
+
+def tearDownModule():
+    nfl.configure_transport(saved['mode'], saved['path'] or False)
+    nfl.configure_cache(path=False)
+    shutil.rmtree(cache_dir)
 
 
 class test_pbp(TestCase):
-    pbp = nfl.import_pbp_data([2020])
+    @classmethod
+    def setUpClass(cls):
+        cls.pbp = nfl.import_pbp_data([2020])
 
     def test_is_df_with_data(self):
         self.assertIsInstance(self.pbp, pd.DataFrame)
@@ -78,7 +110,9 @@ class test_weekly_cols(TestCase):
         self.assertTrue(len(s) > 0)
         
 class test_seasonal_rosters(TestCase):
-    data = nfl.import_seasonal_rosters([2020])
+    @classmethod
+    def setUpClass(cls):
+        cls.data = nfl.import_seasonal_rosters([2020])
     
     def test_is_df_with_data(self):
         self.assertIsInstance(self.data, pd.DataFrame)
@@ -90,6 +124,7 @@ class test_seasonal_rosters(TestCase):
         self.assertGreater(len(s), len(self.data))
         self.assertListEqual(s.season.unique().tolist(), [2022, 2023])
         
+    @upstream_values
     def test_computes_age_as_of_season_start(self):
         mahomes_ages = get_pat(self.data).age
         self.assertEqual(len(mahomes_ages), 1)
@@ -97,7 +132,9 @@ class test_seasonal_rosters(TestCase):
         
 
 class test_weekly_rosters(TestCase):
-    data = nfl.import_weekly_rosters([2022])
+    @classmethod
+    def setUpClass(cls):
+        cls.data = nfl.import_weekly_rosters([2022])
         
     def test_is_df_with_data(self):
         assert isinstance(self.data, pd.DataFrame)
@@ -109,12 +146,14 @@ class test_weekly_rosters(TestCase):
         self.assertGreater(len(s), len(self.data))
         self.assertListEqual(s.season.unique().tolist(), [2022, 2023])
         
+    @upstream_values
     def test_gets_weekly_updates(self):
         assert isinstance(self.data, pd.DataFrame)
         hock = get_hock(self.data)
         self.assertCountEqual(hock[hock.team == 'DET'].week, [1, 2, 3, 4, 5, 7, 8])
         self.assertCountEqual(hock[hock.team == 'MIN'].week, range(9, 20))
         
+    @upstream_values
     def test_computes_age_as_of_week(self):
         self.assertEqual(
             get_pat(self.data).sort_values("week").age.to_list(),
@@ -247,12 +286,15 @@ class test_qbr(TestCase):
         self.assertTrue(len(s) > 0)
         
 class test_seasonal_pfr(TestCase):
-    df = nfl.import_seasonal_pfr('pass')
+    @classmethod
+    def setUpClass(cls):
+        cls.df = nfl.import_seasonal_pfr('pass')
     
     def test_is_df_with_data(self):
         self.assertIsInstance(self.df, pd.DataFrame)
         self.assertTrue(len(self.df) > 0)
         
+    @upstream_values
     def test_contains_one_row_per_player_per_season(self):
         pat = get_pat(self.df)
         self.assertCountEqual(pat.season, pat.season.unique())
@@ -261,9 +303,7 @@ class test_seasonal_pfr(TestCase):
         self.assertIn("rpo_plays", self.df.columns)
     
     def test_retrieves_all_available_years_by_default(self):
-        available_years = pd.read_parquet(
-            "https://github.com/nflverse/nflverse-data/releases/download/pfr_advstats/advstats_season_pass.parquet"
-        ).season.unique()
+        available_years = read_upstream('pfr_season', s_type='pass').season.unique()
         self.assertCountEqual(self.df.season.unique(), available_years)
         
     def test_filters_by_year(self):
@@ -271,12 +311,15 @@ class test_seasonal_pfr(TestCase):
         self.assertCountEqual(only_20_21.season.unique(), [2020, 2021])
         
 class test_weekly_pfr(TestCase):
-    df = nfl.import_weekly_pfr('pass')
+    @classmethod
+    def setUpClass(cls):
+        cls.df = nfl.import_weekly_pfr('pass')
     
     def test_is_df_with_data(self):
         self.assertIsInstance(self.df, pd.DataFrame)
         self.assertTrue(len(self.df) > 0)
         
+    @upstream_values
     def test_contains_one_row_per_player_per_week(self):
         test_seasons = self.df.loc[self.df.season.isin(range(2018, 2023))]
         weeks_per_season = get_pat(test_seasons).groupby("season").week.nunique()
@@ -286,9 +329,7 @@ class test_weekly_pfr(TestCase):
         self.assertNotIn("rpo_plays", self.df.columns)
     
     def test_retrieves_all_available_years_by_default(self):
-        available_years = pd.read_parquet(
-            "https://github.com/nflverse/nflverse-data/releases/download/pfr_advstats/advstats_season_pass.parquet"
-        ).season.unique()
+        available_years = read_upstream('pfr_season', s_type='pass').season.unique()
         self.assertCountEqual(self.df.season.unique(), available_years)
         
     def test_filters_by_year(self):
@@ -354,4 +395,8 @@ def get_pat(df):
     return __get_player(df, 'Patrick Mahomes')
 
 def get_hock(df):
-    return __get_player(df, 'T.J. Hockenson')
\ No newline at end of file
+    return __get_player(df, 'T.J. Hockenson')
+
+def read_upstream(dataset, **params):
+    with transport.request(sources.url(dataset, **params)) as resp:
+        return pd.read_parquet(io.BytesIO(resp.read()))
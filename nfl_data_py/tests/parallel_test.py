@@ -0,0 +1,85 @@
+from unittest import TestCase
+from urllib.error import HTTPError
+import threading
+import time
+
+from nfl_data_py.parallel import map_ordered, FetchError, Prefetcher
+
+
+def slow_square(x):
+    time.sleep(0.2 if x == 1 else 0.05)
+    return x * x
+
+
+class test_map_ordered(TestCase):
+    def test_preserves_input_order(self):
+        self.assertEqual(map_ordered(slow_square, [1, 2, 3]), [1, 4, 9])
+        self.assertEqual(map_ordered(slow_square, [1, 2, 3], thread_requests=False), [1, 4, 9])
+
+    def test_takes_as_long_as_slowest_item(self):
+        start = time.perf_counter()
+        map_ordered(slow_square, [1] * 8)
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+    def test_bounds_concurrency(self):
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def track(x):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+
+        map_ordered(track, range(20), max_workers=3)
+        self.assertLessEqual(peak[0], 3)
+
+    def test_reports_failures_per_item(self):
+        def load(year):
+            if year % 2:
+                raise ValueError(f'no data for {year}')
+            return year
+
+        with self.assertRaises(FetchError) as ctx:
+            map_ordered(load, [2020, 2021, 2022, 2023])
+
+        self.assertCountEqual(ctx.exception.failures, [2021, 2023])
+        self.assertEqual(ctx.exception.results, [(2020, 2020), (2022, 2022)])
+
+    def test_failure_keeps_the_original_type(self):
+        def load(year):
+            if year > 2020:
+                raise HTTPError(f'https://x/{year}', 404, 'Not Found', {}, None)
+            return year
+
+        with self.assertRaises(HTTPError) as ctx:
+            map_ordered(load, [2020, 2021, 2022])
+
+        self.assertIsInstance(ctx.exception, FetchError)
+        self.assertEqual(ctx.exception.code, 404)
+        self.assertCountEqual(ctx.exception.failures, [2021, 2022])
+        self.assertIn('2021', str(ctx.exception))
+
+
+class test_prefetcher(TestCase):
+    def test_runs_ahead_when_threaded(self):
+        start = time.perf_counter()
+        with Prefetcher(slow_square, [1, 2, 3]) as pre:
+            time.sleep(0.2)
+            results = [pre.result(x) for x in (1, 2, 3)]
+        self.assertEqual(results, [1, 4, 9])
+        self.assertLess(time.perf_counter() - start, 0.35)
+
+    def test_calls_lazily_when_serial(self):
+        called = []
+        with Prefetcher(called.append, [2020, 2021], thread_requests=False) as pre:
+            self.assertEqual(called, [])
+            pre.result(2021)
+        self.assertEqual(called, [2021])
+
+    def test_reraises_failures(self):
+        with Prefetcher(lambda x: 1 / x, [0, 1]) as pre:
+            self.assertEqual(pre.result(1), 1)
+            self.assertRaises(ZeroDivisionError, pre.result, 0)
@@ -0,0 +1,50 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from nfl_data_py.participation import OnField
+
+
+class test_on_field(TestCase):
+    def setUp(self):
+        self.pbp = pd.DataFrame({
+            'offense_players': ['a;b;c', 'c;b;a', 'a;d', None],
+            'defense_players': ['x;y', 'x;y', 'y;z', 'x'],
+        })
+        self.on_field = OnField.from_pbp(self.pbp)
+
+    def test_codes_index_sorted_players(self):
+        self.assertEqual(list(self.on_field.players), ['a', 'b', 'c', 'd', 'x', 'y', 'z'])
+        self.assertEqual(self.on_field.offsets['offense'].tolist(), [0, 3, 6, 8, 8])
+        self.assertEqual(self.on_field.players_on(2), ['a', 'd', 'y', 'z'])
+        self.assertEqual(self.on_field.players_on(3, side='offense'), [])
+
+    def test_plays_with_player(self):
+        on_field = self.on_field
+        self.assertEqual(on_field.plays_with_player(['d', 'x']).tolist(), [True, True, True, True])
+        self.assertEqual(
+            on_field.plays_with_player(['b', 'x'], how='all').tolist(), [True, True, False, False]
+        )
+        self.assertEqual(
+            on_field.plays_with_player(['x'], side='offense').tolist(), [False] * 4
+        )
+        self.assertFalse(on_field.plays_with_player(['a', 'nobody'], how='all').any())
+        self.assertRaises(ValueError, on_field.plays_with_player, ['a'], how='some')
+
+    def test_aggregations(self):
+        on_field = self.on_field
+        self.assertEqual(on_field.snap_counts(side='offense').to_dict(), {'a': 3, 'b': 2, 'c': 2, 'd': 1})
+        self.assertEqual(
+            on_field.snap_counts(mask=np.array([False, False, True, True])).to_dict(),
+            {'x': 1, 'y': 1, 'z': 1, 'a': 1, 'd': 1}
+        )
+        self.assertEqual(on_field.lineup_ids().tolist(), [0, 0, 1, -1])
+        self.assertEqual(on_field.lineup_ids('defense').tolist(), [0, 0, 1, 2])
+
+        long = on_field.to_long()
+        self.assertEqual(len(long), 15)
+        self.assertEqual(long[long.play == 2].player_id.tolist(), ['a', 'd', 'y', 'z'])
+
+    def test_requires_participation(self):
+        self.assertRaises(ValueError, OnField.from_pbp, self.pbp[['defense_players']])
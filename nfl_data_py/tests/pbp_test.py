@@ -0,0 +1,275 @@
+from unittest import mock, skipIf
+import os
+
+import pandas as pd
+
+import nfl_data_py as nfl
+from nfl_data_py import backends, cli, pbp_cache
+from nfl_data_py.tests.upstream import upstream_server
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+
+class pbp_server(upstream_server):
+    """Serves three seasons of pbp data, participation for 2020 and 2021 only"""
+
+    def setUp(self):
+        super().setUp()
+        for year, plays in ((2020, 5), (2021, 3), (2022, 4)):
+            game_id = f'{year}_01_KC_BUF'
+            self.write(pd.DataFrame({
+                'play_id': range(plays),
+                'game_id': [game_id] * plays,
+                'old_game_id': [str(year)] * plays,
+                'epa': [0.5] * plays,
+            }), 'pbp', year=year)
+            if year != 2022:
+                self.write(pd.DataFrame({
+                    'nflverse_game_id': [game_id] * plays,
+                    'play_id': range(plays),
+                    'old_game_id': [str(year)] * plays,
+                    'offense_formation': ['SHOTGUN'] * plays,
+                }), 'pbp_participation', year=year)
+
+
+class test_iter_pbp_data(pbp_server):
+    def test_yields_seasons_like_import(self):
+        years = [2020, 2021, 2022]
+        seasons = list(nfl.iter_pbp_data(years))
+        self.assertEqual([s.season.iloc[0] for s in seasons], years)
+        pd.testing.assert_frame_equal(
+            pd.concat(seasons, ignore_index=True), nfl.import_pbp_data(years)
+        )
+        self.assertEqual(seasons[0].epa.dtype, 'float32')
+
+    def test_yields_fixed_size_chunks(self):
+        chunks = list(nfl.iter_pbp_data([2020, 2021, 2022], chunksize=5, prefetch=2))
+        self.assertEqual([len(c) for c in chunks], [5, 5, 2])
+        self.assertEqual(chunks[1].season.tolist(), [2021] * 3 + [2022] * 2)
+
+    def test_skips_missing_seasons(self):
+        seasons = list(nfl.iter_pbp_data([2020, 2023], prefetch=0))
+        self.assertEqual(len(seasons), 1)
+        self.assertRaises(ValueError, next, nfl.iter_pbp_data([2020], chunksize=0))
+
+    def test_filters_rows_and_prunes_seasons(self):
+        df = nfl.import_pbp_data(
+            [2020, 2021, 2022], columns=['epa'],
+            filters=[('season', '>=', 2021), ('play_id', '<', 2)]
+        )
+        self.assertEqual(df.season.tolist(), [2021, 2021, 2022, 2022])
+        # pbp and participation for 2021 and 2022 only
+        self.assertEqual(len(self.requests), 4)
+
+        chunks = list(nfl.iter_pbp_data(
+            [2020, 2021], filters=[[('offense_formation', '==', 'SHOTGUN'), ('play_id', '==', 0)]]
+        ))
+        self.assertEqual([len(c) for c in chunks], [1, 1])
+        self.assertRaises(ValueError, nfl.import_pbp_data, [2020], filters=[('week', '~', 1)])
+
+
+class test_cache_pbp(pbp_server):
+    def test_writes_seasons_readable_by_import(self):
+        local = os.path.join(self.root, 'pbp')
+        nfl.cache_pbp([2020, 2021, 2022], alt_path=local)
+
+        self.assertEqual(
+            sorted(os.listdir(os.path.join(local, 'season=2021'))), ['part.0.parquet']
+        )
+        df = nfl.import_pbp_data([2020, 2021, 2022], cache=True, alt_path=local)
+        self.assertEqual(len(df), 12)
+        self.assertEqual(df.offense_formation.notna().sum(), 8)
+
+    def test_skips_unchanged_seasons(self):
+        local = os.path.join(self.root, 'pbp')
+        nfl.cache_pbp([2020, 2021], alt_path=local)
+        downloads = len(self.requests)
+
+        nfl.cache_pbp([2020, 2021], alt_path=local)
+        self.assertEqual(len(self.requests), downloads)
+
+        # a newer upstream file is downloaded again, even within the download cache TTL
+        changed = self.path('pbp', year=2021)
+        pd.DataFrame({
+            'play_id': [0], 'game_id': ['2021_01_KC_BUF'], 'old_game_id': ['2021'], 'epa': [1.0]
+        }).to_parquet(changed)
+        os.utime(changed, (2e9, 2e9))
+
+        nfl.cache_pbp([2020, 2021], alt_path=local, thread_requests=False)
+        self.assertEqual(len(self.requests), downloads + 2)
+        self.assertEqual(len(nfl.import_pbp_data([2021], cache=True, alt_path=local)), 1)
+
+    def test_failed_season_keeps_previous_copy(self):
+        local = os.path.join(self.root, 'pbp')
+        nfl.cache_pbp([2021], alt_path=local)
+        os.remove(self.path('pbp', year=2021))
+        nfl.configure_cache(enabled=False)
+
+        with self.assertWarns(DeprecationWarning):
+            nfl.cache_pbp([2021], alt_path=local)
+        self.assertEqual(len(nfl.import_pbp_data([2021], cache=True, alt_path=local)), 3)
+
+    def test_reports_every_season(self):
+        local = os.path.join(self.root, 'pbp')
+        nfl.cache_pbp([2020], alt_path=local)
+
+        with self.assertWarns(DeprecationWarning):
+            report = cli.warm_pbp([2023, 2020, 2021], workers=3, path=local)
+        self.assertEqual(report.year.tolist(), [2023, 2020, 2021])
+        self.assertEqual(report.status.tolist(), ['failed', 'up to date', 'cached'])
+        self.assertEqual(report.bytes[1], 0)
+        self.assertEqual(report.bytes[2], pbp_cache.read_manifest(local)['2021']['size'])
+        self.assertIn('404', report.error[0])
+
+    def test_manifest_indexes_seasons(self):
+        local = os.path.join(self.root, 'pbp')
+        nfl.cache_pbp([2020, 2022], alt_path=local)
+
+        entry = pbp_cache.read_manifest(local)['2020']
+        self.assertEqual(entry['file'], os.path.join('season=2020', 'part.0.parquet'))
+        self.assertEqual(entry['rows'], 5)
+        self.assertIn('offense_formation', entry['columns'])
+        self.assertEqual(pbp_cache.read_manifest(local)['2022']['participation'], 'missing')
+
+        with open(os.path.join(local, entry['file']), 'ab') as f:
+            f.write(b'0')
+        with mock.patch.object(backends, 'read_parquet') as read:
+            with self.assertRaisesRegex(ValueError, '2020 cache file was modified'):
+                nfl.import_pbp_data([2020], cache=True, alt_path=local)
+            self.assertRaisesRegex(
+                ValueError, '2021 is not cached', nfl.import_pbp_data, [2021], cache=True, alt_path=local
+            )
+            read.assert_not_called()
+
+    def test_interrupted_write_keeps_season_readable(self):
+        local = os.path.join(self.root, 'pbp')
+        nfl.cache_pbp([2020], alt_path=local)
+        before = pbp_cache.read_manifest(local)['2020']
+
+        # stop after the new file replaced the old one, before its entry is committed
+        path = self.path('pbp', year=2020)
+        pd.read_parquet(path).assign(epa=2.5).to_parquet(path)
+        os.utime(path, (2e9, 2e9))
+        with mock.patch.object(pbp_cache, 'update_manifest', side_effect=KeyboardInterrupt):
+            self.assertRaises(KeyboardInterrupt, nfl.cache_pbp, [2020], alt_path=local, thread_requests=False)
+
+        entry = pbp_cache.read_manifest(local)['2020']
+        self.assertNotEqual(entry['mtime'], before['mtime'])
+        self.assertIsNone(pbp_cache.problem(local, entry))
+        df = nfl.import_pbp_data([2020], cache=True, alt_path=local)
+        self.assertEqual(df.epa.tolist(), [2.5] * 5)
+
+    def test_reads_seasons_as_cached(self):
+        local = os.path.join(self.root, 'pbp')
+        nfl.cache_pbp([2021], alt_path=local)
+        entry = pbp_cache.read_manifest(local)['2021']
+        self.assertEqual(pbp_cache.mismatch(entry, ['epa', 'cpoe']), 'does not have columns cpoe')
+        requests = len(self.requests)
+
+        # a float64 read of a downcast season fails instead of rebuilding it
+        self.assertRaisesRegex(
+            ValueError, '2021 was cached with downcast=True',
+            nfl.import_pbp_data, [2021], cache=True, alt_path=local, downcast=False
+        )
+
+        # columns the season lacks are skipped like in downloads
+        df = nfl.import_pbp_data([2021], columns=['epa', 'nope'], cache=True, alt_path=local)
+        self.assertNotIn('nope', df.columns)
+        self.assertEqual(len(self.requests), requests)
+
+        nfl.cache_pbp([2021], downcast=False, alt_path=local)
+        df = nfl.import_pbp_data([2021], cache=True, alt_path=local, downcast=False)
+        self.assertEqual(df.epa.dtype, 'float64')
+
+    def test_reads_caches_without_manifest(self):
+        local = os.path.join(self.root, 'pbp')
+        nfl.cache_pbp([2021], alt_path=local)
+        os.remove(os.path.join(local, pbp_cache.MANIFEST))
+
+        self.assertEqual(len(nfl.import_pbp_data([2021], cache=True, alt_path=local)), 3)
+        self.assertRaises(ValueError, nfl.import_pbp_data, [2020], cache=True, alt_path=local)
+
+    def test_reads_legacy_seasons_next_to_manifest(self):
+        local = os.path.join(self.root, 'pbp')
+        legacy = pd.read_parquet(self.path('pbp', year=2020)).assign(season=2020)
+        legacy.to_parquet(local, partition_cols=['season'])
+        nfl.cache_pbp([2021], alt_path=local)
+
+        df = nfl.import_pbp_data([2020, 2021], cache=True, alt_path=local)
+        self.assertEqual(df.groupby('season').size().to_dict(), {2020: 5, 2021: 3})
+        self.assertRaisesRegex(
+            ValueError, '2022 is not cached', nfl.import_pbp_data, [2022], cache=True, alt_path=local
+        )
+
+
+class test_compact(pbp_server):
+    def test_encodes_repetitive_columns_across_seasons(self):
+        plain = nfl.import_pbp_data([2020, 2021, 2022])
+        df = nfl.import_pbp_data([2020, 2021, 2022], compact=True)
+
+        self.assertEqual(df.game_id.dtype, 'category')
+        self.assertEqual(
+            list(df.game_id.cat.categories), ['2020_01_KC_BUF', '2021_01_KC_BUF', '2022_01_KC_BUF']
+        )
+        self.assertEqual(df.play_id.dtype, 'int8')
+        self.assertLess(df.memory_usage(deep=True).sum(), plain.memory_usage(deep=True).sum())
+        pd.testing.assert_frame_equal(df.astype(plain.dtypes.to_dict()), plain)
+
+    def test_rejects_lazy_backend(self):
+        self.assertRaises(ValueError, nfl.import_pbp_data, [2020], compact=True, backend='polars')
+
+
+class test_read_time_downcast(pbp_server):
+    def test_decodes_floats_as_float32(self):
+        path = self.path('pbp', year=2020)
+        df = backends.read_parquet(
+            path, columns=['play_id', 'epa'], downcast=True, filters=[('play_id', '>', 2)]
+        )
+        self.assertEqual(df.epa.dtype, 'float32')
+        self.assertEqual(df.play_id.dtype, 'int64')
+        self.assertEqual(backends.read_parquet(path).epa.dtype, 'float64')
+
+    @skipIf(pq is None, 'pyarrow is not installed')
+    def test_skips_row_groups_ruled_out_by_filters(self):
+        path = os.path.join(self.root, 'groups.parquet')
+        pd.DataFrame({'play_id': range(100), 'epa': [0.5] * 100}).to_parquet(
+            path, engine='pyarrow', row_group_size=10
+        )
+        read = []
+        iter_batches = pq.ParquetFile.iter_batches
+
+        def spy(pf, *args, **kwargs):
+            read.append(kwargs.get('row_groups'))
+            return iter_batches(pf, *args, **kwargs)
+
+        with mock.patch.object(pq.ParquetFile, 'iter_batches', spy):
+            df = backends.read_parquet(
+                path, downcast=True, filters=[[('play_id', '>=', 85)], [('play_id', '==', 3)]]
+            )
+            self.assertEqual(read, [[0, 8, 9]])
+            self.assertEqual(df.play_id.tolist(), [3] + list(range(85, 100)))
+            self.assertEqual(df.epa.dtype, 'float32')
+
+            empty = backends.read_parquet(path, downcast=True, filters=[('play_id', '<', 0)])
+            self.assertEqual(len(empty), 0)
+            self.assertEqual(empty.epa.dtype, 'float32')
+
+    def test_loaders_never_decode_float64(self):
+        decoded = []
+        read_parquet = backends.read_parquet
+
+        def spy(*args, **kwargs):
+            df = read_parquet(*args, **kwargs)
+            decoded.append(df.dtypes.tolist())
+            return df
+
+        with mock.patch.object(backends, 'read_parquet', spy):
+            df = nfl.import_pbp_data([2020, 2022])
+            self.assertEqual(df.epa.dtype, 'float32')
+            self.assertEqual(len(decoded), 3)
+            self.assertTrue(all('float64' not in dtypes for dtypes in decoded))
+
+            self.assertEqual(nfl.import_pbp_data([2022], downcast=False).epa.dtype, 'float64')
@@ -0,0 +1,89 @@
+from unittest import TestCase
+import tempfile
+import shutil
+import os
+
+import numpy as np
+import pandas as pd
+
+from nfl_data_py import player_ids
+
+
+def crosswalk():
+    return pd.DataFrame({
+        'gsis_id': ['00-0033873', '00-0034796', np.nan, '00-0036355', '00-0033873'],
+        'espn_id': [3139477.0, 3916387.0, 4361741.0, np.nan, 1.0],
+        'sleeper_id': ['4046', '4984', '7564', '7525', '9999'],
+        'name': ['Patrick Mahomes', 'Lamar Jackson', 'Some Rookie', 'Justin Herbert', 'Duplicate'],
+    })
+
+
+class test_id_index(TestCase):
+    def setUp(self):
+        self.index = player_ids.IdIndex(crosswalk())
+
+    def test_translates_between_systems(self):
+        espn = self.index.translate(
+            pd.Series(['00-0034796', '00-0033873', 'unknown', None], index=[5, 6, 7, 8]),
+            'gsis', 'espn',
+        )
+        self.assertEqual(espn.index.tolist(), [5, 6, 7, 8])
+        self.assertEqual(espn.tolist()[:2], [3916387.0, 3139477.0])
+        self.assertTrue(espn.iloc[2:].isna().all())
+
+    def test_numeric_and_string_ids_match(self):
+        gsis = self.index.translate([3139477, '4361741', 3916387.0, ' 3916387 '], 'espn_id', 'gsis_id')
+        self.assertEqual(gsis.tolist()[0], '00-0033873')
+        self.assertTrue(pd.isna(gsis.iloc[1]))
+        self.assertEqual(gsis.tolist()[2:], ['00-0034796'] * 2)
+
+    def test_lookup_rows(self):
+        rows = self.index.lookup(['4984', 'nope'], 'sleeper', columns=['name', 'gsis_id'])
+        self.assertEqual(rows.columns.tolist(), ['name', 'gsis_id'])
+        self.assertEqual(rows['name'].iloc[0], 'Lamar Jackson')
+        self.assertTrue(rows.iloc[1].isna().all())
+
+    def test_unmapped(self):
+        self.assertEqual(self.index.unmapped(['4046', 'x', 'x'], 'sleeper').tolist(), ['x'])
+        self.assertEqual(
+            sorted(self.index.unmapped(['4046', '7564', '7525'], 'sleeper', 'espn')),
+            ['7525'],
+        )
+
+    def test_duplicate_ids_map_to_first_row(self):
+        self.assertEqual(self.index.translate(['00-0033873'], 'gsis', 'name').tolist(), ['Patrick Mahomes'])
+
+    def test_unknown_system(self):
+        with self.assertRaises(ValueError):
+            self.index.translate(['1'], 'yahoo', 'gsis')
+
+    def test_empty_system(self):
+        index = player_ids.IdIndex(crosswalk().assign(yahoo_id=np.nan))
+        self.assertTrue(index.translate(['1'], 'yahoo', 'gsis').isna().all())
+
+
+class test_id_index_cache(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, 'db_playerids.csv')
+        crosswalk().to_csv(self.path, index=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_reuses_index_until_file_changes(self):
+        index = player_ids.id_index(self.path)
+        self.assertIs(player_ids.id_index(self.path), index)
+
+        with open(self.path, 'a') as f:
+            f.write('00-0039999,5000000,1234,New Player\n')
+        os.utime(self.path, ns=(0, 0))
+        updated = player_ids.id_index(self.path)
+        self.assertIsNot(updated, index)
+        self.assertEqual(updated.translate(['1234'], 'sleeper', 'gsis').tolist(), ['00-0039999'])
+
+    def test_save_and_load(self):
+        path = os.path.join(self.root, 'ids.parquet')
+        player_ids.id_index(self.path).save(path)
+        loaded = player_ids.IdIndex.load(path)
+        self.assertEqual(loaded.translate(['4984'], 'sleeper', 'gsis').tolist(), ['00-0034796'])
@@ -0,0 +1,50 @@
+from unittest import skipIf
+import os
+
+import pandas as pd
+
+import nfl_data_py as nfl
+from nfl_data_py.tests.pbp_test import pbp_server
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+@skipIf(pl is None, 'polars is not installed')
+class test_polars_backend(pbp_server):
+    @skipIf(pyarrow is None, 'polars needs pyarrow to convert to pandas')
+    def test_matches_pandas_result(self):
+        lf = nfl.import_pbp_data([2020, 2021, 2022], backend='polars')
+        self.assertIsInstance(lf, pl.LazyFrame)
+        pd.testing.assert_frame_equal(
+            lf.collect().to_pandas(), nfl.import_pbp_data([2020, 2021, 2022]), check_dtype=False
+        )
+
+    def test_plans_over_cached_files(self):
+        local = os.path.join(self.root, 'pbp')
+        nfl.cache_pbp([2020, 2021], alt_path=local)
+
+        lf = nfl.import_pbp_data(
+            [2020, 2021], columns=['epa'], filters=[('play_id', '>=', 3)],
+            cache=True, alt_path=local, backend='polars'
+        )
+        plan = lf.explain()
+        self.assertIn(os.path.join(local, 'season=2021', 'part.0.parquet'), plan)
+        self.assertEqual(lf.select(pl.len()).collect().item(), 2)
+        self.assertEqual(lf.collect()['season'].to_list(), [2020, 2020])
+
+    def test_plans_survive_cache_eviction(self):
+        lf = nfl.import_pbp_data([2020, 2021], backend='polars')
+        nfl.clear_cache()
+        self.assertEqual(lf.select(pl.len()).collect().item(), 8)
+
+    def test_only_heavy_loaders_are_lazy(self):
+        self.assertRaises(ValueError, nfl.import_depth_charts, [2020], backend='polars')
+        self.assertRaises(ValueError, next, nfl.iter_pbp_data([2020], backend='polars'))
@@ -0,0 +1,60 @@
+from unittest import mock
+
+import pandas as pd
+
+import nfl_data_py as nfl
+from nfl_data_py import backends
+from nfl_data_py.tests.upstream import upstream_server
+
+
+class test_column_projection(upstream_server):
+    def setUp(self):
+        super().setUp()
+        for year in (2020, 2021):
+            self.write(pd.DataFrame({
+                'gsis_id': ['a', None], 'full_name': ['A', 'B'], 'season': [year, year],
+                'week': [1, 1], 'team': ['KC', 'KC'], 'position': ['QB', 'WR'],
+                'birth_date': ['1995-10-01', '1996-01-01'],
+            }), 'rosters', year=year)
+            self.write(pd.DataFrame({
+                'season': [year], 'team': ['KC'], 'position': ['QB'], 'depth_team': ['1']
+            }), 'depth_charts', year=year)
+        self.write(pd.DataFrame({
+            'play_id': [1, 2], 'game_id': ['g', 'g'], 'old_game_id': ['1', '1'], 'epa': [0.1, 0.2]
+        }), 'pbp', year=2020)
+        self.write(pd.DataFrame({
+            'nflverse_game_id': ['g', 'g'], 'play_id': [1, 2],
+            'offense_formation': ['SHOTGUN', 'PISTOL'], 'offense_players': ['x', 'y'],
+        }), 'pbp_participation', year=2020)
+
+        self.reads = []
+        read_parquet = backends.read_parquet
+
+        def spy(source, backend='pandas', columns=None, **kwargs):
+            self.reads.append(columns)
+            return read_parquet(source, backend, columns, **kwargs)
+
+        patcher = mock.patch.object(backends, 'read_parquet', spy)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_pushes_columns_into_reader(self):
+        df = nfl.import_depth_charts([2020, 2021], columns=['team'])
+        self.assertEqual(df.columns.tolist(), ['team'])
+        self.assertEqual(self.reads, [['team'], ['team']])
+
+    def test_rosters_read_only_what_they_need(self):
+        df = nfl.import_seasonal_rosters([2020], columns=['player_name', 'birth_date'])
+        self.assertEqual(df.columns.tolist(), ['player_name', 'birth_date', 'age'])
+        self.assertEqual(df.player_name.tolist(), ['A'])
+        self.assertEqual(self.reads, [['full_name', 'birth_date', 'season', 'gsis_id']])
+
+    def test_projects_participation(self):
+        df = nfl.import_pbp_data([2020], columns=['epa', 'offense_formation'])
+        self.assertEqual(df.offense_formation.tolist(), ['SHOTGUN', 'PISTOL'])
+        self.assertNotIn('offense_players', df.columns)
+        self.assertNotIn('offense_formation', self.reads[0])
+
+    def test_rejects_invalid_columns(self):
+        self.assertRaises(ValueError, nfl.import_depth_charts, [2020], columns='team')
+        self.assertRaises(KeyError, nfl.import_depth_charts, [2020], columns=['nope'])
@@ -0,0 +1,111 @@
+"""
+Records the fixture store nfl_test.py replays
+
+nfl_test.py answers every request from the responses in tests/fixtures, so
+the suite runs offline. With network access, record the upstream files by
+running it through the record transport:
+
+    NFL_DATA_PY_TRANSPORT=record NFL_DATA_PY_FIXTURES=nfl_data_py/tests/fixtures \
+        python -m pytest nfl_data_py/tests/nfl_test.py
+
+Without it, this script records the same requests against the synthetic files
+of synthetic.py at a small scale, answered in place of the network. Only their
+shapes match upstream, so the tests checking upstream values skip themselves
+when the store is replayed:
+
+    python -m nfl_data_py.tests.record_fixtures
+"""
+import io
+import os
+import sys
+import shutil
+import hashlib
+import tempfile
+import http.client
+import urllib.request
+import urllib.response
+from urllib.error import HTTPError
+
+from nfl_data_py.tests.synthetic import write_fixtures
+
+STORE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+SEASONS = range(2018, 2025)
+SCALE = 0.001
+
+LAST_MODIFIED = 'Mon, 01 Jul 2024 00:00:00 GMT'
+
+
+def build():
+    """Synthetic upstream files at SCALE, by their upstream URL
+
+    Returns:
+        Dict mapping URL to bytes
+    """
+
+    from nfl_data_py import sources
+
+    root = tempfile.mkdtemp()
+    try:
+        files = {}
+        for rel in write_fixtures(root, SEASONS, SCALE):
+            name, path = rel.split('/', 1)
+            with open(os.path.join(root, name, *path.split('/')), 'rb') as f:
+                files[sources.BASES[name] + path] = f.read()
+        return files
+    finally:
+        shutil.rmtree(root)
+
+
+class Upstream(urllib.request.BaseHandler):
+    """Answers requests for the synthetic files in place of the network"""
+
+    handler_order = 100
+
+    def __init__(self, files):
+        self.files = files
+
+    def http_open(self, req):
+        url = req.full_url
+        body = self.files.get(url)
+        headers = http.client.HTTPMessage()
+        if body is None:
+            raise HTTPError(url, 404, 'Not Found', headers, None)
+
+        headers['Content-Length'] = str(len(body))
+        headers['ETag'] = '"' + hashlib.sha1(body).hexdigest() + '"'
+        headers['Last-Modified'] = LAST_MODIFIED
+        if req.get_method() == 'HEAD':
+            body = b''
+        resp = urllib.response.addinfourl(io.BytesIO(body), headers, url, 200)
+        resp.msg = 'OK'
+        return resp
+
+    https_open = http_open
+
+
+def record(store=STORE):
+    """Runs nfl_test.py through the record transport against the synthetic files"""
+
+    import pytest
+    import nfl_data_py as nfl
+
+    files = build()
+
+    shutil.rmtree(store, ignore_errors=True)
+    os.makedirs(store)
+    # nfl_test.py leaves the transport alone when the environment chooses one
+    os.environ.update(NFL_DATA_PY_TRANSPORT='record', NFL_DATA_PY_FIXTURES=store)
+    nfl.configure_transport('record', store)
+    urllib.request.install_opener(urllib.request.build_opener(Upstream(files)))
+    try:
+        return pytest.main([
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), 'nfl_test.py'),
+            '-q', '-p', 'no:cacheprovider',
+        ])
+    finally:
+        urllib.request.install_opener(None)
+
+
+if __name__ == '__main__':
+    sys.exit(record())
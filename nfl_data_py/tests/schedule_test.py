@@ -0,0 +1,56 @@
+from unittest import TestCase
+import tempfile
+import shutil
+import os
+
+import numpy as np
+import pandas as pd
+
+from nfl_data_py import schedule
+
+
+class test_gameday_index(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.path = os.path.join(self.root, 'games.csv')
+        pd.DataFrame({
+            'season': [2022, 2022, 2023],
+            'week': [1, 2, 1],
+            'gameday': ['2022-09-11', '2022-09-18', '2023-09-07'],
+            'home_team': ['KC', 'BUF', 'KC'],
+            'away_team': ['ARI', 'KC', 'DET'],
+            'stadium': ['A', 'B', 'A'],
+        }).to_csv(self.path, index=False)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_looks_up_home_and_away_games(self):
+        index = schedule.gameday_index(self.path)
+        dates = index.lookup(
+            [2022, 2022, 2023, 2023, 2022, 2022],
+            [1, 2.0, 1, 2, np.nan, 1],
+            ['ARI', 'KC', 'DET', 'KC', 'KC', None],
+        )
+        self.assertEqual(
+            pd.Series(dates).dt.strftime('%Y-%m-%d').tolist(),
+            ['2022-09-11', '2022-09-18', '2023-09-07', np.nan, np.nan, np.nan]
+        )
+
+    def test_reuses_index_until_file_changes(self):
+        index = schedule.gameday_index(self.path)
+        self.assertIs(schedule.gameday_index(self.path), index)
+
+        with open(self.path, 'a') as f:
+            f.write('2023,2,2023-09-14,KC,JAX,A\n')
+        os.utime(self.path, ns=(0, 0))
+        updated = schedule.gameday_index(self.path)
+        self.assertIsNot(updated, index)
+        self.assertEqual(str(updated.lookup([2023], [2], ['JAX'])[0])[:10], '2023-09-14')
+
+
+class test_season_age(TestCase):
+    def test_age_on_september_first(self):
+        birth = pd.to_datetime(pd.Series(['1995-08-31', '1995-09-01', '1995-12-01', None]))
+        age = schedule.season_age(pd.Series([2020] * 4, dtype='int32'), birth)
+        np.testing.assert_array_equal(age, [25, 24, 24, np.nan])
@@ -0,0 +1,111 @@
+from unittest import TestCase
+import tempfile
+import shutil
+import os
+
+import numpy as np
+import pandas as pd
+
+import nfl_data_py as nfl
+from nfl_data_py.seasonal import SeasonalAggregates
+
+
+def weekly_stats():
+    rows = [
+        # player, team, season, week, type, attempts, targets, receiving_yards, receiving_tds
+        ('qb', 'KC', 2022, 1, 'REG', 30, 0, 0.0, 0),
+        ('wr', 'KC', 2022, 1, 'REG', 0, 10, 100.0, 1),
+        ('qb', 'KC', 2022, 2, 'REG', 20, 0, 0.0, 0),
+        ('wr', 'KC', 2022, 2, 'REG', 0, 5, 50.0, 0),
+        ('wr', 'KC', 2022, 19, 'POST', 0, 5, np.nan, 1),
+        ('qb', 'KC', 2022, 19, 'POST', 10, 0, 0.0, 0),
+        ('wr', 'KC', 2021, 1, 'REG', 0, 4, 40.0, 0),
+        ('qb', 'KC', 2021, 1, 'REG', 8, 0, 0.0, 0),
+    ]
+    df = pd.DataFrame(rows, columns=[
+        'player_id', 'recent_team', 'season', 'week', 'season_type', 'attempts', 'targets',
+        'receiving_yards', 'receiving_tds'
+    ])
+    df['player_name'] = df['player_id'].str.upper()
+    df['passing_yards'] = np.where(df.player_id == 'qb', df.attempts * 10.0, 0.0)
+    df['passing_tds'] = np.where(df.player_id == 'qb', 1, 0)
+    for col in ('completions', 'passing_air_yards', 'passing_yards_after_catch', 'passing_first_downs',
+                'fantasy_points_ppr', 'receiving_air_yards', 'receiving_yards_after_catch',
+                'receiving_first_downs'):
+        df[col] = 1.0
+    return df
+
+
+class test_seasonal_data(TestCase):
+    def test_sums_and_shares(self):
+        df = nfl.import_seasonal_data([2022], weekly=weekly_stats())
+
+        self.assertEqual(df.player_id.tolist(), ['qb', 'wr'])
+        self.assertEqual(df.season_type.tolist(), ['REG', 'REG'])
+        wr = df.iloc[1]
+        self.assertEqual(wr.games, 2)
+        self.assertEqual(wr.targets, 15)
+        self.assertAlmostEqual(wr.tgt_sh, 15 / 50)
+        self.assertAlmostEqual(wr.ry_sh, 150 / 500)
+        self.assertAlmostEqual(wr.rtd_sh, 1 / 2)
+        self.assertAlmostEqual(wr.dom, (150 / 500 + 1 / 2) / 2)
+        self.assertAlmostEqual(wr.wopr, 15 / 50 * 1.5 + 2 / 4 * 0.8)
+        self.assertAlmostEqual(wr.yptmpa, 150 / 50)
+
+    def test_all_season_types_share_season_metrics(self):
+        df = nfl.import_seasonal_data([2021, 2022], s_type='ALL', weekly=weekly_stats())
+
+        self.assertEqual(
+            list(zip(df.player_id, df.season, df.season_type)),
+            [('qb', 2021, 'REG'), ('qb', 2022, 'POST'), ('qb', 2022, 'REG'),
+             ('wr', 2021, 'REG'), ('wr', 2022, 'POST'), ('wr', 2022, 'REG')]
+        )
+        wr = df[(df.player_id == 'wr') & (df.season == 2022)]
+        self.assertEqual(wr.games.tolist(), [3, 3])
+        self.assertEqual(wr.receiving_yards.tolist(), [0.0, 150.0])
+        np.testing.assert_allclose(wr.tgt_sh, [20 / 60] * 2)
+        self.assertEqual(df.columns[-12:].tolist(), [
+            'tgt_sh', 'ay_sh', 'yac_sh', 'wopr', 'ry_sh', 'rtd_sh', 'rfd_sh', 'rtdfd_sh', 'dom',
+            'w8dom', 'yptmpa', 'ppr_sh'
+        ])
+        self.assertNotIn('week', df.columns)
+        self.assertNotIn('atts', df.columns)
+
+
+class test_seasonal_aggregates(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_applies_only_new_games(self):
+        weekly = weekly_stats()
+        state = os.path.join(self.root, 'state')
+
+        first = weekly[weekly.week == 1]
+        nfl.import_seasonal_data([2021, 2022], s_type='ALL', weekly=first, state=state)
+
+        aggregates = SeasonalAggregates.load(state)
+        self.assertEqual(len(aggregates.games), 2)
+        self.assertEqual(aggregates.update(weekly), 4)
+        self.assertEqual(aggregates.update(weekly), 0)
+
+        for s_type in ('REG', 'ALL', 'POST'):
+            pd.testing.assert_frame_equal(
+                aggregates.result([2022], s_type),
+                nfl.import_seasonal_data([2022], s_type, weekly=weekly)
+            )
+
+    def test_saved_state_round_trips(self):
+        aggregates = SeasonalAggregates()
+        aggregates.update(weekly_stats())
+        aggregates.save(self.root)
+        aggregates.save(self.root)
+
+        loaded = SeasonalAggregates.load(self.root)
+        pd.testing.assert_frame_equal(loaded.sums, aggregates.sums)
+        self.assertEqual(
+            sorted(os.listdir(self.root)), ['games-2.parquet', 'state.json', 'sums-2.parquet']
+        )
+        self.assertIsNone(SeasonalAggregates.load(os.path.join(self.root, 'none')).sums)
@@ -0,0 +1,494 @@
+"""
+Synthetic nflverse-shaped files for the offline benchmarks and test fixtures
+
+write_fixtures() lays files out the way a mirror does, <root>/<base name>/<path>,
+so a local HTTP server over root can stand in for every upstream source through
+configure_sources(mirror=...). Each dataset gets the column names, dtypes,
+cardinalities and row counts of its nflverse release (pbp: 372 columns and
+about 50k plays a season), filled with random values. Only the shapes are
+realistic, the numbers are noise.
+
+benchmarks/run.py serves them at full scale, record_fixtures.py records the
+fixture store of nfl_test.py from a small scale.
+"""
+import os
+import json
+
+import numpy
+import pandas
+
+from nfl_data_py import sources
+
+TEAMS = [
+    'ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB',
+    'HOU', 'IND', 'JAX', 'KC', 'LA', 'LAC', 'LV', 'MIA', 'MIN', 'NE', 'NO', 'NYG',
+    'NYJ', 'PHI', 'PIT', 'SEA', 'SF', 'TB', 'TEN', 'WAS',
+]
+POSITIONS = ['QB', 'RB', 'WR', 'TE', 'OL', 'DL', 'LB', 'DB', 'K', 'P']
+PLAYERS = 4000
+GAMES_PER_WEEK = 16
+
+# rows per season of each dataset at scale 1
+ROWS = {
+    'pbp': 50_000,
+    'player_stats': 5_600,
+    'rosters': 3_100,
+    'weekly_rosters': 46_000,
+    'depth_charts': 37_000,
+    'injuries': 6_000,
+    'snap_counts': 26_000,
+    'ftn_charting': 48_000,
+    'nextgen_stats': 600,
+    'pfr_season': 500,
+    'pfr_week': 3_000,
+    'qbr': 40,
+    'officials': 1_900,
+    'draft_picks': 260,
+    'combine': 330,
+    'contracts': 1_800,
+    'sc_lines': 1_100,
+    'win_totals': 5_000,
+    'players': 20_000,
+}
+
+# first season held by the datasets published as one file of all seasons
+FIRST_SEASON = {
+    'nextgen_stats': 2016,
+    'pfr_season': 2018,
+    'qbr': 2006,
+    'officials': 2015,
+    'draft_picks': 1980,
+    'combine': 2000,
+    'contracts': 2000,
+    'sc_lines': 2006,
+    'win_totals': 2006,
+}
+
+# participation is published from 2016 through 2023
+PARTICIPATION_SEASONS = range(2016, 2024)
+
+# named columns of play-by-play, the rest of the 372 are generic stats
+PBP_COLUMNS = {
+    'play_id': 'float', 'game_id': 'game', 'old_game_id': 'old_game', 'home_team': 'team',
+    'away_team': 'team', 'season_type': 'season_type', 'week': 'week', 'posteam': 'team',
+    'posteam_type': ['home', 'away'], 'defteam': 'team', 'side_of_field': 'team',
+    'yardline_100': 'float', 'game_date': 'date', 'quarter_seconds_remaining': 'float',
+    'half_seconds_remaining': 'float', 'game_seconds_remaining': 'float', 'game_half': ['Half1', 'Half2'],
+    'drive': 'float', 'qtr': 'float', 'down': 'float', 'goal_to_go': 'float', 'time': 'clock',
+    'yrdln': 'text', 'ydstogo': 'float', 'ydsnet': 'float', 'desc': 'text',
+    'play_type': ['pass', 'run', 'punt', 'kickoff', 'field_goal', 'no_play', 'extra_point'],
+    'yards_gained': 'float', 'shotgun': 'float', 'no_huddle': 'float', 'qb_dropback': 'float',
+    'pass_length': ['short', 'deep'], 'pass_location': ['left', 'middle', 'right'],
+    'air_yards': 'float', 'yards_after_catch': 'float', 'run_location': ['left', 'middle', 'right'],
+    'run_gap': ['end', 'guard', 'tackle'], 'field_goal_result': ['made', 'missed', 'blocked'],
+    'ep': 'float', 'epa': 'float', 'wp': 'float', 'wpa': 'float', 'cpoe': 'float',
+    'passer_player_id': 'player', 'passer_player_name': 'name', 'receiver_player_id': 'player',
+    'receiver_player_name': 'name', 'rusher_player_id': 'player', 'rusher_player_name': 'name',
+    'stadium': 'text', 'weather': 'text', 'nfl_api_id': 'text', 'play_clock': 'text',
+    'roof': ['outdoors', 'dome', 'closed', 'open'], 'surface': ['grass', 'fieldturf'],
+    'home_coach': 'name', 'away_coach': 'name', 'stadium_id': 'text', 'game_stadium': 'text',
+}
+PBP_WIDTH = 372
+
+PARTICIPATION_COLUMNS = {
+    'nflverse_game_id': 'game', 'old_game_id': 'old_game', 'play_id': 'float',
+    'possession_team': 'team', 'offense_formation': ['SHOTGUN', 'SINGLEBACK', 'EMPTY', 'I_FORM'],
+    'offense_personnel': ['1 RB, 1 TE, 3 WR', '1 RB, 2 TE, 2 WR'], 'defenders_in_box': 'float',
+    'defense_personnel': ['4 DL, 2 LB, 5 DB', '3 DL, 3 LB, 5 DB'], 'number_of_pass_rushers': 'float',
+    'players_on_play': 'lineup', 'offense_players': 'lineup', 'defense_players': 'lineup',
+    'n_offense': 'float', 'n_defense': 'float', 'ngs_air_yards': 'float',
+    'time_to_throw': 'float', 'was_pressure': 'float', 'route': ['GO', 'SLANT', 'OUT', 'HITCH'],
+    'defense_man_zone_type': ['MAN_COVERAGE', 'ZONE_COVERAGE'],
+    'defense_coverage_type': ['COVER_1', 'COVER_2', 'COVER_3'],
+}
+
+PLAYER_STATS_COLUMNS = {
+    'player_id': 'player', 'player_name': 'name', 'player_display_name': 'name',
+    'position': 'position', 'position_group': 'position', 'headshot_url': 'text',
+    'recent_team': 'team', 'season': 'season', 'week': 'week', 'season_type': 'season_type',
+    'opponent_team': 'team', 'completions': 'int', 'attempts': 'int', 'passing_yards': 'float',
+    'passing_tds': 'int', 'interceptions': 'float', 'sacks': 'float', 'sack_yards': 'float',
+    'sack_fumbles': 'int', 'sack_fumbles_lost': 'int', 'passing_air_yards': 'float',
+    'passing_yards_after_catch': 'float', 'passing_first_downs': 'float', 'passing_epa': 'float',
+    'passing_2pt_conversions': 'int', 'pacr': 'float', 'dakota': 'float', 'carries': 'int',
+    'rushing_yards': 'float', 'rushing_tds': 'int', 'rushing_fumbles': 'float',
+    'rushing_fumbles_lost': 'float', 'rushing_first_downs': 'float', 'rushing_epa': 'float',
+    'rushing_2pt_conversions': 'int', 'receptions': 'int', 'targets': 'int',
+    'receiving_yards': 'float', 'receiving_tds': 'int', 'receiving_fumbles': 'float',
+    'receiving_fumbles_lost': 'float', 'receiving_air_yards': 'float',
+    'receiving_yards_after_catch': 'float', 'receiving_first_downs': 'float',
+    'receiving_epa': 'float', 'receiving_2pt_conversions': 'int', 'racr': 'float',
+    'target_share': 'float', 'air_yards_share': 'float', 'wopr': 'float',
+    'special_teams_tds': 'float', 'fantasy_points': 'float', 'fantasy_points_ppr': 'float',
+}
+
+ROSTER_COLUMNS = {
+    'season': 'season', 'team': 'team', 'position': 'position', 'depth_chart_position': 'position',
+    'jersey_number': 'float', 'status': ['ACT', 'RES', 'INA'], 'full_name': 'name',
+    'first_name': 'name', 'last_name': 'name', 'birth_date': 'birth_date', 'height': 'float',
+    'weight': 'float', 'college': 'text', 'gsis_id': 'player', 'espn_id': 'text',
+    'sportradar_id': 'text', 'yahoo_id': 'text', 'rotowire_id': 'text', 'pff_id': 'text',
+    'pfr_id': 'text', 'fantasy_data_id': 'text', 'sleeper_id': 'text', 'years_exp': 'float',
+    'headshot_url': 'text', 'ngs_position': 'position', 'week': 'week', 'game_type': 'season_type',
+    'status_description_abbr': ['A01', 'R01', 'P01'], 'football_name': 'name', 'esb_id': 'text',
+    'gsis_it_id': 'text', 'smart_id': 'text', 'entry_year': 'season', 'rookie_year': 'season',
+    'draft_club': 'team', 'draft_number': 'float',
+}
+
+GENERIC_COLUMNS = {
+    'season': 'season', 'week': 'week', 'game_type': 'season_type', 'team': 'team',
+    'club_code': 'team', 'gsis_id': 'player', 'full_name': 'name', 'position': 'position',
+    'depth_team': ['1', '2', '3'], 'formation': ['Offense', 'Defense', 'Special Teams'],
+    'report_status': ['Out', 'Questionable', 'Doubtful', None], 'report_primary_injury': 'text',
+    'practice_status': 'text', 'date_modified': 'date', 'offense_snaps': 'float',
+    'offense_pct': 'float', 'defense_snaps': 'float', 'defense_pct': 'float', 'st_snaps': 'float',
+    'st_pct': 'float', 'game_id': 'game', 'pfr_game_id': 'text', 'opponent': 'team',
+}
+
+FTN_COLUMNS = {
+    'ftn_game_id': 'float', 'nflverse_game_id': 'game', 'season': 'season', 'week': 'week',
+    'ftn_play_id': 'float', 'nflverse_play_id': 'float', 'starting_hash': ['L', 'M', 'R'],
+    'qb_location': ['S', 'U', 'P'], 'n_offense_backfield': 'float', 'n_defense_box': 'float',
+    'is_no_huddle': 'bool', 'is_motion': 'bool', 'is_play_action': 'bool',
+    'is_screen_pass': 'bool', 'is_rpo': 'bool', 'is_trick_play': 'bool',
+    'is_qb_out_of_pocket': 'bool', 'is_interception_worthy': 'bool', 'is_throw_away': 'bool',
+    'read_thrown': ['1', '2', 'CHECKDOWN'], 'is_catchable_ball': 'bool',
+    'is_contested_ball': 'bool', 'is_created_reception': 'bool', 'is_drop': 'bool',
+    'is_qb_sneak': 'bool', 'n_blitzers': 'float', 'n_pass_rushers': 'float',
+    'is_qb_fault_sack': 'bool', 'date_pulled': 'date',
+}
+
+NGS_COLUMNS = {
+    'season': 'season', 'season_type': 'season_type', 'week': 'week',
+    'player_display_name': 'name', 'player_position': 'position', 'team_abbr': 'team',
+    'player_gsis_id': 'player', 'player_first_name': 'name', 'player_last_name': 'name',
+    'player_short_name': 'name', 'player_jersey_number': 'int', 'avg_time_to_throw': 'float',
+    'avg_completed_air_yards': 'float', 'avg_intended_air_yards': 'float',
+    'avg_air_yards_differential': 'float', 'aggressiveness': 'float',
+    'max_completed_air_distance': 'float', 'avg_air_yards_to_sticks': 'float', 'attempts': 'int',
+    'pass_yards': 'int', 'pass_touchdowns': 'int', 'interceptions': 'int', 'passer_rating': 'float',
+    'completions': 'int', 'completion_percentage': 'float',
+    'expected_completion_percentage': 'float',
+    'completion_percentage_above_expectation': 'float', 'avg_air_distance': 'float',
+    'max_air_distance': 'float',
+}
+
+PFR_SEASON_COLUMNS = {
+    'player': 'name', 'team': 'team', 'season': 'season', 'pfr_id': 'text',
+    'pass_attempts': 'float', 'throwaways': 'float', 'spikes': 'float', 'drops': 'float',
+    'drop_pct': 'float', 'bad_throws': 'float', 'bad_throw_pct': 'float', 'pocket_time': 'float',
+    'times_blitzed': 'float', 'times_hurried': 'float', 'times_hit': 'float',
+    'times_pressured': 'float', 'pressure_pct': 'float', 'batted_balls': 'float',
+    'on_tgt_throws': 'float', 'on_tgt_pct': 'float', 'rpo_plays': 'float', 'rpo_yards': 'float',
+    'rpo_pass_att': 'float', 'rpo_pass_yards': 'float', 'rpo_rush_att': 'float',
+    'rpo_rush_yards': 'float', 'pa_pass_att': 'float', 'pa_pass_yards': 'float',
+}
+
+PFR_WEEK_COLUMNS = {
+    'game_id': 'game', 'pfr_game_id': 'text', 'season': 'season', 'week': 'week',
+    'game_type': 'season_type', 'team': 'team', 'opponent': 'team', 'pfr_player_name': 'name',
+    'pfr_player_id': 'text', 'passing_drops': 'float', 'passing_drop_pct': 'float',
+    'receiving_drop': 'float', 'receiving_drop_pct': 'float', 'passing_bad_throws': 'float',
+    'passing_bad_throw_pct': 'float', 'times_sacked': 'float', 'times_blitzed': 'float',
+    'times_hurried': 'float', 'times_hit': 'float', 'times_pressured': 'float',
+    'times_pressured_pct': 'float', 'def_times_blitzed': 'float', 'def_times_hurried': 'float',
+    'def_times_hitqb': 'float',
+}
+
+QBR_COLUMNS = {
+    'season': 'season', 'season_type': ['Regular', 'Playoffs'], 'game_week': ['Season Total'],
+    'team_abb': 'team', 'player_id': 'float', 'name_short': 'name', 'rank': 'float',
+    'qbr_total': 'float', 'pts_added': 'float', 'qb_plays': 'float', 'epa_total': 'float',
+    'pass': 'float', 'run': 'float', 'exp_sack': 'float', 'penalty': 'float', 'qbr_raw': 'float',
+    'sack': 'float', 'name_first': 'name', 'name_last': 'name', 'name_display': 'name',
+    'headshot_href': 'text', 'team': 'name', 'qualified': 'bool',
+}
+
+OFFICIALS_COLUMNS = {
+    'game_id': 'game', 'game_key': 'float', 'official_name': 'name',
+    'position': ['Referee', 'Umpire', 'Down Judge', 'Line Judge', 'Field Judge', 'Side Judge', 'Back Judge'],
+    'jersey_number': 'int', 'official_id': 'int', 'season': 'season', 'season_type': 'season_type',
+    'week': 'week',
+}
+
+DRAFT_PICK_COLUMNS = {
+    'season': 'season', 'round': 'int', 'pick': 'int', 'team': 'team', 'gsis_id': 'player',
+    'pfr_player_id': 'text', 'cfb_player_id': 'text', 'pfr_player_name': 'name', 'hof': 'bool',
+    'position': 'position', 'category': 'position', 'side': ['O', 'D', 'S'], 'college': 'text',
+    'age': 'float', 'to': 'float', 'allpro': 'float', 'probowls': 'float',
+    'seasons_started': 'float', 'w_av': 'float', 'car_av': 'float', 'dr_av': 'float',
+    'games': 'float', 'pass_completions': 'float', 'pass_attempts': 'float', 'pass_yards': 'float',
+    'pass_tds': 'float', 'pass_ints': 'float', 'rush_atts': 'float', 'rush_yards': 'float',
+    'rush_tds': 'float', 'receptions': 'float', 'rec_yards': 'float', 'rec_tds': 'float',
+    'def_solo_tackles': 'float', 'def_ints': 'float', 'def_sacks': 'float',
+}
+
+DRAFT_VALUE_COLUMNS = {
+    'pick': 'int', 'stuart': 'float', 'johnson': 'float', 'hill': 'float', 'otc': 'float',
+    'pff': 'float',
+}
+
+COMBINE_COLUMNS = {
+    'season': 'season', 'draft_year': 'season', 'draft_team': 'team', 'draft_round': 'float',
+    'draft_ovr': 'float', 'pfr_id': 'text', 'cfb_id': 'text', 'player_name': 'name',
+    'pos': 'position', 'school': 'text', 'ht': ['5-11', '6-0', '6-2', '6-4'], 'wt': 'float',
+    'forty': 'float', 'bench': 'float', 'vertical': 'float', 'broad_jump': 'float',
+    'cone': 'float', 'shuttle': 'float',
+}
+
+CONTRACT_COLUMNS = {
+    'player': 'name', 'position': 'position', 'team': 'team', 'is_active': 'bool',
+    'year_signed': 'season', 'years': 'float', 'value': 'float', 'apy': 'float',
+    'guaranteed': 'float', 'apy_cap_pct': 'float', 'inflated_value': 'float',
+    'inflated_apy': 'float', 'inflated_guaranteed': 'float', 'player_page': 'text',
+    'otc_id': 'float', 'gsis_id': 'player', 'date_of_birth': 'birth_date',
+    'height': ['5-11', '6-0', '6-2', '6-4'], 'weight': 'float', 'college': 'text',
+    'draft_year': 'season', 'draft_round': 'float', 'draft_overall': 'float', 'draft_team': 'team',
+}
+
+TEAM_COLUMNS = {
+    'team_abbr': 'team', 'team_name': 'name', 'team_id': 'int', 'team_nick': 'name',
+    'team_conf': ['AFC', 'NFC'], 'team_division': ['AFC East', 'AFC North', 'NFC East', 'NFC North'],
+    'team_color': 'text', 'team_color2': 'text', 'team_color3': 'text', 'team_color4': 'text',
+    'team_logo_wikipedia': 'text', 'team_logo_espn': 'text', 'team_wordmark': 'text',
+    'team_conference_logo': 'text', 'team_league_logo': 'text', 'team_logo_squared': 'text',
+}
+
+SC_LINES_COLUMNS = {
+    'season': 'season', 'week': 'week', 'away_team': 'team', 'home_team': 'team',
+    'game_id': 'game', 'side': ['home', 'away'], 'line': 'float',
+}
+
+WIN_TOTALS_COLUMNS = {
+    'game_id': 'game', 'market_type': ['spread', 'total', 'moneyline'], 'abbr': 'team',
+    'lines': 'float', 'odds': 'float', 'opening_lines': 'float', 'opening_odds': 'float',
+    'book': ['consensus', 'pinnacle'], 'season_type': 'season_type', 'week': 'week',
+    'date': 'date',
+}
+
+SCHEDULE_COLUMNS = [
+    'game_id', 'season', 'game_type', 'week', 'gameday', 'weekday', 'gametime', 'away_team',
+    'away_score', 'home_team', 'home_score', 'location', 'result', 'total', 'overtime',
+    'old_game_id', 'gsis', 'nfl_detail_id', 'pfr', 'pff', 'espn', 'ftn', 'away_rest',
+    'home_rest', 'away_moneyline', 'home_moneyline', 'spread_line', 'away_spread_odds',
+    'home_spread_odds', 'total_line', 'under_odds', 'over_odds', 'div_game', 'roof',
+    'surface', 'temp', 'wind', 'away_qb_id', 'home_qb_id', 'away_qb_name', 'home_qb_name',
+    'away_coach', 'home_coach', 'referee', 'stadium_id', 'stadium',
+]
+
+ID_SYSTEMS = [
+    'mfl', 'sportradar', 'fantasypros', 'gsis', 'pff', 'sleeper', 'nfl', 'espn', 'yahoo',
+    'fleaflicker', 'cbs', 'pfr', 'cfbref', 'rotowire', 'rotoworld', 'ktc', 'stats',
+    'stats_global', 'fantasy_data', 'swish', 'prf',
+]
+
+
+def write_fixtures(root, years, scale=1.0, seed=0):
+    """Writes synthetic files of every benchmarked dataset under root
+
+    Files already written for the same years, scale and seed are kept.
+
+    Returns:
+        Dict mapping each written file (relative to root) to its size
+    """
+
+    spec = {'years': list(years), 'scale': scale, 'seed': seed}
+    index = os.path.join(root, 'fixtures.json')
+    try:
+        with open(index) as f:
+            written = json.load(f)
+        if written['spec'] == spec:
+            return written['files']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    rng = numpy.random.default_rng(seed)
+    n_players = max(int(PLAYERS * scale), 1)
+    players = numpy.array([f'00-00{i:05d}' for i in range(n_players)], dtype=object)
+    per_week = max(int(GAMES_PER_WEEK * scale), 1)
+    files = {}
+
+    def write(dataset, df, **params):
+        name, rel = sources.split(dataset, **params)
+        path = os.path.join(root, name, *rel.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if path.endswith('.parquet'):
+            df.to_parquet(path, index=False)
+        else:
+            # mtime 0 keeps gzipped files the same from one run to the next
+            df.to_csv(path, index=False, compression={'method': 'infer', 'mtime': 0})
+        files[f'{name}/{rel}'] = os.path.getsize(path)
+
+    def rows(dataset):
+        # enough for every position to appear at small scales
+        return max(int(ROWS[dataset] * scale), len(POSITIONS))
+
+    def history(dataset, columns):
+        # one file holding every season since the dataset's first
+        return pandas.concat([
+            __frame(rng, columns, rows(dataset), year, players, __games(rng, year, per_week))
+            for year in range(FIRST_SEASON[dataset], max(years) + 1)
+        ], ignore_index=True)
+
+    for year in years:
+        games = __games(rng, year, per_week)
+        pbp_columns = dict(PBP_COLUMNS)
+        for i in range(PBP_WIDTH - len(pbp_columns)):
+            pbp_columns[f'stat_{i}'] = 'float' if i % 3 else 'int'
+        pbp = __frame(rng, pbp_columns, rows('pbp'), year, players, games)
+        pbp['play_id'] = numpy.arange(len(pbp), dtype=numpy.float64)
+        write('pbp', pbp, year=year)
+
+        if year in PARTICIPATION_SEASONS:
+            partic = __frame(rng, PARTICIPATION_COLUMNS, len(pbp), year, players, games)
+            partic['nflverse_game_id'] = pbp['game_id']
+            partic['old_game_id'] = pbp['old_game_id']
+            partic['play_id'] = pbp['play_id']
+            write('pbp_participation', partic, year=year)
+
+        write('player_stats', __frame(rng, PLAYER_STATS_COLUMNS, rows('player_stats'), year, players, games), year=year)
+        write('rosters', __frame(rng, ROSTER_COLUMNS, rows('rosters'), year, players, games), year=year)
+        write('weekly_rosters', __frame(rng, ROSTER_COLUMNS, rows('weekly_rosters'), year, players, games), year=year)
+        for dataset in ('depth_charts', 'injuries', 'snap_counts'):
+            write(dataset, __frame(rng, GENERIC_COLUMNS, rows(dataset), year, players, games), year=year)
+        if year >= 2022:
+            write('ftn_charting', __frame(rng, FTN_COLUMNS, rows('ftn_charting'), year, players, games), year=year)
+        if year >= 2018:
+            for s_type in ('pass', 'rec', 'rush', 'def'):
+                write('pfr_week', __frame(rng, PFR_WEEK_COLUMNS, rows('pfr_week'), year, players, games),
+                      s_type=s_type, year=year)
+
+    schedules = pandas.concat([__schedule(rng, year, per_week) for year in range(1999, max(years) + 1)])
+    write('schedules', schedules)
+
+    ids = pandas.DataFrame({f'{system}_id': __ids(rng, system, n_players) for system in ID_SYSTEMS})
+    ids['gsis_id'] = players
+    for col, kind in (('name', 'name'), ('merge_name', 'name'), ('position', 'position'),
+                      ('team', 'team'), ('birthdate', 'birth_date'), ('college', 'text')):
+        ids[col] = __column(rng, kind, n_players, max(years), players, None)
+    ids['db_season'] = max(years)
+    write('ids', ids)
+
+    player_cols = {**ROSTER_COLUMNS, 'display_name': 'name', 'status': ['ACT', 'RET', 'CUT']}
+    write('players', __frame(rng, player_cols, rows('players'), max(years), players, __games(rng, max(years), per_week)))
+
+    for stat_type in ('passing', 'rushing', 'receiving'):
+        write('nextgen_stats', history('nextgen_stats', NGS_COLUMNS), stat_type=stat_type)
+    for s_type in ('pass', 'rec', 'rush', 'def'):
+        write('pfr_season', history('pfr_season', PFR_SEASON_COLUMNS), s_type=s_type)
+    write('qbr', history('qbr', QBR_COLUMNS), level='nfl', frequency='season')
+    write('officials', history('officials', OFFICIALS_COLUMNS))
+    write('draft_picks', history('draft_picks', DRAFT_PICK_COLUMNS))
+    write('combine', history('combine', COMBINE_COLUMNS))
+    write('contracts', history('contracts', CONTRACT_COLUMNS))
+    write('sc_lines', history('sc_lines', SC_LINES_COLUMNS))
+    write('win_totals', history('win_totals', WIN_TOTALS_COLUMNS))
+
+    values = __frame(rng, DRAFT_VALUE_COLUMNS, 262, max(years), players, None)
+    values['pick'] = numpy.arange(1, 263)
+    write('draft_values', values)
+
+    teams = __frame(rng, TEAM_COLUMNS, len(TEAMS), max(years), players, None)
+    teams['team_abbr'] = TEAMS
+    write('teams', teams)
+
+    os.makedirs(root, exist_ok=True)
+    with open(index, 'w') as f:
+        json.dump({'spec': spec, 'files': files}, f)
+
+    return files
+
+
+def __games(rng, year, per_week):
+    weeks = numpy.repeat(numpy.arange(1, 19), per_week)
+    home = rng.choice(TEAMS, len(weeks))
+    away = rng.choice(TEAMS, len(weeks))
+    return numpy.array(
+        [f'{year}_{w:02d}_{a}_{h}' for w, a, h in zip(weeks, away, home)], dtype=object
+    )
+
+
+def __schedule(rng, year, per_week):
+    games = __games(rng, year, per_week)
+    n = len(games)
+    df = pandas.DataFrame({col: rng.normal(size=n).round(1) for col in SCHEDULE_COLUMNS})
+    parts = pandas.Series(games).str.split('_', expand=True)
+    df['game_id'] = games
+    df['season'] = year
+    df['week'] = parts[1].astype(int).to_numpy()
+    df['away_team'] = parts[2].to_numpy()
+    df['home_team'] = parts[3].to_numpy()
+    df['game_type'] = 'REG'
+    df['gameday'] = (
+        pandas.Timestamp(f'{year}-09-07') + pandas.to_timedelta((df['week'] - 1) * 7, unit='D')
+    ).dt.strftime('%Y-%m-%d')
+    for col in ('weekday', 'gametime', 'location', 'roof', 'surface', 'referee', 'stadium',
+                'away_qb_name', 'home_qb_name', 'away_coach', 'home_coach', 'stadium_id'):
+        df[col] = __names(rng, n)
+    return df
+
+
+def __frame(rng, columns, n, year, players, games):
+    data = {}
+    for col, kind in columns.items():
+        data[col] = __column(rng, kind, n, year, players, games)
+    return pandas.DataFrame(data)
+
+
+def __column(rng, kind, n, year, players, games):
+    if isinstance(kind, list):
+        return rng.choice(numpy.array(kind, dtype=object), n)
+    if kind == 'float':
+        values = rng.normal(size=n).round(3)
+        values[rng.random(n) < 0.1] = numpy.nan
+        return values
+    if kind == 'int':
+        return rng.integers(0, 20, n, dtype=numpy.int32)
+    if kind == 'bool':
+        return rng.random(n) < 0.2
+    if kind == 'season':
+        return numpy.full(n, year, dtype=numpy.int32)
+    if kind == 'week':
+        return rng.integers(1, 19, n, dtype=numpy.int32)
+    if kind == 'season_type':
+        return rng.choice(numpy.array(['REG', 'POST'], dtype=object), n, p=[0.95, 0.05])
+    if kind == 'team':
+        return rng.choice(numpy.array(TEAMS, dtype=object), n)
+    if kind == 'position':
+        return numpy.resize(rng.permutation(numpy.array(POSITIONS, dtype=object)), n)
+    if kind == 'player':
+        return rng.choice(players, n)
+    if kind == 'game':
+        return numpy.sort(rng.choice(games, n))
+    if kind == 'old_game':
+        return numpy.array([str(year * 1000000 + i // 150) for i in range(n)], dtype=object)
+    if kind == 'lineup':
+        picks = rng.choice(players, (n, 11))
+        return numpy.array([';'.join(p) for p in picks], dtype=object)
+    if kind == 'date':
+        return numpy.full(n, f'{year}-09-10', dtype=object)
+    if kind == 'birth_date':
+        days = rng.integers(0, 365 * 15, n)
+        return (pandas.Timestamp('1985-01-01') + pandas.to_timedelta(days, unit='D')).strftime('%Y-%m-%d')
+    if kind == 'clock':
+        return numpy.array([f'{m:02d}:{s:02d}' for m, s in zip(rng.integers(0, 15, n), rng.integers(0, 60, n))], dtype=object)
+    if kind == 'name':
+        return __names(rng, n)
+    if kind == 'text':
+        # mostly distinct free text, like play descriptions
+        return numpy.array([f'text {v:x}' for v in rng.integers(0, 2**40, n)], dtype=object)
+    raise ValueError(f'Unknown column kind {kind}.')
+
+
+def __names(rng, n):
+    first = numpy.array(['Patrick', 'Josh', 'Lamar', 'Justin', 'Travis', 'Tyreek', 'Davante'], dtype=object)
+    last = numpy.array(['Mahomes', 'Allen', 'Jackson', 'Jefferson', 'Kelce', 'Hill', 'Adams'], dtype=object)
+    return rng.choice(first, n) + ' ' + rng.choice(last, n)
+
+
+def __ids(rng, system, n):
+    if system in ('espn', 'sleeper', 'yahoo', 'mfl', 'nfl', 'cbs', 'fleaflicker', 'stats'):
+        values = rng.integers(1000, 5_000_000, n).astype(numpy.float64)
+        values[rng.random(n) < 0.2] = numpy.nan
+        return values
+    return numpy.array([f'{system}{v:x}' for v in rng.integers(0, 2**32, n)], dtype=object)
@@ -0,0 +1,102 @@
+from unittest import skipIf
+from urllib.error import HTTPError, URLError
+import urllib.response
+import asyncio
+import io
+import os
+
+import pandas as pd
+
+import nfl_data_py as nfl
+from nfl_data_py import cache, sources, transport
+from nfl_data_py.tests.upstream import upstream_server
+
+try:
+    from nfl_data_py import aio
+except ImportError:
+    aio = None
+
+
+class test_transport(upstream_server):
+    def setUp(self):
+        super().setUp()
+        self.saved = nfl.transport_info()
+        for year in (2020, 2021):
+            self.write(pd.DataFrame({
+                'player_id': ['a', 'b'], 'season': [year, year], 'value': [1.0, 2.0]
+            }), 'player_stats', year=year)
+        self.store = os.path.join(self.root, 'fixtures')
+
+    def tearDown(self):
+        nfl.configure_transport(self.saved['mode'], self.saved['path'] or False)
+        super().tearDown()
+
+    def record(self, years=(2020, 2021)):
+        nfl.configure_transport('record', self.store)
+        data = nfl.import_weekly_data(list(years), downcast=False)
+        self.server.shutdown()
+        nfl.configure_transport('replay')
+        return data
+
+    def test_replay_matches_recording(self):
+        live = self.record()
+        nfl.configure_cache(enabled=False)
+        replayed = nfl.import_weekly_data([2020, 2021], downcast=False)
+        pd.testing.assert_frame_equal(live, replayed)
+        self.assertEqual(len(transport.recorded()), 2)
+
+    def test_replay_answers_conditional_requests(self):
+        self.record()
+        url = sources.url('player_stats', year=2020)
+        nfl.configure_cache(path=os.path.join(self.root, 'replay-cache'), ttl=0)
+        first = cache.fetch(url, 'player_stats')
+        self.assertEqual(cache.fetch(url, 'player_stats'), first)
+
+        fingerprint = cache.remote_fingerprint(url)
+        self.assertIsNotNone(fingerprint['last_modified'])
+
+    def test_replays_errors_and_refuses_unrecorded_urls(self):
+        nfl.configure_transport('record', self.store)
+        missing = sources.url('player_stats', year=2030)
+        with self.assertRaises(HTTPError):
+            cache.fetch(missing)
+        nfl.configure_transport('replay')
+
+        with self.assertRaises(HTTPError) as caught:
+            cache.fetch(missing)
+        self.assertEqual(caught.exception.code, 404)
+        with self.assertRaises(URLError):
+            cache.fetch(sources.url('player_stats', year=2031))
+
+    def test_recording_bypasses_fresh_cached_copies(self):
+        url = sources.url('player_stats', year=2020)
+        cache.fetch(url, 'player_stats')
+        nfl.configure_transport('record', self.store)
+        cache.fetch(url, 'player_stats')
+        self.assertIn(url, transport.recorded())
+
+    def test_custom_transport(self):
+        calls = []
+
+        def fake(url, headers, method):
+            calls.append((url, method))
+            body = io.BytesIO(b'game_id,referee\n2020_01_A_B,X\n')
+            return urllib.response.addinfourl(body, {}, url, 200)
+
+        nfl.configure_transport(fake)
+        nfl.configure_cache(enabled=False)
+        self.assertEqual(len(nfl.import_officials()), 1)
+        self.assertEqual(calls, [(sources.url('officials'), 'GET')])
+
+    def test_rejects_bad_configuration(self):
+        with self.assertRaises(ValueError):
+            nfl.configure_transport('offline')
+        with self.assertRaises(ValueError):
+            nfl.configure_transport('replay')
+
+    @skipIf(aio is None, 'httpx is not installed')
+    def test_aio_replays_through_transport(self):
+        live = self.record()
+        nfl.configure_cache(enabled=False)
+        replayed = asyncio.run(aio.import_weekly_data([2020, 2021], downcast=False))
+        pd.testing.assert_frame_equal(live, replayed)
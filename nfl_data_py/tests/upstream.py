@@ -0,0 +1,82 @@
+"""
+Local stand-in for the upstream sources, shared by the tests
+
+upstream_server serves a directory laid out like a source mirror over HTTP and
+points configure_sources(mirror=...) at it, with the download cache in a
+temporary directory, so loaders run offline through their public configuration.
+"""
+from unittest import TestCase
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+import threading
+import tempfile
+import shutil
+import os
+
+import nfl_data_py as nfl
+from nfl_data_py import sources
+
+
+class upstream_server(TestCase):
+    """Base for tests loading files they write with self.write() in setUp
+
+    Attributes:
+        root (str): temporary directory removed after each test
+        files (str): directory served as the mirror
+        requests (List[dict]): headers of every GET the server answered
+        mirror (str): URL of the served directory
+    """
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.files = os.path.join(self.root, 'files')
+        os.makedirs(self.files)
+        self.server, self.requests = serve(self.files)
+        self.mirror = f'http://127.0.0.1:{self.server.server_port}/'
+        nfl.configure_sources(mirror=self.mirror)
+        nfl.configure_cache(path=os.path.join(self.root, 'cache'))
+
+    def tearDown(self):
+        self.server.shutdown()
+        nfl.configure_sources(mirror=False)
+        nfl.configure_cache(enabled=True, path=False, ttl=False)
+        shutil.rmtree(self.root)
+
+    def path(self, dataset, **params):
+        """Local file served as one file of a dataset"""
+
+        name, path = sources.split(dataset, **params)
+        local = os.path.join(self.files, name, *path.split('/'))
+        os.makedirs(os.path.dirname(local), exist_ok=True)
+        return local
+
+    def write(self, df, dataset, **params):
+        """Serves df as one file of a dataset, in the format of its URL
+
+        Returns:
+            str path of the written file
+        """
+
+        path = self.path(dataset, **params)
+        if path.endswith('.parquet'):
+            df.to_parquet(path)
+        else:
+            df.to_csv(path, index=False)
+        return path
+
+
+def serve(directory):
+    """Serve directory over local HTTP, recording the headers of each request"""
+    requests = []
+
+    class Handler(SimpleHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(dict(self.headers))
+            super().do_GET()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), partial(Handler, directory=directory))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, requests
@@ -0,0 +1,219 @@
+"""
+HTTP transport shared by the nfl_data_py loaders
+
+Every request the loaders, the download cache, sync_mirror and the async API
+make goes through request(), which hands it to the configured transport:
+
+    live     urllib, the default
+    record   urllib, saving every response to a fixture store on disk
+    replay   the fixture store only, never touching the network
+
+A store holds one <key>.json (url, status, headers) and one <key>.body per
+URL. Recording always downloads the full body, so a store answers conditional
+requests and HEADs in replay as well. Record a store once with network access,
+then replay it to run code or tests offline:
+
+    NFL_DATA_PY_TRANSPORT=record NFL_DATA_PY_FIXTURES=fixtures python -m pytest
+    NFL_DATA_PY_TRANSPORT=replay NFL_DATA_PY_FIXTURES=fixtures python -m pytest
+
+The environment variables are read on import, configure_transport() changes
+the transport at runtime.
+"""
+import os
+import io
+import json
+import shutil
+import hashlib
+import tempfile
+import threading
+import http.client
+import urllib.request
+import urllib.response
+from urllib.error import HTTPError, URLError
+
+MODES = ('live', 'record', 'replay')
+
+_CHUNK = 1024 * 1024
+
+_config = {'mode': 'live', 'path': None}
+_lock = threading.Lock()
+
+
+def configure_transport(mode=None, path=None):
+    """Choose how import functions make their HTTP requests
+
+    Args:
+        mode (str or callable): 'live', 'record' or 'replay', or a callable
+            taking (url, headers, method) and returning a response like
+            urllib.request.urlopen does
+        path (str): fixture store directory, required to record or replay,
+            False clears it
+    """
+
+    with _lock:
+        if mode is not None and not callable(mode) and mode not in MODES:
+            raise ValueError(f'Unknown transport {mode}, use one of {", ".join(MODES)} or a callable.')
+        mode = _config['mode'] if mode is None else mode
+        if path is False:
+            path = None
+        elif path is None:
+            path = _config['path']
+        else:
+            path = os.fspath(path)
+        if mode in ('record', 'replay') and not path:
+            raise ValueError(f'The {mode} transport needs a fixture store path.')
+        _config.update(mode=mode, path=path)
+
+
+def transport_info():
+    """Current transport
+
+    Returns:
+        Dict with mode (str or callable) and path (str or None)
+    """
+
+    with _lock:
+        return dict(_config)
+
+
+def is_live():
+    """True when requests go to the network unrecorded"""
+
+    return _config['mode'] == 'live'
+
+
+def recording():
+    """True when responses are saved to a fixture store"""
+
+    return _config['mode'] == 'record'
+
+
+def request(url, headers=None, method='GET'):
+    """Makes one request through the configured transport
+
+    Args:
+        url (str): location of the file
+        headers (Dict[str, str]): request headers, e.g. conditional ones
+        method (str): 'GET' or 'HEAD'
+    Returns:
+        File-like response with the body, headers and status
+    Raises:
+        HTTPError: for error statuses and 304 Not Modified, like urllib
+        URLError: when the network fails, or nothing is recorded for url
+    """
+
+    with _lock:
+        mode, path = _config['mode'], _config['path']
+
+    if callable(mode):
+        return mode(url, headers or {}, method)
+    if mode == 'record':
+        __record(path, url, method)
+    if mode in ('record', 'replay'):
+        return __replay(path, url, headers or {}, method)
+
+    req = urllib.request.Request(url, headers=headers or {}, method=method)
+    return urllib.request.urlopen(req)
+
+
+def recorded(path=None):
+    """URLs held in a fixture store
+
+    Returns:
+        Dict mapping each url to its recorded status
+    """
+
+    root = path or _config['path']
+    if not root or not os.path.isdir(root):
+        return {}
+
+    out = {}
+    for name in os.listdir(root):
+        if name.endswith('.json'):
+            with open(os.path.join(root, name)) as f:
+                meta = json.load(f)
+            out[meta['url']] = meta['status']
+    return out
+
+
+def __key(root, url):
+    return os.path.join(root, hashlib.sha256(url.encode('utf-8')).hexdigest())
+
+
+def __record(root, url, method):
+    key = __key(root, url)
+    if method == 'HEAD' and os.path.exists(key + '.json'):
+        # a recorded GET already holds the headers a HEAD answers with
+        return
+
+    req = urllib.request.Request(url, method=method)
+    try:
+        resp = urllib.request.urlopen(req)
+    except HTTPError as e:
+        __write_meta(key, url, e.code, e.headers)
+        return
+
+    os.makedirs(root, exist_ok=True)
+    with resp:
+        if method == 'GET':
+            fd, tmp = tempfile.mkstemp(dir=root, suffix='.part')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    shutil.copyfileobj(resp, f, _CHUNK)
+                os.replace(tmp, key + '.body')
+            except BaseException:
+                os.remove(tmp)
+                raise
+        __write_meta(key, url, resp.status, resp.headers)
+
+
+def __write_meta(key, url, status, headers):
+    meta = {'url': url, 'status': status, 'headers': list((headers or {}).items())}
+    os.makedirs(os.path.dirname(key), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(key), suffix='.part')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(meta, f)
+    os.replace(tmp, key + '.json')
+
+
+def __replay(root, url, headers, method):
+    key = __key(root, url)
+    try:
+        with open(key + '.json') as f:
+            meta = json.load(f)
+    except FileNotFoundError:
+        raise URLError(f'no recorded response for {url} in {root}')
+
+    recorded_headers = http.client.HTTPMessage()
+    for name, value in meta['headers']:
+        recorded_headers[name] = value
+
+    status = meta['status']
+    if status >= 400:
+        raise HTTPError(url, status, http.client.responses.get(status, ''), recorded_headers, None)
+
+    sent = {name.lower(): value for name, value in headers.items()}
+    etag, modified = recorded_headers.get('ETag'), recorded_headers.get('Last-Modified')
+    if (etag and sent.get('if-none-match') == etag) or (
+        modified and 'if-none-match' not in sent and sent.get('if-modified-since') == modified
+    ):
+        raise HTTPError(url, 304, 'Not Modified', recorded_headers, None)
+
+    if method == 'HEAD':
+        return urllib.response.addinfourl(io.BytesIO(), recorded_headers, url, status)
+
+    try:
+        body = open(key + '.body', 'rb')
+    except FileNotFoundError:
+        raise URLError(f'no recorded body for {url} in {root}')
+    return urllib.response.addinfourl(body, recorded_headers, url, status)
+
+
+def __from_environment():
+    mode = os.environ.get('NFL_DATA_PY_TRANSPORT')
+    path = os.environ.get('NFL_DATA_PY_FIXTURES')
+    if mode or path:
+        configure_transport(mode or None, path or None)
+
+
+__from_environment()